@@ -66,19 +66,19 @@ class BoxGeneratorApp(QtWidgets.QMainWindow):
         self.length_input = QtWidgets.QDoubleSpinBox()
         self.length_input.setRange(0.1, 1000)
         self.length_input.setValue(10)
-        self.length_input.valueChanged.connect(self.update_box)
+        self.length_input.valueChanged.connect(self.schedule_update)
         dimension_layout.addRow("Length:", self.length_input)
         
         self.width_input = QtWidgets.QDoubleSpinBox()
         self.width_input.setRange(0.1, 1000)
         self.width_input.setValue(10)
-        self.width_input.valueChanged.connect(self.update_box)
+        self.width_input.valueChanged.connect(self.schedule_update)
         dimension_layout.addRow("Width:", self.width_input)
         
         self.height_input = QtWidgets.QDoubleSpinBox()
         self.height_input.setRange(0.1, 1000)
         self.height_input.setValue(10)
-        self.height_input.valueChanged.connect(self.update_box)
+        self.height_input.valueChanged.connect(self.schedule_update)
         dimension_layout.addRow("Height:", self.height_input)
         
         dimension_group.setLayout(dimension_layout)
@@ -112,6 +112,16 @@ class BoxGeneratorApp(QtWidgets.QMainWindow):
         # Add controls to main layout
         layout.addWidget(controls_panel)
         
+        # Coalesce rapid spin box changes into at most one rebuild per display frame
+        self.update_timer = QtCore.QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(16)
+        self.update_timer.timeout.connect(self.update_box)
+        
+        # Last exported mesh, reused while the box shape and deviation are unchanged
+        self.stl_cache_key = None
+        self.stl_cache_mesh = None
+        
         # Create box
         self.box = None
         self.update_box()
@@ -119,23 +129,31 @@ class BoxGeneratorApp(QtWidgets.QMainWindow):
         # Show the window
         self.show()
 
+    def schedule_update(self):
+        """Queue a box update; further changes before the timer fires are folded into it."""
+        if not self.update_timer.isActive():
+            self.update_timer.start()
+
     def update_box(self):
+        self.update_timer.stop()
         length = self.length_input.value()
         width = self.width_input.value()
         height = self.height_input.value()
         
-        # Remove existing box if it exists
-        if self.box:
-            self.doc.removeObject(self.box.Name)
+        # Create the box once, then edit it in place
+        changed = False
+        if self.box is None:
+            self.box = self.doc.addObject("Part::Box", "Box")
+            changed = True
         
-        # Create new box
-        self.box = self.doc.addObject("Part::Box", "Box")
-        self.box.Length = length
-        self.box.Width = width
-        self.box.Height = height
+        for prop, value in (("Length", length), ("Width", width), ("Height", height)):
+            if getattr(self.box, prop).Value != value:
+                setattr(self.box, prop, value)
+                changed = True
         
-        # Recompute
-        self.doc.recompute()
+        # Recompute only if a dimension actually changed
+        if changed:
+            self.doc.recompute()
 
     def export_stl(self):
         try:
@@ -147,10 +165,19 @@ class BoxGeneratorApp(QtWidgets.QMainWindow):
             self.status_label.setText("Exporting...")
             QtWidgets.QApplication.processEvents()
             
-            # Create mesh and export
+            # Apply any dimension change still waiting on the update timer
+            if self.update_timer.isActive():
+                self.update_box()
+            
+            # Create mesh and export, re-tessellating only if the box changed
             shape = self.box.Shape
-            mesh = Mesh.Mesh()
-            mesh.addFacets(shape.tessellate(mesh_deviation))
+            cache_key = (shape.hashCode(), mesh_deviation)
+            if cache_key != self.stl_cache_key:
+                mesh = Mesh.Mesh()
+                mesh.addFacets(shape.tessellate(mesh_deviation))
+                self.stl_cache_key = cache_key
+                self.stl_cache_mesh = mesh
+            mesh = self.stl_cache_mesh
             stl_name = f"box_{length}x{width}x{height}.stl"
             mesh.write(stl_name)
             
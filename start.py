@@ -1,10 +1,18 @@
 #!/bin/bash
 
 import os
+import shutil
 import subprocess
+import tempfile
 import time
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test'))
+from readiness import READY_FILE_ENV, START_TIME_ENV, wait_for_ready
+
+# Longest wait for FreeCAD to start listening before giving up
+READY_TIMEOUT = 120
+
 def main():
     # Get the absolute path to the test directory
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -25,20 +33,34 @@ def main():
     # Command to start the hand tracking client
     client_cmd = [freecad_python, 'hand_tracking_client.py']
     
+    # The app writes this file once its server is listening
+    ready_dir = tempfile.mkdtemp(prefix="handtracking-")
+    ready_file = os.path.join(ready_dir, "ready")
+    env = dict(os.environ)
+    env[READY_FILE_ENV] = ready_file
+    env[START_TIME_ENV] = repr(time.time())
+    start = time.monotonic()
+
     try:
         # Change to test directory
         os.chdir(test_dir)
         print("Starting FreeCAD application...")
         
         # Start FreeCAD app in a new process
-        freecad_process = subprocess.Popen(main_cmd)
+        freecad_process = subprocess.Popen(main_cmd, env=env)
         
-        # Wait a bit for FreeCAD to initialize
-        time.sleep(3)
+        # Wait until FreeCAD is listening for the client
+        if wait_for_ready(ready_file, READY_TIMEOUT, freecad_process) is None:
+            if freecad_process.poll() is not None:
+                print(f"FreeCAD exited with code {freecad_process.returncode} before it was ready")
+                sys.exit(1)
+            print(f"FreeCAD not ready after {READY_TIMEOUT} s, starting the client anyway")
+        else:
+            print(f"FreeCAD ready after {time.monotonic() - start:.2f} s")
         
         print("Starting hand tracking client...")
         # Start hand tracking client
-        client_process = subprocess.Popen(client_cmd)
+        client_process = subprocess.Popen(client_cmd, env=env)
         
         # Wait for processes to complete
         freecad_process.wait()
@@ -54,6 +76,8 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        shutil.rmtree(ready_dir, ignore_errors=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
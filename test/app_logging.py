@@ -0,0 +1,84 @@
+# Contains the logging setup shared by the FreeCAD app and the hand tracking client
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+
+# HANDTRACKING_LOG_LEVEL=DEBUG shows the per-frame and per-message messages
+LEVEL_ENV = "HANDTRACKING_LOG_LEVEL"
+FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets through at most one record per `interval` seconds from each logging call site.
+
+    Errors (`max_level` and above) always pass. The next record that passes from
+    a site says how many were dropped since the last one.
+    """
+
+    def __init__(self, interval=1.0, max_level=logging.ERROR):
+        super().__init__()
+        self.interval = interval
+        self.max_level = max_level
+        self._sites = {}  # (path, line) -> [time of last record let through, records dropped since]
+
+    def filter(self, record):
+        if record.levelno >= self.max_level or self.interval <= 0:
+            return True
+        now = time.monotonic()
+        site = self._sites.get((record.pathname, record.lineno))
+        if site is None:
+            self._sites[(record.pathname, record.lineno)] = [now, 0]
+            return True
+        if now - site[0] < self.interval:
+            site[1] += 1
+            return False
+        if site[1]:
+            record.msg = f"{record.msg} ({site[1]} similar suppressed)"
+        site[0], site[1] = now, 0
+        return True
+
+
+class _RawQueueHandler(logging.handlers.QueueHandler):
+    """Queues records as they are, leaving the message and traceback formatting to the listener.
+
+    QueueHandler.prepare() formats the record in the logging thread so it can be
+    pickled; records here stay in the process. The arguments are formatted when the
+    listener writes the record, so a mutable argument shows its value at that time.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+_listener = None
+
+
+def setup_logging(level=None, rate_limit=1.0, stream=None):
+    """Send all logging through a queue to a background thread that writes to stream.
+
+    Callers only pay for the level check, the rate limit and a queue put; merging the
+    message arguments, formatting tracebacks and console I/O happen on the listener
+    thread. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+    level = level or os.environ.get(LEVEL_ENV, "INFO").upper()
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(logging.Formatter(FORMAT, "%H:%M:%S"))
+    records = queue.SimpleQueue()
+    handler = _RawQueueHandler(records)
+    handler.addFilter(RateLimitFilter(rate_limit))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(handler)
+    _listener = logging.handlers.QueueListener(records, output)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
@@ -0,0 +1 @@
+# Benchmark scripts. Run them from the test directory, e.g. `python -m benchmarks.bench_batch`
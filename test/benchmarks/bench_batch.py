@@ -0,0 +1,73 @@
+# benchmarks/bench_batch.py
+# Compares one-command-at-a-time processing with CommandProcessor.process_many and run_script.
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+from commands import CommandProcessor
+
+
+def make_script(count):
+    """Build a script of `count` commands mixing primitives, selection and moves."""
+    commands = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            commands.append(f"box {10 + i % 7} {5 + i % 3} {8 + i % 5}")
+        elif kind == 1:
+            commands.append(f"sphere {3 + i % 4}")
+        elif kind == 2:
+            commands.append(f"cylinder {2 + i % 3} {10 + i % 6}")
+        else:
+            commands.append("move 1 0 0")
+    return commands
+
+
+def run_sequential(commands):
+    doc = FreeCAD.newDocument("BenchSequential")
+    processor = CommandProcessor(doc)
+    start = time.perf_counter()
+    for command in commands:
+        processor.process(command)
+    elapsed = time.perf_counter() - start
+    FreeCAD.closeDocument(doc.Name)
+    return elapsed
+
+
+def run_batched(commands):
+    doc = FreeCAD.newDocument("BenchBatched")
+    processor = CommandProcessor(doc)
+    start = time.perf_counter()
+    processor.process_many(commands)
+    elapsed = time.perf_counter() - start
+    FreeCAD.closeDocument(doc.Name)
+    return elapsed
+
+
+def run_script(commands):
+    """Time a script run, including parsing, validation and the timing report."""
+    doc = FreeCAD.newDocument("BenchScript")
+    processor = CommandProcessor(doc)
+    text = "\n".join(commands)
+    start = time.perf_counter()
+    processor.run_script(text)
+    elapsed = time.perf_counter() - start
+    FreeCAD.closeDocument(doc.Name)
+    return elapsed
+
+
+def main(sizes=(100, 300, 1000, 3000)):
+    print(f"{'commands':>10} {'sequential (s)':>16} {'batched (s)':>12} {'script (s)':>11} {'speedup':>8}")
+    for size in sizes:
+        commands = make_script(size)
+        sequential = run_sequential(commands)
+        batched = run_batched(commands)
+        scripted = run_script(commands)
+        print(f"{size:>10} {sequential:>16.3f} {batched:>12.3f} {scripted:>11.3f} "
+              f"{sequential / scripted:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_box_update.py
+# Replays a spin-box drag against the old rebuild-per-change update and the
+# in-place update coalesced to one recompute per display frame (see main.py).
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+
+FRAME_INTERVAL = 0.016  # Matches BoxGeneratorApp.update_timer
+
+
+def make_drag(changes, change_interval):
+    """Timestamped length values as produced by holding a spin-box arrow."""
+    return [(i * change_interval, 10 + 0.1 * i) for i in range(changes)]
+
+
+def run_rebuild(drag):
+    """Previous behavior: remove, re-add and recompute the box on every change."""
+    doc = FreeCAD.newDocument("BenchRebuild")
+    box = None
+    created = 0
+    start = time.perf_counter()
+    for _, length in drag:
+        if box:
+            doc.removeObject(box.Name)
+        box = doc.addObject("Part::Box", "Box")
+        created += 1
+        box.Length = length
+        box.Width = 10
+        box.Height = 10
+        doc.recompute()
+    elapsed = time.perf_counter() - start
+    FreeCAD.closeDocument(doc.Name)
+    return elapsed, created, len(drag)
+
+
+def run_in_place(drag):
+    """New behavior: edit the existing box, recomputing at most once per frame."""
+    doc = FreeCAD.newDocument("BenchInPlace")
+    box = doc.addObject("Part::Box", "Box")
+    doc.recompute()
+    recomputes = 0
+    frame_end = None
+    pending = None
+    start = time.perf_counter()
+    for timestamp, length in drag:
+        if frame_end is not None and timestamp >= frame_end:
+            box.Length = pending
+            doc.recompute()
+            recomputes += 1
+            frame_end = None
+        if frame_end is None:
+            frame_end = timestamp + FRAME_INTERVAL
+        pending = length
+    if frame_end is not None:
+        box.Length = pending
+        doc.recompute()
+        recomputes += 1
+    elapsed = time.perf_counter() - start
+    FreeCAD.closeDocument(doc.Name)
+    return elapsed, 1, recomputes
+
+
+def main(changes=500, change_interval=0.004):
+    drag = make_drag(changes, change_interval)
+    print(f"{changes} value changes, one every {change_interval * 1000:.0f} ms")
+    print(f"{'strategy':>10} {'time (ms)':>10} {'objects created':>16} {'recomputes':>11}")
+    for label, runner in (("rebuild", run_rebuild), ("in place", run_in_place)):
+        elapsed, created, recomputes = runner(drag)
+        print(f"{label:>10} {elapsed * 1000:>10.1f} {created:>16} {recomputes:>11}")
+
+
+if __name__ == "__main__":
+    main()
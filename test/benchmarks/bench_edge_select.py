@@ -0,0 +1,63 @@
+# benchmarks/bench_edge_select.py
+# Compares the edge-picking workload (edge count, edge lookup, classification,
+# bounding box) read straight from obj.Shape against the GeometryCache.
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+import Part
+from geometry_cache import GeometryCache, classify_edge
+
+
+def build_complex_object(doc, holes):
+    """A plate drilled with `holes` cylinders, which gives it several edges per hole."""
+    plate = Part.makeBox(holes * 10 + 10, 40, 5)
+    cutters = [Part.makeCylinder(3, 5, FreeCAD.Vector(10 + i * 10, 20, 0)) for i in range(holes)]
+    obj = doc.addObject("Part::Feature", f"Plate_{holes}")
+    obj.Shape = plate.cut(Part.makeCompound(cutters))
+    doc.recompute()
+    return obj
+
+
+def uncached_pick(obj, edge_num):
+    """What _select_edge and _rotate_object did before: several obj.Shape reads per call."""
+    total = len(obj.Shape.Edges)
+    edge = obj.Shape.Edges[edge_num - 1]
+    classify_edge(edge)
+    obj.Shape.BoundBox.Center
+    return total
+
+
+def cached_pick(cache, obj, edge_num):
+    geometry = cache.get(obj)
+    total = len(geometry.edges)
+    geometry.edge_info(edge_num - 1)
+    geometry.bound_box.Center
+    return total
+
+
+def main(hole_counts=(10, 50, 200), picks=200):
+    doc = FreeCAD.newDocument("BenchEdgeSelect")
+    print(f"{'edges':>7} {'uncached (ms/pick)':>19} {'cached (ms/pick)':>17}")
+    for holes in hole_counts:
+        obj = build_complex_object(doc, holes)
+        total = len(obj.Shape.Edges)
+        cache = GeometryCache()
+
+        start = time.perf_counter()
+        for i in range(picks):
+            uncached_pick(obj, i % total + 1)
+        uncached = (time.perf_counter() - start) / picks
+
+        start = time.perf_counter()
+        for i in range(picks):
+            cached_pick(cache, obj, i % total + 1)
+        cached = (time.perf_counter() - start) / picks
+        print(f"{total:>7} {uncached * 1e3:>19.3f} {cached * 1e3:>17.3f}")
+    FreeCAD.closeDocument(doc.Name)
+
+
+if __name__ == "__main__":
+    main()
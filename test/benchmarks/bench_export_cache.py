@@ -0,0 +1,66 @@
+# benchmarks/bench_export_cache.py
+# Times cold, warm and one-object-changed exports through the TessellationCache,
+# next to the cost of only writing the STL. Uses the app's own STL writer, so it
+# also runs under FREECAD_BACKEND=standin.
+import os
+import tempfile
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+from mesh_io import write_binary_stl
+from tessellation import TessellationCache
+
+DEVIATION = 0.05
+
+
+def build_scene(count):
+    """Create `count` curved objects, which are the expensive ones to tessellate."""
+    doc = FreeCAD.newDocument("BenchExportCache")
+    for i in range(count):
+        if i % 2:
+            obj = doc.addObject("Part::Sphere", f"Sphere_{i}")
+            obj.Radius = 5
+        else:
+            obj = doc.addObject("Part::Cylinder", f"Cylinder_{i}")
+            obj.Radius = 4
+            obj.Height = 12
+        obj.Placement = FreeCAD.Placement(FreeCAD.Vector((i % 20) * 15, (i // 20) * 15, 0), FreeCAD.Rotation())
+    doc.recompute()
+    return doc
+
+
+def export(objects, cache, path):
+    parts = [cache.get(obj.Name, obj.Shape, DEVIATION) for obj in objects]
+    write_binary_stl(path, parts)
+    return parts
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(sizes=(50, 200, 500)):
+    path = os.path.join(tempfile.gettempdir(), "bench_export_cache.stl")
+    print(f"{'objects':>8} {'cold (s)':>9} {'warm (s)':>9} {'1 changed (s)':>14} {'write only (s)':>15}")
+    for size in sizes:
+        doc = build_scene(size)
+        objects = doc.Objects
+        cache = TessellationCache()
+        cold = timed(export, objects, cache, path)
+        warm = timed(export, objects, cache, path)
+        objects[0].Radius = float(objects[0].Radius) + 1
+        doc.recompute()
+        changed = timed(export, objects, cache, path)
+        write_only = timed(write_binary_stl, path, export(objects, cache, path))
+        FreeCAD.closeDocument(doc.Name)
+        print(f"{size:>8} {cold:>9.3f} {warm:>9.3f} {changed:>14.3f} {write_only:>15.3f}")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# benchmarks/bench_export_quality.py
+# Checks how well estimate_facets predicts the real facet count across quality
+# settings and object sizes, and what the estimate costs next to tessellating.
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+from tessellation import estimate_facets, object_deviation, relative_tolerance
+
+
+def build_scene():
+    doc = FreeCAD.newDocument("BenchExportQuality")
+    for i, size in enumerate((1, 10, 100, 1000)):
+        sphere = doc.addObject("Part::Sphere", f"Sphere_{i}")
+        sphere.Radius = size
+        cylinder = doc.addObject("Part::Cylinder", f"Cylinder_{i}")
+        cylinder.Radius = size / 2
+        cylinder.Height = size * 2
+        box = doc.addObject("Part::Box", f"Box_{i}")
+        box.Length = box.Width = box.Height = size
+    doc.recompute()
+    return doc
+
+
+def main(qualities=(10, 100, 300, 1000)):
+    doc = build_scene()
+    print(f"{'quality':>8} {'estimated':>10} {'actual':>10} {'error':>7} {'estimate (s)':>13} {'tessellate (s)':>15}")
+    for quality in qualities:
+        tolerance = relative_tolerance(quality)
+        estimated = actual = 0
+        estimate_time = tessellate_time = 0.0
+        for obj in doc.Objects:
+            deviation = object_deviation(obj.Shape, tolerance)
+            start = time.perf_counter()
+            estimated += estimate_facets(obj.Shape, deviation)
+            estimate_time += time.perf_counter() - start
+            start = time.perf_counter()
+            actual += len(obj.Shape.copy().tessellate(deviation)[1])
+            tessellate_time += time.perf_counter() - start
+        error = (estimated - actual) / actual
+        print(f"{quality:>8} {estimated:>10} {actual:>10} {error:>6.0%} {estimate_time:>13.3f} {tessellate_time:>15.3f}")
+    FreeCAD.closeDocument(doc.Name)
+
+
+if __name__ == "__main__":
+    main()
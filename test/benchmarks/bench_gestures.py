@@ -0,0 +1,179 @@
+# benchmarks/bench_gestures.py
+# Nanoseconds per frame for each gesture detector and for the whole per-frame gesture
+# pass, on synthetic landmark sequences (see synthetic_hands.py). --json saves the
+# results; pass --compare with an earlier file to print the change per detector.
+# Needs no FreeCAD: GestureCameraController is only timed when FreeCAD or the
+# stand-in is available.
+#
+#   python -m benchmarks.bench_gestures --json before.json
+#   python -m benchmarks.bench_gestures --json after.json --compare before.json
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+
+from benchmarks.synthetic_hands import POSES, circle_path, drift_path, sequence
+from hand_tracking_client import HandGestureDetector, format_coordinates
+
+try:
+    from gesture_control import GestureCameraController
+except (ImportError, EnvironmentError):
+    GestureCameraController = None  # gesture_control imports FreeCAD
+
+FRAME_SHAPE = (480, 640, 3)
+
+
+def make_datasets(frames, noise, seed):
+    """Name -> list of SyntheticHand: one held pose each, plus a mixed sequence with transitions."""
+    datasets = {pose: sequence([pose], hold_frames=frames, noise=noise, seed=seed) for pose in POSES}
+    cycles = max(1, frames // (len(POSES) * 38))
+    datasets["mixed"] = sequence(list(POSES) * cycles, hold_frames=30, transition_frames=8,
+                                 path=circle_path(), noise=noise, seed=seed)
+    datasets["fist_drag"] = sequence(["open", "fist", "open"], hold_frames=frames // 3,
+                                     path=drift_path(), noise=noise, seed=seed)
+    return datasets
+
+
+def client_detectors():
+    """Name -> (setup, per-frame call) for HandGestureDetector, as HandTrackingClient uses it."""
+    detector = HandGestureDetector()
+    detector.MIN_SEND_INTERVAL = 0  # Measure the full pass on every frame
+
+    def palm_setup():
+        detector.is_fist = True
+        detector.initial_fist_position = None
+
+    def gesture_pass(hand):
+        # The detector work of HandTrackingClient.process_frame, without capture and I/O
+        format_coordinates(hand, FRAME_SHAPE)
+        detector.detect_peace_sign(hand)
+        detector.is_fist = detector.detect_fist(hand)
+        detector.is_pointing = detector.detect_pointing(hand)
+        detector.detect_pinch(hand)
+        detector.detect_pointing(hand)
+        if detector.is_fist and detector.can_send_update():
+            detector.calculate_palm_orientation(hand, 0.0)
+
+    def reset():
+        detector.is_fist = False
+        detector.initial_fist_position = None
+
+    return {
+        "detect_fist": (None, detector.detect_fist),
+        "detect_pinch": (None, detector.detect_pinch),
+        "detect_peace_sign": (None, detector.detect_peace_sign),
+        "detect_pointing": (None, detector.detect_pointing),
+        "calculate_palm_orientation": (palm_setup, lambda hand: detector.calculate_palm_orientation(hand, 0.0)),
+        "format_coordinates": (None, lambda hand: format_coordinates(hand, FRAME_SHAPE)),
+        "client_pass": (reset, gesture_pass),
+    }
+
+
+def controller_detectors():
+    if GestureCameraController is None:
+        return {}
+    controller = GestureCameraController()
+    controller.update_interval = 0  # No frame skipping
+
+    def reset():
+        controller.is_controlling = False
+        controller.fist_start_position = None
+
+    return {"handle_hand_position": (reset, lambda hand: controller.handle_hand_position(hand.landmark, FRAME_SHAPE))}
+
+
+def time_per_frame(setup, call, frames, rounds):
+    """Best of `rounds` passes over frames, in ns per frame."""
+    best = None
+    for _ in range(rounds):
+        if setup:
+            setup()
+        start = time.perf_counter_ns()
+        for hand in frames:
+            call(hand)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(frames)
+
+
+def detection_rates(frames):
+    """Fraction of frames on which each boolean detector fires, to check the fixtures."""
+    detector = HandGestureDetector()
+    checks = {
+        "fist": lambda hand: detector.detect_fist(hand),
+        "pinch": lambda hand: detector.detect_pinch(hand)[0],
+        "peace": lambda hand: detector.detect_peace_sign(hand),
+        "pointing": lambda hand: detector.detect_pointing(hand)[0],
+    }
+    if GestureCameraController is not None:
+        controller = GestureCameraController()
+        checks["controller_fist"] = lambda hand: controller._detect_fist(hand.landmark)
+        checks["controller_pointing"] = lambda hand: controller._detect_pointing(hand.landmark)
+    return {name: sum(1 for hand in frames if check(hand)) / len(frames) for name, check in checks.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gesture detector micro-benchmarks")
+    parser.add_argument("--frames", type=int, default=3000, help="frames per held-pose dataset")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--noise", type=float, default=0.003)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    datasets = make_datasets(args.frames, args.noise, args.seed)
+    detectors = {**client_detectors(), **controller_detectors()}
+    results = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "frames": args.frames, "rounds": args.rounds, "noise": args.noise, "seed": args.seed,
+        },
+        "ns_per_frame": {},
+        "detections": {},
+    }
+
+    # Detectors print on detection; keep the terminal out of the measurement
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, frames in datasets.items():
+            results["ns_per_frame"][name] = {
+                detector: time_per_frame(setup, call, frames, args.rounds)
+                for detector, (setup, call) in detectors.items()
+            }
+            results["detections"][name] = detection_rates(frames)
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)["ns_per_frame"]
+
+    names = list(datasets)
+    width = 16 if previous else 10
+    print(f"{'ns/frame':>27} " + " ".join(f"{name:>{width}}" for name in names))
+    for detector in detectors:
+        cells = []
+        for name in names:
+            value = results["ns_per_frame"][name][detector]
+            cell = f"{value:.0f}"
+            if previous and detector in previous.get(name, {}):
+                cell += f" {100 * (value / previous[name][detector] - 1):+.0f}%"
+            cells.append(f"{cell:>{width}}")
+        print(f"{detector:>27} " + " ".join(cells))
+
+    print(f"\n{'detection rate':>27} " + " ".join(f"{name:>10}" for name in names))
+    for check in results["detections"][names[0]]:
+        print(f"{check:>27} " + " ".join(f"{results['detections'][name][check]:>10.2f}" for name in names))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# benchmarks/bench_indexed_export.py
+# Reports file size and export time of indexed PLY/OBJ output against binary STL.
+import os
+import tempfile
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+from mesh_io import write_binary_stl, write_indexed_mesh
+from tessellation import tessellate_to_arrays
+
+
+def build_parts(count, deviation=0.02):
+    doc = FreeCAD.newDocument("BenchIndexedExport")
+    for i in range(count):
+        obj = doc.addObject("Part::Sphere" if i % 2 else "Part::Cylinder", f"Obj_{i}")
+        obj.Placement.Base = FreeCAD.Vector((i % 20) * 25, (i // 20) * 25, 0)
+    doc.recompute()
+    parts = [tessellate_to_arrays(obj.Shape, deviation) for obj in doc.Objects]
+    FreeCAD.closeDocument(doc.Name)
+    return parts
+
+
+def main(object_counts=(50, 200)):
+    directory = tempfile.gettempdir()
+    writers = (
+        ("stl", lambda path, parts: write_binary_stl(path, parts)),
+        ("ply", write_indexed_mesh),
+        ("obj", write_indexed_mesh),
+    )
+    print(f"{'objects':>8} {'format':>7} {'time (s)':>9} {'size (KB)':>10} {'vs STL':>7}")
+    for count in object_counts:
+        parts = build_parts(count)
+        stl_size = None
+        for extension, writer in writers:
+            path = os.path.join(directory, f"bench_indexed_export.{extension}")
+            start = time.perf_counter()
+            writer(path, parts)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path)
+            stl_size = stl_size or size
+            os.remove(path)
+            print(f"{count:>8} {extension:>7} {elapsed:>9.3f} {size / 1024:>10.0f} {size / stl_size:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/bench_lod.py
+# Frame rate while orbiting the camera around a scene of many curved solids, at full
+# quality and with each InteractionLOD mode, plus the cost of switching LOD on and
+# off. Run from FreeCAD's Python console for real frame rates; with
+# FREECAD_BACKEND=standin nothing is rendered and only the Python path is measured,
+# so the re-tessellation that "deviation" causes on engage and restore does not show.
+#
+#   FREECAD_BACKEND=standin QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_lod
+import argparse
+import json
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+from PySide2 import QtWidgets
+import FreeCAD
+import FreeCADGui
+from camera_orbit import CameraOrbitController
+from interaction_lod import LOD_MODES, InteractionLOD
+
+BACKEND = "standin" if getattr(FreeCAD, "__standin__", False) else "freecad"
+
+
+def make_scene(count):
+    """A grid of spheres and cylinders: curved faces make tessellation expensive."""
+    doc = FreeCAD.newDocument("BenchLOD")
+    side = max(1, int(count ** 0.5))
+    for i in range(count):
+        kind = "Part::Sphere" if i % 2 else "Part::Cylinder"
+        obj = doc.addObject(kind, f"Solid{i}")
+        obj.Placement = FreeCAD.Placement(FreeCAD.Vector((i % side) * 25, (i // side) * 25, 0),
+                                          FreeCAD.Rotation())
+    doc.recompute()
+    FreeCADGui.ActiveDocument.ActiveView.fitAll()
+    return doc
+
+
+def render(view):
+    view.redraw()
+    FreeCADGui.updateGui()
+
+
+def frames_per_second(view, frames, degrees_per_frame=2.0):
+    """Orbit by a fixed step per frame and render each one; return frames per second."""
+    step = FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), degrees_per_frame)
+    render(view)  # Tessellate outside the measurement
+    start = time.perf_counter()
+    for _ in range(frames):
+        CameraOrbitController._apply(view, step)
+        render(view)
+    return frames / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Interaction LOD frame rate benchmark")
+    parser.add_argument("--objects", type=int, nargs="+", default=[50, 200, 800])
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    results = {"backend": BACKEND, "fps": {}}
+    print(f"Backend: {BACKEND}" + (" (no renderer: frame rates are the Python path only)"
+                                   if BACKEND == "standin" else "") + "\n")
+    print(f"{'objects':>8} {'mode':>12} {'fps':>8} {'engage (ms)':>12} {'restore (ms)':>13}")
+    for count in args.objects:
+        doc = make_scene(count)
+        view = FreeCADGui.ActiveDocument.ActiveView
+        kept = doc.Objects[0]  # The object a gesture would be working on
+        rows = {"full": {"fps": frames_per_second(view, args.frames)}}
+        print(f"{count:>8} {'full':>12} {rows['full']['fps']:>8.1f}")
+
+        for mode in LOD_MODES:
+            lod = InteractionLOD(doc, mode=mode)
+            start = time.perf_counter()
+            lod.engage(keep=[kept])
+            render(view)
+            engage = (time.perf_counter() - start) * 1000
+            fps = frames_per_second(view, args.frames)
+            start = time.perf_counter()
+            lod.restore()
+            render(view)
+            restore = (time.perf_counter() - start) * 1000
+            rows[mode] = {"fps": fps, "engage_ms": engage, "restore_ms": restore}
+            print(f"{count:>8} {mode:>12} {fps:>8.1f} {engage:>12.1f} {restore:>13.1f}")
+
+        results["fps"][count] = rows
+        FreeCAD.closeDocument(doc.Name)
+        app.processEvents()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
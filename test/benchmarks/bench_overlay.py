@@ -0,0 +1,100 @@
+# benchmarks/bench_overlay.py
+# GUI-thread CPU use of HandTrackingOverlay at idle and while fingertips are tracked,
+# with and without the old 60 fps full-window repaint timer. Needs PySide2 and a
+# main window: run with FREECAD_BACKEND=standin, or from FreeCAD's Python console.
+#
+#   FREECAD_BACKEND=standin QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_overlay
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+from PySide2 import QtCore, QtWidgets
+import FreeCADGui
+from benchmarks.synthetic_hands import POSES, circle_path, sequence
+from test_commands import HandTrackingOverlay
+
+FINGERTIPS = (4, 8, 12, 16, 20)
+
+
+class PaintCounter(QtCore.QObject):
+    def __init__(self):
+        super().__init__()
+        self.paints = 0
+        self.pixels = 0
+
+    def eventFilter(self, watched, event):
+        if event.type() == QtCore.QEvent.Paint:
+            self.paints += 1
+            self.pixels += sum(r.width() * r.height() for r in event.region().rects())
+        return False
+
+
+def run_scenario(overlay, seconds, feed_hz=0, full_repaint_hz=0):
+    """Run the event loop; return (GUI thread CPU %, paints/s, mean painted pixels per paint)."""
+    counter = PaintCounter()
+    overlay.installEventFilter(counter)
+    timers = []
+
+    if feed_hz:
+        frames = sequence(list(POSES) * 4, path=circle_path(radius=0.2), noise=0.002)
+        width, height = overlay.width(), overlay.height()
+        state = {"frame": 0}
+
+        def feed():
+            hand = frames[state["frame"] % len(frames)]
+            state["frame"] += 1
+            # What ServerConnect.process_server_data does for one finger message
+            for finger_id, index in enumerate(FINGERTIPS):
+                landmark = hand.landmark[index]
+                overlay.update_finger_position(finger_id, landmark.x * width, landmark.y * height)
+
+        feeder = QtCore.QTimer()
+        feeder.timeout.connect(feed)
+        feeder.start(int(1000 / feed_hz))
+        timers.append(feeder)
+
+    if full_repaint_hz:
+        # The repaint timer HandTrackingOverlay used to run
+        repaint = QtCore.QTimer()
+        repaint.timeout.connect(overlay.update)
+        repaint.start(int(1000 / full_repaint_hz))
+        timers.append(repaint)
+
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(int(seconds * 1000), loop.quit)
+    cpu_start, wall_start = time.thread_time(), time.perf_counter()
+    loop.exec_()
+    cpu, wall = time.thread_time() - cpu_start, time.perf_counter() - wall_start
+
+    for timer in timers:
+        timer.stop()
+    overlay.removeEventFilter(counter)
+    return 100 * cpu / wall, counter.paints / wall, counter.pixels / max(counter.paints, 1)
+
+
+def main(seconds=5.0):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    main_window = FreeCADGui.getMainWindow()
+    main_window.show()
+    overlay = HandTrackingOverlay()
+    app.processEvents()
+
+    scenarios = [
+        ("idle", {}),
+        ("tracking 30 Hz", {"feed_hz": 30}),
+        ("tracking 60 Hz", {"feed_hz": 60}),
+        ("idle + old 60 fps timer", {"full_repaint_hz": 60}),
+        ("tracking 30 Hz + old timer", {"feed_hz": 30, "full_repaint_hz": 60}),
+    ]
+    print(f"Overlay {overlay.width()}x{overlay.height()}, {seconds:.0f} s per scenario\n")
+    print(f"{'scenario':>28} {'GUI CPU (%)':>12} {'paints/s':>9} {'px/paint':>10}")
+    for name, options in scenarios:
+        cpu, paints, pixels = run_scenario(overlay, seconds, **options)
+        print(f"{name:>28} {cpu:>12.1f} {paints:>9.1f} {pixels:>10.0f}")
+
+    overlay.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# benchmarks/bench_parallel_export.py
+# Times cold-cache tessellation of a large scene with 1..N worker processes and
+# checks that every worker count produces identical output.
+import os
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+import numpy as np
+from tessellation import tessellate_many
+from worker_pool import create_pool
+
+DEVIATION = 0.02
+
+
+def build_scene(count):
+    doc = FreeCAD.newDocument("BenchParallelExport")
+    for i in range(count):
+        obj = doc.addObject("Part::Sphere" if i % 2 else "Part::Torus", f"Obj_{i}")
+        obj.Placement.Base = FreeCAD.Vector((i % 20) * 25, (i // 20) * 25, 0)
+    doc.recompute()
+    return doc
+
+
+def main(objects=300, max_workers=None):
+    max_workers = max_workers or os.cpu_count()
+    doc = build_scene(objects)
+    shapes = [obj.Shape for obj in doc.Objects]
+
+    start = time.perf_counter()
+    reference = tessellate_many(shapes, DEVIATION)
+    inline = time.perf_counter() - start
+    print(f"{objects} objects, deviation {DEVIATION}")
+    print(f"{'workers':>8} {'time (s)':>9} {'speedup':>8}")
+    print(f"{'inline':>8} {inline:>9.3f} {1.0:>7.1f}x")
+
+    for workers in range(1, max_workers + 1):
+        with create_pool(workers) as pool:
+            # Warm up so process start-up is not counted
+            list(pool.map(abs, range(workers)))
+            start = time.perf_counter()
+            parts = tessellate_many(shapes, DEVIATION, pool)
+            elapsed = time.perf_counter() - start
+        identical = all(np.array_equal(a[0], b[0]) and np.array_equal(a[1], b[1])
+                        for a, b in zip(parts, reference))
+        note = "" if identical else "  (output differs!)"
+        print(f"{workers:>8} {elapsed:>9.3f} {inline / elapsed:>7.1f}x{note}")
+
+    FreeCAD.closeDocument(doc.Name)
+
+
+if __name__ == "__main__":
+    main()
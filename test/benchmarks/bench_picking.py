@@ -0,0 +1,116 @@
+# benchmarks/bench_picking.py
+# Reports pick latency for scenes of increasing size: BVH candidate search alone,
+# a brute-force box test over every object, and the full ScenePicker pick with
+# exact shape intersection. A second table checks that picking at the window point
+# where each object's center is drawn selects that object.
+import random
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+from PySide2 import QtCore, QtWidgets
+import FreeCAD
+import FreeCADGui
+from picking import ScenePicker, ray_box_entry, window_to_viewport
+
+
+def build_scene(count):
+    doc = FreeCAD.newDocument("BenchPicking")
+    for i in range(count):
+        obj = doc.addObject("Part::Box" if i % 2 else "Part::Sphere", f"Obj_{i}")
+        obj.Placement = FreeCAD.Placement(
+            FreeCAD.Vector((i % 32) * 15, ((i // 32) % 32) * 15, (i // 1024) * 15), FreeCAD.Rotation())
+    doc.recompute()
+    return doc
+
+
+def random_rays(count, extent, seed=1):
+    rng = random.Random(seed)
+    rays = []
+    for _ in range(count):
+        origin = FreeCAD.Vector(rng.uniform(0, extent), rng.uniform(0, extent), -100)
+        direction = FreeCAD.Vector(rng.uniform(-0.2, 0.2), rng.uniform(-0.2, 0.2), 1).normalize()
+        rays.append((origin, direction))
+    return rays
+
+
+def brute_force(boxes, origin, direction):
+    inv_direction = [1.0 / d if d else None for d in direction]
+    hits = [(t, i) for i, (lo, hi) in enumerate(boxes)
+            if (t := ray_box_entry(lo, hi, origin, inv_direction)) is not None]
+    hits.sort()
+    return hits
+
+
+def window_point(view, point):
+    """Main window pixel where a model point is drawn: the inverse of window_to_viewport()."""
+    x, y = view.getPointOnScreen(point)
+    height = view.getSize()[1]
+    widget = view.graphicsView() if hasattr(view, "graphicsView") else None
+    if widget is None:
+        return x, height - 1 - y
+    ratio = widget.devicePixelRatioF()
+    local = QtCore.QPoint(int(x / ratio), int((height - 1 - y) / ratio))
+    window = FreeCADGui.getMainWindow().mapFromGlobal(widget.mapToGlobal(local))
+    return window.x(), window.y()
+
+
+def check_picks(count=100):
+    """Return (objects checked, picked correctly) for picks at each visible object's center."""
+    doc = build_scene(count)
+    view = FreeCADGui.ActiveDocument.ActiveView
+    view.viewTop()
+    view.fitAll()
+    width, height = view.getSize()
+    picker = ScenePicker(doc)
+    checked = correct = 0
+    for obj in doc.Objects:
+        center = obj.Shape.BoundBox.Center
+        x, y = view.getPointOnScreen(center)
+        if not (0 <= x < width and 0 <= y < height):
+            continue
+        checked += 1
+        if picker.pick(view, *window_to_viewport(view, *window_point(view, center))) is obj:
+            correct += 1
+    FreeCAD.closeDocument(doc.Name)
+    return checked, correct
+
+
+def main(sizes=(100, 1000, 5000), ray_count=200):
+    print(f"{'objects':>8} {'build (ms)':>11} {'bvh (us)':>9} {'brute (us)':>11} {'full pick (ms)':>15}")
+    for size in sizes:
+        doc = build_scene(size)
+        picker = ScenePicker(doc)
+        start = time.perf_counter()
+        bvh = picker.index()
+        build = time.perf_counter() - start
+        boxes = bvh._boxes
+        rays = random_rays(ray_count, 32 * 15)
+
+        start = time.perf_counter()
+        for origin, direction in rays:
+            bvh.candidates(tuple(origin), tuple(direction))
+        bvh_time = (time.perf_counter() - start) / ray_count
+
+        start = time.perf_counter()
+        for origin, direction in rays:
+            brute_force(boxes, tuple(origin), tuple(direction))
+        brute_time = (time.perf_counter() - start) / ray_count
+
+        start = time.perf_counter()
+        for origin, direction in rays:
+            picker.pick_ray(origin, direction)
+        pick_time = (time.perf_counter() - start) / ray_count
+
+        FreeCAD.closeDocument(doc.Name)
+        print(f"{size:>8} {build * 1e3:>11.1f} {bvh_time * 1e6:>9.1f} {brute_time * 1e6:>11.1f} {pick_time * 1e3:>15.2f}")
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    checked, correct = check_picks()
+    print(f"\n{'objects on screen':>18} {'picked correctly':>17}")
+    print(f"{checked:>18} {correct:>17}")
+
+
+if __name__ == "__main__":
+    main()
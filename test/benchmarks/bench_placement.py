@@ -0,0 +1,54 @@
+# benchmarks/bench_placement.py
+# Measures per-move latency of a full document recompute against the set_placement fast path.
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+from commands import set_placement
+
+
+def build_scene(name, count):
+    """Create a document holding `count` recomputed boxes laid out on a grid."""
+    doc = FreeCAD.newDocument(name)
+    for i in range(count):
+        box = doc.addObject("Part::Box", f"Box_{i}")
+        box.Placement.Base = FreeCAD.Vector((i % 32) * 15, (i // 32) * 15, 0)
+    doc.recompute()
+    return doc
+
+
+def move_full_recompute(doc, obj, moves):
+    start = time.perf_counter()
+    for _ in range(moves):
+        placement = obj.Placement
+        placement.Base.x += 0.1
+        obj.Placement = placement
+        doc.recompute()
+    return (time.perf_counter() - start) / moves
+
+
+def move_fast_path(doc, obj, moves):
+    start = time.perf_counter()
+    for _ in range(moves):
+        placement = obj.Placement
+        placement.Base.x += 0.1
+        if not set_placement(obj, placement):
+            doc.recompute()
+    return (time.perf_counter() - start) / moves
+
+
+def main(sizes=(100, 300, 1000), moves=200):
+    print(f"{'objects':>8} {'full recompute (us)':>20} {'fast path (us)':>15}")
+    for size in sizes:
+        doc = build_scene("BenchPlacement", size)
+        obj = doc.getObject("Box_0")
+        full = move_full_recompute(doc, obj, moves)
+        fast = move_fast_path(doc, obj, moves)
+        FreeCAD.closeDocument(doc.Name)
+        print(f"{size:>8} {full * 1e6:>20.1f} {fast * 1e6:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_registry.py
+# Compares case-insensitive lookup and listing in ObjectRegistry with the dict
+# scan and string concatenation CommandProcessor used before. Needs no FreeCAD.
+import time
+
+from object_registry import ObjectRegistry
+
+
+class StubObject:
+    def __init__(self, name, type_id):
+        self.Name = name
+        self.TypeId = type_id
+
+
+def dict_lookup(objects, name):
+    name_lower = name.lower()
+    matches = {k: v for k, v in objects.items() if k.lower() == name_lower}
+    return next(iter(matches.values())) if matches else None
+
+
+def dict_listing(objects):
+    result = "Created objects:\n"
+    for name in objects:
+        result += f"- {name}\n"
+    return result
+
+
+def timed(func, *args, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def main(sizes=(1000, 10000, 100000), lookups=20):
+    print(f"{'objects':>8} {'dict lookup (us)':>17} {'registry lookup (us)':>21} "
+          f"{'dict list (ms)':>15} {'registry list (ms)':>19}")
+    for size in sizes:
+        plain = {}
+        registry = ObjectRegistry()
+        for i in range(size):
+            prefix = ("Box", "Sphere", "Cylinder")[i % 3]
+            name = registry.allocate_name(prefix)
+            obj = StubObject(name, f"Part::{prefix}")
+            plain[name] = obj
+            registry[name] = obj
+        target = "box_" + str((size // 3) * 3 // 3)
+        dict_time = timed(dict_lookup, plain, target, repeat=lookups)
+        registry_time = timed(registry.find, target, repeat=lookups * 100)
+        dict_list = timed(dict_listing, plain)
+        registry_list = timed(registry.listing)
+        print(f"{size:>8} {dict_time * 1e6:>17.1f} {registry_time * 1e6:>21.2f} "
+              f"{dict_list * 1e3:>15.2f} {registry_list * 1e3:>19.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_stl_writer.py
+# Compares peak RSS and write time of the Mesh module path against the NumPy
+# writers in mesh_io. Each method runs in its own process so peaks don't mix.
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+METHODS = ("mesh", "streamed", "mapped")
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(method, objects, path):
+    from setup import setup_freecad_env
+    setup_freecad_env()
+
+    import FreeCAD
+    from mesh_io import write_binary_stl
+    from tessellation import tessellate_to_arrays, merged_triangles
+
+    doc = FreeCAD.newDocument("BenchStlWriter")
+    for i in range(objects):
+        obj = doc.addObject("Part::Sphere", f"Sphere_{i}")
+        obj.Radius = 10
+        obj.Placement.Base = FreeCAD.Vector((i % 20) * 25, (i // 20) * 25, 0)
+    doc.recompute()
+    parts = [tessellate_to_arrays(obj.Shape, 0.01) for obj in doc.Objects]
+    facets = sum(len(triangles) for _, triangles in parts)
+
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    if method == "mesh":
+        import Mesh
+        Mesh.Mesh(merged_triangles(parts).tolist()).write(path)
+    elif method == "streamed":
+        write_binary_stl(path, iter(parts))
+    else:
+        write_binary_stl(path, parts)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "facets": facets,
+        "seconds": elapsed,
+        "peak_increase_mb": peak_rss_mb() - baseline,
+    }))
+
+
+def main(object_counts=(50, 200, 500)):
+    path = os.path.join(tempfile.gettempdir(), "bench_stl_writer.stl")
+    print(f"{'objects':>8} {'facets':>10} {'method':>9} {'write (s)':>10} {'peak +RSS (MB)':>15}")
+    for objects in object_counts:
+        for method in METHODS:
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_stl_writer", "--child", method, str(objects), path],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{objects:>8} {result['facets']:>10} {method:>9} "
+                  f"{result['seconds']:>10.3f} {result['peak_increase_mb']:>15.1f}")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+    else:
+        main()
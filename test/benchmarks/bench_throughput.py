@@ -0,0 +1,144 @@
+# benchmarks/bench_throughput.py
+# Command-layer throughput: commands per second, cost per recompute and server
+# message-apply rate. Runs against FreeCAD or, with FREECAD_BACKEND=standin, against
+# the stand-in modules, so regressions in the Python layer can be tracked in CI:
+#
+#   FREECAD_BACKEND=standin python -m benchmarks.bench_throughput --json results.json
+import argparse
+import contextlib
+import io
+import json
+import os
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+from benchmarks.bench_batch import make_script
+from commands import CommandProcessor, set_placement
+
+BACKEND = "standin" if getattr(FreeCAD, "__standin__", False) else "freecad"
+
+# Messages as the hand tracking client sends them
+MESSAGES = {
+    "fingers": "0,412.0,300.5;1,398.0,310.0;2,420.5,280.0",
+    "vector": "VECTOR:0.5,-0.25",
+    "move": "MOVE:LEFT",
+    "camera": "CAMERA:0.2,0.15,0.0",
+    "pinch": "PINCH:400,300",
+}
+
+
+def commands_per_second(size):
+    """Return (sequential, scripted) commands per second for a mixed script of `size` commands."""
+    commands = make_script(size)
+    rates = []
+    for run in ("sequential", "scripted"):
+        doc = FreeCAD.newDocument("BenchThroughput")
+        processor = CommandProcessor(doc)
+        start = time.perf_counter()
+        if run == "sequential":
+            for command in commands:
+                processor.process(command)
+        else:
+            processor.run_script("\n".join(commands))
+        elapsed = time.perf_counter() - start
+        FreeCAD.closeDocument(doc.Name)
+        rates.append(size / elapsed)
+    return tuple(rates)
+
+
+def recompute_cost(object_count, repeat=50):
+    """Return ms per (full document recompute, set_placement) after moving one object."""
+    doc = FreeCAD.newDocument("BenchRecompute")
+    for i in range(object_count):
+        box = doc.addObject("Part::Box", f"Box{i}")
+        box.Placement = FreeCAD.Placement(FreeCAD.Vector(i * 15, 0, 0), FreeCAD.Rotation())
+    doc.recompute()
+    target = doc.Objects[object_count // 2]
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        target.Placement = FreeCAD.Placement(FreeCAD.Vector(i, 0, 0), FreeCAD.Rotation())
+        doc.recompute()
+    full = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        if not set_placement(target, FreeCAD.Placement(FreeCAD.Vector(i, 1, 0), FreeCAD.Rotation())):
+            doc.recompute()
+    placement = (time.perf_counter() - start) / repeat
+
+    FreeCAD.closeDocument(doc.Name)
+    return full * 1000, placement * 1000
+
+
+def message_rates(count):
+    """Return {message kind: messages per second} through ServerConnect.process_server_data."""
+    from PySide2 import QtWidgets
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from test_commands import ServerConnect
+
+    doc = FreeCAD.newDocument("BenchMessages")
+    with contextlib.redirect_stdout(io.StringIO()):
+        server = ServerConnect(lambda data: None, doc)
+        server.server.close()  # Only the message handlers are measured
+        server.PINCH_COOLDOWN = 0
+        for i in range(20):
+            server.command_processor.process(f"box {5 + i % 4} 5 5")
+            server.command_processor.process(f"move {i * 12} 0 0")
+
+        rates = {}
+        for kind, message in MESSAGES.items():
+            start = time.perf_counter()
+            for _ in range(count):
+                server.process_server_data(message)
+            rates[kind] = count / (time.perf_counter() - start)
+            app.processEvents()
+    server.overlay.close()
+    FreeCAD.closeDocument(doc.Name)
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Command-layer throughput benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--objects", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    results = {"backend": BACKEND, "commands": {}, "recompute": {}, "messages": {}}
+
+    print(f"Backend: {BACKEND}\n")
+    print(f"{'commands':>10} {'sequential (cmd/s)':>19} {'scripted (cmd/s)':>17}")
+    for size in args.sizes:
+        sequential, scripted = commands_per_second(size)
+        results["commands"][size] = {"sequential": sequential, "scripted": scripted}
+        print(f"{size:>10} {sequential:>19.0f} {scripted:>17.0f}")
+
+    print(f"\n{'objects':>10} {'recompute (ms)':>15} {'set_placement (ms)':>19}")
+    for count in args.objects:
+        full, placement = recompute_cost(count)
+        results["recompute"][count] = {"recompute_ms": full, "set_placement_ms": placement}
+        print(f"{count:>10} {full:>15.3f} {placement:>19.3f}")
+
+    print(f"\n{'message':>10} {'messages/s':>11}")
+    try:
+        rates = message_rates(args.messages)
+    except ImportError as e:
+        # Only a missing dependency skips this table; a ServerConnect error is a failure
+        print(f"Skipped: ServerConnect needs PySide2 ({e})")
+    else:
+        results["messages"] = rates
+        for kind, rate in rates.items():
+            print(f"{kind:>10} {rate:>11.0f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {os.path.abspath(args.json)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# benchmarks/synthetic_hands.py
+# Synthetic MediaPipe-style hand landmarks for benchmarking the gesture detectors.
+# Needs nothing but the standard library.
+#
+# Landmarks follow MediaPipe's 21-point layout in normalized image coordinates
+# (x right, y down, z towards the camera negative). A hand is built in a local frame
+# with the wrist at the origin and the fingers pointing up, then scaled, rotated
+# in the image plane and placed at a palm position.
+import math
+import random
+from collections import namedtuple
+
+Landmark = namedtuple("Landmark", "x y z")
+
+POSES = ("open", "fist", "pinch", "point", "peace")
+
+# Finger bases (MCP joints) relative to the wrist: index, middle, ring, pinky
+_FINGER_BASES = [(-0.045, -0.12), (-0.012, -0.13), (0.02, -0.125), (0.05, -0.11)]
+# Segment lengths MCP->PIP, PIP->DIP, DIP->TIP of an extended finger
+_SEGMENTS = (0.075, 0.065, 0.06)
+
+# Thumb CMC, MCP, IP, TIP: spread out, lying along the index finger, folded over the fingers
+_THUMB_OUT = [(-0.035, -0.03, -0.01), (-0.07, -0.06, -0.015), (-0.1, -0.085, -0.02), (-0.125, -0.105, -0.02)]
+_THUMB_ALONG = [(-0.035, -0.03, -0.01), (-0.06, -0.07, -0.02), (-0.065, -0.1, -0.03), (-0.07, -0.125, -0.03)]
+_THUMB_FOLDED = [(-0.035, -0.03, -0.01), (-0.06, -0.07, -0.02), (-0.03, -0.09, -0.045), (0.02, -0.075, -0.05)]
+
+
+def _finger(base, extended):
+    """Return the four landmarks (MCP, PIP, DIP, TIP) of one finger."""
+    bx, by = base
+    if extended:
+        a, b, c = _SEGMENTS
+        return [(bx, by, 0.0), (bx, by - a, -0.005), (bx, by - a - b, -0.01), (bx, by - a - b - c, -0.012)]
+    # Curled: the tip folds back below the knuckle, towards the camera
+    return [(bx, by, 0.0), (bx, by - 0.035, -0.02), (bx, by - 0.01, -0.045), (bx, by + 0.02, -0.04)]
+
+
+def pose_landmarks(pose):
+    """Return the 21 local (x, y, z) landmarks of a named pose."""
+    if pose not in POSES:
+        raise ValueError(f"Unknown pose '{pose}', expected one of {POSES}")
+    extended = {
+        "open": (True, True, True, True),
+        "fist": (False, False, False, False),
+        "pinch": (False, True, True, True),
+        "point": (True, False, False, False),
+        "peace": (True, True, False, False),
+    }[pose]
+    fingers = [_finger(base, up) for base, up in zip(_FINGER_BASES, extended)]
+    thumb = list({"open": _THUMB_OUT, "peace": _THUMB_OUT, "fist": _THUMB_FOLDED}.get(pose, _THUMB_ALONG))
+    if pose == "pinch":
+        # Thumb tip meets the curled index fingertip
+        tx, ty, tz = fingers[0][3]
+        thumb[2] = ((thumb[1][0] + tx) / 2, (thumb[1][1] + ty) / 2, tz)
+        thumb[3] = (tx - 0.008, ty + 0.004, tz)
+    points = [(0.0, 0.0, 0.0)] + thumb
+    for finger in fingers:
+        points.extend(finger)
+    return points
+
+
+def blend(points_a, points_b, t):
+    """Linearly interpolate two landmark sets; t=0 gives points_a, t=1 gives points_b."""
+    return [tuple(a + (b - a) * t for a, b in zip(pa, pb)) for pa, pb in zip(points_a, points_b)]
+
+
+class SyntheticHand:
+    """Stands in for MediaPipe's NormalizedLandmarkList: landmarks are in .landmark."""
+
+    __slots__ = ("landmark", "pose")
+
+    def __init__(self, landmark, pose):
+        self.landmark = landmark
+        self.pose = pose
+
+
+def place(points, center=(0.5, 0.55), scale=1.0, angle=0.0, noise=0.0, rng=None):
+    """Place local landmarks in the image: palm centre, scale, in-plane angle (degrees) and noise."""
+    cos_a, sin_a = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    # Put the palm centre, not the wrist, at `center`
+    ox, oy = center[0], center[1] + 0.07 * scale
+    landmarks = []
+    for x, y, z in points:
+        x, y, z = x * scale, y * scale, z * scale
+        if noise:
+            x, y, z = x + rng.gauss(0, noise), y + rng.gauss(0, noise), z + rng.gauss(0, noise)
+        landmarks.append(Landmark(ox + x * cos_a - y * sin_a, oy + x * sin_a + y * cos_a, z))
+    return landmarks
+
+
+def make_hand(pose, noise=0.0, seed=0, **placement):
+    """Return one SyntheticHand in a named pose; see place() for the placement options."""
+    return SyntheticHand(place(pose_landmarks(pose), noise=noise, rng=random.Random(seed), **placement), pose)
+
+
+def circle_path(radius=0.08, center=(0.5, 0.55), frames_per_turn=120):
+    """Palm path moving on a circle, for fist-drag and camera-orbit trajectories."""
+    def path(frame):
+        a = 2 * math.pi * frame / frames_per_turn
+        return center[0] + radius * math.cos(a), center[1] + radius * math.sin(a)
+    return path
+
+
+def drift_path(start=(0.35, 0.55), velocity=(0.002, -0.001)):
+    """Palm path moving at constant velocity (normalized units per frame)."""
+    def path(frame):
+        return start[0] + velocity[0] * frame, start[1] + velocity[1] * frame
+    return path
+
+
+def sequence(poses, hold_frames=30, transition_frames=8, path=None, noise=0.0,
+             scale=1.0, angle=0.0, seed=0):
+    """Return a list of SyntheticHand frames playing through poses.
+
+    Each pose is held for hold_frames, with transition_frames of interpolation in
+    between (labelled with the pose being entered). path(frame) gives the palm
+    centre; noise is the standard deviation of Gaussian jitter added per landmark.
+    The same seed always produces the same frames.
+    """
+    rng = random.Random(seed)
+    path = path or (lambda frame: (0.5, 0.55))
+    frames = []
+    previous = None
+    for pose in poses:
+        points = pose_landmarks(pose)
+        if previous is not None:
+            for step in range(1, transition_frames + 1):
+                mixed = blend(previous, points, step / (transition_frames + 1))
+                frames.append(SyntheticHand(place(mixed, path(len(frames)), scale, angle, noise, rng), pose))
+        for _ in range(hold_frames):
+            frames.append(SyntheticHand(place(points, path(len(frames)), scale, angle, noise, rng), pose))
+        previous = points
+    return frames
@@ -0,0 +1,113 @@
+# Contains the camera orbit controller used by the CAMERA gestures
+import logging
+import math
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+from PySide2 import QtCore, QtGui
+import FreeCAD
+import FreeCADGui
+
+logger = logging.getLogger(__name__)
+
+# Camera-local axes: Coin cameras look down -Z with +Y up
+_RIGHT = FreeCAD.Vector(1, 0, 0)
+_UP = FreeCAD.Vector(0, 1, 0)
+_BACK = FreeCAD.Vector(0, 0, 1)
+_FORWARD = FreeCAD.Vector(0, 0, -1)
+
+
+def refresh_interval_ms():
+    """Milliseconds between display refreshes of the primary screen (16 if unknown)."""
+    screen = QtGui.QGuiApplication.primaryScreen()
+    rate = screen.refreshRate() if screen is not None else 0
+    return max(1, int(1000 / rate)) if rate > 1 else 16
+
+
+class CameraOrbitController(QtCore.QObject):
+    """Orbits the active camera about its focal point at a velocity set by gestures.
+
+    Gestures set an angular velocity; a timer running at the display refresh rate
+    applies it as one small quaternion step per frame, written straight into the
+    Coin camera node. Coin schedules the redraw itself when the camera fields change.
+    When gestures stop, the velocity decays with the `damping` time constant instead
+    of stopping dead, and the timer stops once the camera is still.
+    """
+
+    def __init__(self, gain=90.0, hold=0.15, damping=0.25, tick_ms=None):
+        super().__init__()
+        self.gain = gain  # Degrees per second per unit of gesture input
+        self.hold = hold  # Seconds an input keeps its velocity before decaying
+        self.damping = damping
+        self.velocity = [0.0, 0.0, 0.0]  # Yaw, pitch, roll in degrees per second
+        self._input_until = 0.0
+        self._last_tick = None
+        self.steps = 0
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.setInterval(tick_ms or refresh_interval_ms())
+        self.timer.timeout.connect(self.tick)
+
+    @property
+    def is_moving(self):
+        return self.timer.isActive()
+
+    def orbit(self, yaw, pitch, roll, dead_zone=0.0):
+        """Set the orbit velocity from one gesture sample; inputs within dead_zone count as 0."""
+        values = [v if abs(v) > dead_zone else 0.0 for v in (yaw, pitch, roll)]
+        if not any(values):
+            return  # A still hand: a moving camera coasts to a stop in tick()
+        self.velocity = [v * self.gain for v in values]
+        self._input_until = time.perf_counter() + self.hold
+        if not self.timer.isActive():
+            self._last_tick = time.perf_counter()
+            self.timer.start()
+
+    def stop(self):
+        self.velocity = [0.0, 0.0, 0.0]
+        self.timer.stop()
+
+    def tick(self):
+        now = time.perf_counter()
+        dt = min(now - self._last_tick, 0.1)
+        self._last_tick = now
+
+        if now > self._input_until:
+            # Inertia: coast to a stop
+            decay = math.exp(-dt / self.damping)
+            self.velocity = [v * decay for v in self.velocity]
+        if max(abs(v) for v in self.velocity) < 0.5:
+            self.stop()
+            return
+
+        yaw, pitch, roll = (v * dt for v in self.velocity)
+        step = FreeCAD.Rotation(_UP, yaw).multiply(
+            FreeCAD.Rotation(_RIGHT, pitch)).multiply(FreeCAD.Rotation(_BACK, roll))
+        try:
+            self._apply(FreeCADGui.ActiveDocument.ActiveView, step)
+            self.steps += 1
+        except Exception as e:
+            logger.warning("Camera orbit stopped: %s", e)
+            self.stop()
+
+    @staticmethod
+    def _apply(view, step):
+        """Turn the camera by step (in camera axes) about its focal point."""
+        camera = view.getCameraNode() if hasattr(view, "getCameraNode") else None
+        if camera is None:
+            # No scene graph access: let the view orbit its focal point
+            view.setCameraOrientation(view.getCameraOrientation().multiply(step))
+            return
+
+        orientation = FreeCAD.Rotation(*camera.orientation.getValue().getValue())
+        position = FreeCAD.Vector(*camera.position.getValue().getValue())
+        distance = camera.focalDistance.getValue()
+        focal_point = position + orientation.multVec(_FORWARD) * distance
+
+        orientation = orientation.multiply(step)
+        position = focal_point - orientation.multVec(_FORWARD) * distance
+        camera.orientation.setValue(*orientation.Q)
+        camera.position.setValue(position.x, position.y, position.z)
@@ -2,22 +2,253 @@
 from setup import setup_freecad_env
 setup_freecad_env()
 
+import logging
+
 import FreeCAD
 import FreeCADGui
 import Part
 import socket
+import time
+from contextlib import contextmanager
+from geometry_cache import BOOLEAN_OPERATIONS, FilletMemo, GeometryCache, boolean_brep, fillet_brep
+from object_registry import ObjectRegistry
+from selection_cache import selection_cache
+
+logger = logging.getLogger(__name__)
+
+
+# Argument counts per command: (minimum, maximum or None, how many leading args are numbers)
+COMMAND_ARGS = {
+    "box": (3, 3, 3),
+    "sphere": (1, 1, 1),
+    "cylinder": (2, 2, 2),
+    "select": (1, 1, 0),
+    "edge": (2, None, 0),
+    "move": (3, 3, 3),
+    "rotate": (4, 4, 4),
+    "fillet": (1, 1, 1),
+    "fuse": (2, 2, 0),
+    "cut": (2, 2, 0),
+    "common": (2, 2, 0),
+    "list": (0, 0, 0),
+    "clear": (0, 0, 0),
+    "clearsel": (0, 0, 0),
+}
+
+
+def parse_script(text):
+    """Split a script into (line number, command) pairs, checking every command first.
+
+    Commands are separated by newlines or ';' and '#' starts a comment. Raises
+    ValueError listing every bad line, so nothing runs unless the whole script is valid.
+    """
+    commands = []
+    errors = []
+    for line_number, line in enumerate(text.splitlines(), 1):
+        for command in line.split("#", 1)[0].split(";"):
+            words = command.split()
+            if not words:
+                continue
+            cmd, args = words[0].lower(), words[1:]
+            if cmd not in COMMAND_ARGS:
+                errors.append(f"line {line_number}: unknown command '{cmd}'")
+                continue
+            minimum, maximum, numeric = COMMAND_ARGS[cmd]
+            if len(args) < minimum or (maximum is not None and len(args) > maximum):
+                errors.append(f"line {line_number}: wrong number of arguments for '{cmd}'")
+                continue
+            try:
+                for arg in args[:numeric]:
+                    float(arg)
+            except ValueError:
+                errors.append(f"line {line_number}: '{cmd}' expects numbers, got '{arg}'")
+                continue
+            commands.append((line_number, " ".join(words)))
+    if errors:
+        raise ValueError("\n".join(errors))
+    return commands
+
+
+def set_placement(obj, placement):
+    """Set obj.Placement, recomputing only the objects that depend on obj.
+
+    A placement change moves the shape rigidly, so obj itself never needs to be
+    re-executed and a full document recompute is wasted work. Returns False when
+    obj already had other pending changes; the caller must then recompute normally.
+    """
+    was_touched = "Touched" in obj.State
+    obj.Placement = placement
+    if was_touched:
+        return False
+    dependents = obj.InListRecursive
+    obj.purgeTouched()
+    if dependents:
+        for dependent in dependents:
+            dependent.touch()
+        obj.Document.recompute(dependents)
+    return True
 
 
 class CommandProcessor:
-    def __init__(self, doc):
+    def __init__(self, doc, jobs=None):
         self.doc = doc
-        self.objects = {}  # Store created objects
+        self.jobs = jobs  # Optional GeometryJobQueue; fillets and booleans run in the background when set
+        self.objects = ObjectRegistry()  # Store created objects
         self.selected = None  # Currently selected object
         self.selected_edges = []  # Store selected edges
+        self.geometry = GeometryCache()  # Edge lists, edge types and bounds per object revision
+        self.fillets = FilletMemo()  # Solved fillets, reused for repeated previews and redo
+
+        # Batch mode state: nesting depth and the deferred work ("recompute", "gui", "fit")
+        self._batch_depth = 0
+        self._pending = set()
+
+        # Follow selection changes made outside the commands (picking, clicks in the 3D view)
+        self.selection = selection_cache()
+        self._selecting = False
+        self.selection.add_listener(self._on_selection_changed)
+
+    @contextmanager
+    def batch(self, name="Batch"):
+        """Defer recompute, GUI refresh and view fitting until the block ends.
+
+        Everything inside the block runs in one document transaction, so the
+        whole batch is undone as a single step. Batches can be nested; only the
+        outermost one commits and flushes. If the block raises, the transaction
+        is aborted and the deferred work is dropped instead.
+        """
+        outermost = self._batch_depth == 0
+        if outermost:
+            self.doc.openTransaction(name)
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if outermost:
+                self.doc.abortTransaction()
+                self._pending.clear()
+                self._forget_removed()
+            raise
+        self._batch_depth -= 1
+        if outermost:
+            self.doc.commitTransaction()
+            self._flush_pending()
+
+    def _forget_removed(self):
+        """Drop registry entries and the selection for objects no longer in the document."""
+        for name in [name for name in self.objects if self.doc.getObject(name) is None]:
+            if self.objects[name] is self.selected:
+                self.selected = None
+            del self.objects[name]
+
+    @contextmanager
+    def _changing_selection(self):
+        """Change the FreeCAD selection from a command, which keeps selected/selected_edges itself."""
+        self._selecting = True
+        try:
+            yield
+        finally:
+            self._selecting = False
+
+    def _on_selection_changed(self, cache):
+        if self._selecting:
+            return
+        self.selected = cache.first(self.doc.Name)
+        self.selected_edges = cache.edges(self.doc.Name)
+
+    def process_many(self, commands, name="Batch"):
+        """Process a sequence of command strings as one batch and return their results."""
+        with self.batch(name):
+            return [self.process(command) for command in commands]
+
+    def _flush_pending(self):
+        """Run the recompute, GUI update and view fit deferred by a batch, once each."""
+        pending, self._pending = self._pending, set()
+        if "recompute" in pending:
+            self.doc.recompute()
+        if "gui" in pending:
+            FreeCADGui.updateGui()
+        if "fit" in pending:
+            view = self._active_view()
+            if view:
+                view.fitAll()
+
+    def _recompute(self):
+        """Recompute the document now, or once at the end of the current batch."""
+        if self._batch_depth:
+            self._pending.add("recompute")
+        else:
+            self.doc.recompute()
+
+    def _update_gui(self):
+        """Refresh the GUI now, or once at the end of the current batch."""
+        if self._batch_depth:
+            self._pending.add("gui")
+        else:
+            FreeCADGui.updateGui()
+
+    def _fit_view(self):
+        """Fit the active view to all objects now, or once at the end of the current batch."""
+        if self._batch_depth:
+            self._pending.add("fit")
+            return
+        view = self._active_view()
+        if view:
+            view.fitAll()
+
+    def _active_view(self):
+        """Return the active 3D view, or None when running without a GUI document."""
+        gui_doc = FreeCADGui.ActiveDocument
+        return gui_doc.ActiveView if gui_doc else None
+
+    def _geometry_of(self, obj):
+        """Return the cached ObjectGeometry of obj, recomputing it first if a batch left it out of date."""
+        if self._batch_depth and "Touched" in obj.State:
+            obj.recompute()
+        return self.geometry.get(obj)
+
+    def run_script(self, text, name="Script"):
+        """Validate a whole script, then run it as one batch and report per-command timing."""
+        try:
+            commands = parse_script(text)
+        except ValueError as e:
+            return f"Script not run:\n{e}"
+        if not commands:
+            return "Empty script"
+
+        lines = []
+        start = time.perf_counter()
+        with self.batch(name):
+            for line_number, command in commands:
+                command_start = time.perf_counter()
+                result = self.process(command)
+                elapsed = (time.perf_counter() - command_start) * 1000
+                lines.append(f"line {line_number}: {command} -> {result} ({elapsed:.2f} ms)")
+        total = (time.perf_counter() - start) * 1000
+        lines.append(f"Ran {len(commands)} commands in {total:.1f} ms")
+        return "\n".join(lines)
+
+    def _run_file(self, path):
+        """Run a script file: run path"""
+        if not path:
+            return "Usage: run file"
+        try:
+            with open(path) as f:
+                text = f.read()
+        except OSError as e:
+            return f"Cannot read {path}: {e.strerror}"
+        return self.run_script(text, name=f"Run {path}")
 
-        
     def process(self, command):
         """Process a command string and return a result message."""
+        # 'run' keeps the case of its path; several commands on one line run as a script
+        head, _, rest = command.strip().partition(" ")
+        if head.lower() == "run":
+            return self._run_file(rest.strip())
+        if ";" in command:
+            return self.run_script(command, name="Command line")
+
         words = command.lower().split()
         if not words:
             return "Empty command"
@@ -41,6 +272,8 @@ class CommandProcessor:
                 return self._rotate_object(words[1:])
             elif cmd == "fillet":
                 return self._fillet_edges(words[1:])
+            elif cmd in BOOLEAN_OPERATIONS:
+                return self._boolean(cmd, words[1:])
             elif cmd == "list":
                 return self._list_objects()
             elif cmd == "clear":
@@ -59,39 +292,39 @@ class CommandProcessor:
         
         try:
             length, width, height = map(float, args)
-            box_name = f"Box_{len(self.objects)}"
+            box_name = self.objects.allocate_name("Box")
             
-            print(f"Creating box: {box_name}")  # Debug print
+            logger.debug("Creating box: %s", box_name)
             box = self.doc.addObject("Part::Box", box_name)
             
-            print(f"Setting dimensions: {length}x{width}x{height}")  # Debug print
+            logger.debug("Setting dimensions: %sx%sx%s", length, width, height)
             box.Length = length
             box.Width = width
             box.Height = height
             
             # Explicitly set visibility
             if hasattr(box, "ViewObject"):
-                print("Setting ViewObject properties")  # Debug print
+                logger.debug("Setting ViewObject properties")
                 box.ViewObject.Visibility = True
                 box.ViewObject.ShapeColor = (1.0, 0.0, 0.0)  # Bright red for visibility
             
+            box_name = box.Name
             self.objects[box_name] = box
             
-            print("Recomputing document")  # Debug print
-            self.doc.recompute()
+            logger.debug("Recomputing document")
+            self._recompute()
             
             # Force GUI update
-            print("Updating GUI")  # Debug print
-            FreeCADGui.updateGui()
+            logger.debug("Updating GUI")
+            self._update_gui()
             
             # Center view on object
-            print("Adjusting view")  # Debug print
-            view = FreeCADGui.ActiveDocument.ActiveView
-            view.fitAll()
+            logger.debug("Adjusting view")
+            self._fit_view()
             
             return f"Created box {box_name}"
         except Exception as e:
-            print(f"Error in box creation: {str(e)}")  # Debug print
+            logger.warning("Error in box creation: %s", e)
             return f"Error: {str(e)}"
 
     
@@ -101,10 +334,10 @@ class CommandProcessor:
             return "Usage: sphere radius"
         try:
             radius = float(args[0])
-            sphere = self.doc.addObject("Part::Sphere", f"Sphere_{len(self.objects)}")
+            sphere = self.doc.addObject("Part::Sphere", self.objects.allocate_name("Sphere"))
             sphere.Radius = radius
             self.objects[sphere.Name] = sphere
-            self.doc.recompute()
+            self._recompute()
             return f"Created sphere {sphere.Name} (radius: {radius})"
         except ValueError:
             return "Error: Invalid radius for sphere"
@@ -115,30 +348,25 @@ class CommandProcessor:
             return "Usage: cylinder radius height"
         try:
             radius, height = map(float, args)
-            cylinder = self.doc.addObject("Part::Cylinder", f"Cylinder_{len(self.objects)}")
+            cylinder = self.doc.addObject("Part::Cylinder", self.objects.allocate_name("Cylinder"))
             cylinder.Radius = radius
             cylinder.Height = height
             self.objects[cylinder.Name] = cylinder
-            self.doc.recompute()
+            self._recompute()
             return f"Created cylinder {cylinder.Name} (radius: {radius}, height: {height})"
         except ValueError:
             return "Error: Invalid dimensions for cylinder"
     
-    def _list_objects(self):
-        """List all created objects"""
-        if not self.objects:
-            return "No objects created yet"
-        result = "Created objects:\n"
-        for name, obj in self.objects.items():
-            result += f"- {name}\n"
-        return result
-    
     def _clear_all(self):
         """Remove all objects"""
+        if self.jobs:
+            # Fillets of, and booleans involving, the removed objects
+            self.jobs.cancel_involving(self.objects.keys())
         for name in list(self.objects.keys()):
             self.doc.removeObject(name)
         self.objects.clear()
-        self.doc.recompute()
+        self.geometry.clear()
+        self._recompute()
         return "All objects cleared"
 
     
@@ -146,151 +374,178 @@ class CommandProcessor:
         """Select an object by name: select ObjectName"""
         if not args:
             return "Usage: select ObjectName"
-        name = args[0]
-        
-        # Try exact match first
-        if name in self.objects:
-            obj = self.objects[name]
-        else:
-            # Try case-insensitive match
-            name_lower = name.lower()
-            matches = {k: v for k, v in self.objects.items() 
-                    if k.lower() == name_lower}
-            if not matches:
-                return f"No object named {name}"
-            obj = next(iter(matches.values()))
-            name = next(iter(matches.keys()))
-        
-        # Clear current selection
-        FreeCADGui.Selection.clearSelection()
-        # Select the object 
-        FreeCADGui.Selection.addSelection(obj)
+        # Exact match first, then case-insensitive
+        match = self.objects.find(args[0])
+        if match is None:
+            return f"No object named {args[0]}"
+        name, obj = match
+        
+        # Select only this object
+        with self._changing_selection():
+            FreeCADGui.Selection.clearSelection()
+            FreeCADGui.Selection.addSelection(obj)
         self.selected = obj
 
         # Center view on object
         try:
-            view = FreeCADGui.ActiveDocument.ActiveView
-            bound_box = obj.Shape.BoundBox
-            view.fitAll()  # Fit view to all objects
+            self._fit_view()  # Fit view to all objects
             # Alternative methods if fitAll() doesn't work:
             # view.viewPosition((0,0,0), 10)  # Reset to default position
             # view.viewAxonometric()  # Set to axonometric view
         except Exception as e:
-            print(f"View centering error: {e}")
+            logger.warning("View centering error: %s", e)
         
         return f"Selected {name}"
     
     def _select_edge(self, args):
-        """Select an edge and view from appropriate side"""
-        if len(args) != 2:
-            return "Usage: edge ObjectName EdgeNumber"
-        
-        name, edge_num = args[0], args[1]
+        """Add edges to the edge selection and view from appropriate side
+
+        edge ObjectName EdgeSpec [EdgeSpec ...], where an EdgeSpec is an edge
+        number (3), a range (1-4), an edge type (line, circle, other) or "all".
+        Edges accumulate while they belong to the same object.
+        """
+        if len(args) < 2:
+            return "Usage: edge ObjectName EdgeNumber|First-Last|line|circle|all ..."
         
-        try:
-            edge_num = int(edge_num)
-        except ValueError:
-            return "Edge number must be an integer"
+        name = args[0]
         
         # Case insensitive object lookup
-        name_lower = name.lower()
-        matches = {k: v for k, v in self.objects.items() 
-                if k.lower() == name_lower}
-        if not matches:
+        match = self.objects.find(name)
+        if match is None:
             return f"No object named {name}"
-        
-        obj = next(iter(matches.values()))
-        name = next(iter(matches.keys()))
+        name, obj = match
         
         # Print total edges available
-        total_edges = len(obj.Shape.Edges)
-        print(f"\nObject {name} has {total_edges} edges")
-        
-        if edge_num <= 0 or edge_num > total_edges:
-            return f"Edge number must be between 1 and {total_edges}"
+        geometry = self._geometry_of(obj)
+        total_edges = len(geometry.edges)
+        logger.debug("Object %s has %s edges", name, total_edges)
         
-        # Clear current selection
-        FreeCADGui.Selection.clearSelection()
+        try:
+            edge_numbers = self._parse_edge_specs(args[1:], geometry)
+        except ValueError as e:
+            return str(e)
+        
+        with self._changing_selection():
+            # Start a new edge selection when switching objects
+            if not self.selected_edges or self.selected_edges[0][0] is not obj:
+                FreeCADGui.Selection.clearSelection()
+                self.selected_edges = []
+
+            # Select the edges, skipping ones already selected
+            already_selected = {num for _, num in self.selected_edges}
+            for num in edge_numbers:
+                if num not in already_selected:
+                    FreeCADGui.Selection.addSelection(obj, f"Edge{num}")
+                    self.selected_edges.append((obj, num))
+                    already_selected.add(num)
+        
+        if len(edge_numbers) > 1:
+            self._view_edge(geometry.edge_info(edge_numbers[-1] - 1))
+            return f"Selected {len(edge_numbers)} edges of {name} ({len(self.selected_edges)} selected)"
+        edge_num = edge_numbers[0]
         
         # Get edge information
-        edge = obj.Shape.Edges[edge_num - 1]
+        info = geometry.edge_info(edge_num - 1)
         
         # Debug information about the edge
-        print(f"\nEdge {edge_num} analysis:")
-        print(f"Edge type: {edge.Curve.__class__.__name__}")
-        print(f"Length: {edge.Length:.2f}")
+        logger.debug("Edge %s analysis:", edge_num)
+        logger.debug("Edge type: %s", info.curve_name)
+        logger.debug("Length: %.2f", info.length)
         
-        if hasattr(edge.Curve, 'Radius'):
-            print(f"Radius: {edge.Curve.Radius:.2f}")
+        if info.radius is not None:
+            logger.debug("Radius: %.2f", info.radius)
         
         # Get edge geometry
-        v1 = edge.Vertexes[0].Point if len(edge.Vertexes) > 0 else None
-        v2 = edge.Vertexes[1].Point if len(edge.Vertexes) > 1 else None
+        v1, v2 = info.start, info.end
         
-        if v1 and v2:
-            print(f"Start point: ({v1.x:.2f}, {v1.y:.2f}, {v1.z:.2f})")
-            print(f"End point: ({v2.x:.2f}, {v2.y:.2f}, {v2.z:.2f})")
+        if v1 is not None and v2 is not None:
+            logger.debug("Start point: (%.2f, %.2f, %.2f)", v1.x, v1.y, v1.z)
+            logger.debug("End point: (%.2f, %.2f, %.2f)", v2.x, v2.y, v2.z)
             
             # For linear edges
-            if isinstance(edge.Curve, Part.Line):
-                direction = FreeCAD.Vector(v2.x - v1.x, v2.y - v1.y, v2.z - v1.z).normalize()
-                print(f"Direction (linear): ({direction.x:.2f}, {direction.y:.2f}, {direction.z:.2f})")
+            if info.kind == "line":
+                direction = info.direction
+                logger.debug("Direction (linear): (%.2f, %.2f, %.2f)", direction.x, direction.y, direction.z)
             
             # For circular edges
-            elif isinstance(edge.Curve, Part.Circle):
-                center = edge.Curve.Center
-                axis = edge.Curve.Axis
-                print(f"Center: ({center.x:.2f}, {center.y:.2f}, {center.z:.2f})")
-                print(f"Axis: ({axis.x:.2f}, {axis.y:.2f}, {axis.z:.2f})")
-        
-        # Select the edge
-        FreeCADGui.Selection.addSelection(obj, f"Edge{edge_num}")
-        self.selected_edges = [(obj, edge_num)]
+            elif info.kind == "circle":
+                center = info.center
+                axis = info.axis
+                logger.debug("Center: (%.2f, %.2f, %.2f)", center.x, center.y, center.z)
+                logger.debug("Axis: (%.2f, %.2f, %.2f)", axis.x, axis.y, axis.z)
         
-        # Get view object
-        view = FreeCADGui.ActiveDocument.ActiveView
+        self._view_edge(info)
         
-        # Choose view based on edge type and orientation
-        if isinstance(edge.Curve, Part.Circle):
+        return f"Selected edge {edge_num} of {name}"
+
+    def _parse_edge_specs(self, specs, geometry):
+        """Turn edge specs into 1-based edge numbers, raising ValueError with a usage message."""
+        total_edges = len(geometry.edges)
+        edge_numbers = []
+        for spec in specs:
+            if spec == "all":
+                numbers = list(range(1, total_edges + 1))
+            elif spec in ("line", "circle", "other"):
+                numbers = geometry.edges_of_kind(spec)
+                if not numbers:
+                    raise ValueError(f"No {spec} edges")
+            else:
+                first, _, last = spec.partition("-")
+                try:
+                    first = int(first)
+                    last = int(last) if last else first
+                except ValueError:
+                    raise ValueError("Edge number must be an integer")
+                if first <= 0 or last > total_edges or first > last:
+                    raise ValueError(f"Edge number must be between 1 and {total_edges}")
+                numbers = list(range(first, last + 1))
+            edge_numbers.extend(numbers)
+        return edge_numbers
+
+    def _view_edge(self, info):
+        """Turn the view to face an edge, based on its type and orientation"""
+        view = self._active_view()
+        if not view:
+            return
+        
+        if info.kind == "circle":
             # For circular edges, view perpendicular to the circle's plane
-            axis = edge.Curve.Axis.normalize()
+            axis = info.axis
             
-            print("\nViewing circular edge...")
+            logger.debug("Viewing circular edge...")
             if abs(axis.z) > 0.9:  # Horizontal circle
-                print("Horizontal circle - using front view")
+                logger.debug("Horizontal circle - using front view")
                 view.viewFront()
             elif abs(axis.x) > 0.9:  # Circle in YZ plane
-                print("YZ plane circle - using left view")
+                logger.debug("YZ plane circle - using left view")
                 view.viewLeft()
             else:  # Circle in XZ plane
-                print("XZ plane circle - using top view")
+                logger.debug("XZ plane circle - using top view")
                 view.viewTop()
                 
-        elif isinstance(edge.Curve, Part.Line):
+        elif info.kind == "line" and info.direction is not None:
             # For linear edges, use previous logic for straight edges
-            direction = FreeCAD.Vector(v2.x - v1.x, v2.y - v1.y, v2.z - v1.z).normalize()
-            print("\nViewing linear edge...")
+            direction = info.direction
+            logger.debug("Viewing linear edge...")
             
             if abs(direction.z) > 0.9:  # Vertical
-                print("Vertical edge - using front view")
+                logger.debug("Vertical edge - using front view")
                 view.viewFront()
             elif abs(direction.y) > 0.9:  # Front-back
-                print("Front-back edge - using left view")
+                logger.debug("Front-back edge - using left view")
                 view.viewLeft()
             else:  # Left-right
-                print("Left-right edge - using top view")
+                logger.debug("Left-right edge - using top view")
                 view.viewTop()
                 
         else:
             # For other edge types, try to get a reasonable view
-            print(f"\nUnknown edge type: {edge.Curve.__class__.__name__}")
-            print("Using default front view")
+            logger.debug("Unknown edge type: %s", info.curve_name)
+            logger.debug("Using default front view")
             view.viewFront()
         
         # Ensure edge is visible
         view.fitAll()
-        
-        return f"Selected edge {edge_num} of {name}"
     
     def _select_edge_working(self, args):
         """Select an edge and view from appropriate side"""
@@ -305,21 +560,14 @@ class CommandProcessor:
             return "Edge number must be an integer"
         
         # Case insensitive object lookup
-        name_lower = name.lower()
-        matches = {k: v for k, v in self.objects.items() 
-                if k.lower() == name_lower}
-        if not matches:
+        match = self.objects.find(name)
+        if match is None:
             return f"No object named {name}"
-        
-        obj = next(iter(matches.values()))
-        name = next(iter(matches.keys()))
+        name, obj = match
         
         if edge_num <= 0 or edge_num > len(obj.Shape.Edges):
             return f"Edge number must be between 1 and {len(obj.Shape.Edges)}"
         
-        # Clear current selection
-        FreeCADGui.Selection.clearSelection()
-        
         # Get edge information
         edge = obj.Shape.Edges[edge_num - 1]
         v1 = edge.Vertexes[0].Point
@@ -328,14 +576,16 @@ class CommandProcessor:
         direction = FreeCAD.Vector(v2.x - v1.x, v2.y - v1.y, v2.z - v1.z).normalize()
         
         # Debug prints
-        print(f"\nEdge {edge_num} details:")
-        print(f"Start point: ({v1.x:.2f}, {v1.y:.2f}, {v1.z:.2f})")
-        print(f"End point: ({v2.x:.2f}, {v2.y:.2f}, {v2.z:.2f})")
-        print(f"Center: ({center.x:.2f}, {center.y:.2f}, {center.z:.2f})")
-        print(f"Direction: ({direction.x:.2f}, {direction.y:.2f}, {direction.z:.2f})")
-        
-        # Select the edge
-        FreeCADGui.Selection.addSelection(obj, f"Edge{edge_num}")
+        logger.debug("Edge %s details:", edge_num)
+        logger.debug("Start point: (%.2f, %.2f, %.2f)", v1.x, v1.y, v1.z)
+        logger.debug("End point: (%.2f, %.2f, %.2f)", v2.x, v2.y, v2.z)
+        logger.debug("Center: (%.2f, %.2f, %.2f)", center.x, center.y, center.z)
+        logger.debug("Direction: (%.2f, %.2f, %.2f)", direction.x, direction.y, direction.z)
+        
+        # Select only this edge
+        with self._changing_selection():
+            FreeCADGui.Selection.clearSelection()
+            FreeCADGui.Selection.addSelection(obj, f"Edge{edge_num}")
         self.selected_edges = [(obj, edge_num)]
         
         # Get view object
@@ -344,24 +594,24 @@ class CommandProcessor:
         # Choose view based on edge position and direction
         if abs(direction.z) > 0.9:  # Vertical edges
             if center.y < 5:  # Front vertical edges
-                print("Front vertical edge - using front view")
+                logger.debug("Front vertical edge - using front view")
                 view.viewFront()
             else:  # Back vertical edges
-                print("Back vertical edge - using rear view")
+                logger.debug("Back vertical edge - using rear view")
                 view.viewRear()
         elif abs(direction.y) > 0.9:  # Front-back edges
             if center.z < 5:  # Bottom front-back edges
-                print("Bottom front-back edge - using left view")
+                logger.debug("Bottom front-back edge - using left view")
                 view.viewLeft()
             else:  # Top front-back edges
-                print("Top front-back edge - using right view")
+                logger.debug("Top front-back edge - using right view")
                 view.viewRight()
         else:  # Left-right edges
             if center.z < 5:  # Bottom left-right edges
-                print("Bottom left-right edge - using top view")
+                logger.debug("Bottom left-right edge - using top view")
                 view.viewTop()
             else:  # Top left-right edges
-                print("Top left-right edge - using bottom view")
+                logger.debug("Top left-right edge - using bottom view")
                 view.viewBottom()
         
         # Ensure edge is visible
@@ -380,28 +630,100 @@ class CommandProcessor:
             radius = float(args[0])
             obj = self.selected_edges[0][0]  # Get the object
             edge_numbers = [edge_num for _, edge_num in self.selected_edges]
-            print(f"Filleting object {obj.Name}, edges {edge_numbers}, radius {radius}")  # Debug
-            edges = [obj.Shape.Edges[i-1] for i in edge_numbers]
-            
-            # Create fillet
-            filleted = obj.Shape.makeFillet(radius, edges)
-            
-            # Create new object with fillet
-            new_name = f"{obj.Name}_filleted"
-            new_obj = self.doc.addObject("Part::Feature", new_name)
-            new_obj.Shape = filleted
-            self.objects[new_name] = new_obj
-            
-            # Hide original object
-            obj.Visibility = False
-            
-            self.doc.recompute()
-            return f"Created fillet with radius {radius} on {new_name}"
+            logger.debug("Filleting object %s, edges %s, radius %s", obj.Name, edge_numbers, radius)
+            geometry = self._geometry_of(obj)
+
+            # Solve in the background unless a batch needs the result straight away
+            if self.jobs and not self._batch_depth:
+                filleted = self.fillets.lookup(geometry.shape, edge_numbers, radius)
+                if filleted is None:
+                    return self._submit_fillet(obj, geometry.shape, edge_numbers, radius)
+            else:
+                # Create fillet over every selected edge in one pass
+                filleted = self.fillets.fillet(geometry, edge_numbers, radius)
+            return self._install_fillet(obj, filleted, radius)
         except ValueError:
             return "Invalid radius for fillet"
         except Exception as e:
-            print(f"Fillet error details: {str(e)}")  # Debug
+            logger.warning("Fillet error details: %s", e)
             return f"Fillet failed: {str(e)}"
+
+    def _submit_fillet(self, obj, shape, edge_numbers, radius):
+        """Queue a fillet job; a newer fillet on the same object supersedes it."""
+        name = obj.Name
+
+        def on_done(brep, error):
+            if error is not None:
+                return f"Fillet failed: {error}"
+            if self.objects.get(name) is not obj:
+                return f"Fillet discarded: {name} no longer exists"
+            filleted = Part.Shape()
+            filleted.importBrepFromString(brep)
+            self.fillets.store(shape, edge_numbers, radius, filleted)
+            return self._install_fillet(obj, filleted, radius)
+
+        self.jobs.submit(("fillet", name), fillet_brep,
+                         (shape.exportBrepToString(), radius, sorted(set(edge_numbers))), on_done)
+        return f"Filleting {name} with radius {radius} in the background"
+
+    def _install_fillet(self, obj, filleted, radius):
+        """Add filleted as a new object replacing obj in the view."""
+        new_name = f"{obj.Name}_filleted"
+        new_obj = self.doc.addObject("Part::Feature", new_name)
+        new_obj.Shape = filleted
+        self.objects[new_obj.Name] = new_obj
+
+        # Hide original object
+        obj.Visibility = False
+
+        self._recompute()
+        return f"Created fillet with radius {radius} on {new_obj.Name}"
+
+    def _boolean(self, operation, args):
+        """Combine two objects: fuse|cut|common ObjectA ObjectB"""
+        if len(args) != 2:
+            return f"Usage: {operation} ObjectA ObjectB"
+        operands = []
+        for arg in args:
+            match = self.objects.find(arg)
+            if match is None:
+                return f"No object named {arg}"
+            operands.append(match[1])
+        obj_a, obj_b = operands
+        if obj_a is obj_b:
+            return f"{operation} needs two different objects"
+
+        try:
+            shape_a = self._geometry_of(obj_a).shape
+            shape_b = self._geometry_of(obj_b).shape
+            if not (self.jobs and not self._batch_depth):
+                return self._install_boolean(operation, obj_a, obj_b, getattr(shape_a, operation)(shape_b))
+
+            def on_done(brep, error):
+                if error is not None:
+                    return f"{operation.capitalize()} failed: {error}"
+                if self.objects.get(obj_a.Name) is not obj_a or self.objects.get(obj_b.Name) is not obj_b:
+                    return f"{operation.capitalize()} discarded: an input no longer exists"
+                result = Part.Shape()
+                result.importBrepFromString(brep)
+                return self._install_boolean(operation, obj_a, obj_b, result)
+
+            self.jobs.submit((operation, obj_a.Name, obj_b.Name), boolean_brep,
+                             (operation, shape_a.exportBrepToString(), shape_b.exportBrepToString()), on_done)
+            return f"Running {operation} of {obj_a.Name} and {obj_b.Name} in the background"
+        except Exception as e:
+            return f"{operation.capitalize()} failed: {str(e)}"
+
+    def _install_boolean(self, operation, obj_a, obj_b, shape):
+        """Add a boolean result as a new object and hide its inputs."""
+        name = self.objects.allocate_name(operation.capitalize())
+        new_obj = self.doc.addObject("Part::Feature", name)
+        new_obj.Shape = shape
+        self.objects[new_obj.Name] = new_obj
+        obj_a.Visibility = False
+        obj_b.Visibility = False
+        self._recompute()
+        return f"Created {new_obj.Name} from {operation} of {obj_a.Name} and {obj_b.Name}"
     
     def _move_object(self, args):
         """Move selected object: move x y z"""
@@ -416,8 +738,8 @@ class CommandProcessor:
             placement.Base.x += x
             placement.Base.y += y
             placement.Base.z += z
-            self.selected.Placement = placement
-            self.doc.recompute()
+            if not set_placement(self.selected, placement):
+                self._recompute()
             return f"Moved selected object by ({x}, {y}, {z})"
         except ValueError:
             return "Invalid coordinates for move"
@@ -431,26 +753,23 @@ class CommandProcessor:
             
         try:
             angle, x, y, z = map(float, args)
-            rotation_center = self.selected.Shape.BoundBox.Center
-            self.selected.Placement.rotate(rotation_center, FreeCAD.Vector(x, y, z), angle)
-            self.doc.recompute()
+            rotation_center = self._geometry_of(self.selected).bound_box.Center
+            placement = self.selected.Placement
+            placement.rotate(rotation_center, FreeCAD.Vector(x, y, z), angle)
+            if not set_placement(self.selected, placement):
+                self._recompute()
             return f"Rotated selected object by {angle} degrees around ({x}, {y}, z)"
         except ValueError:
             return "Invalid parameters for rotation"
         
     def _clear_selection(self):
         """Clear current selection"""
-        FreeCADGui.Selection.clearSelection()
+        with self._changing_selection():
+            FreeCADGui.Selection.clearSelection()
         self.selected = None
         self.selected_edges = []
         return "Selection cleared"
 
     def _list_objects(self):
         """List all created objects"""
-        if not self.objects:
-            return "No objects created yet"
-        result = "Created objects:\n"
-        for name, obj in self.objects.items():
-            selected = " (selected)" if obj == self.selected else ""
-            result += f"- {name}{selected}\n"
-        return result
\ No newline at end of file
+        return self.objects.listing(self.selected)
\ No newline at end of file
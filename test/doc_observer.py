@@ -0,0 +1,51 @@
+# Contains the document observer that tells the geometry caches when objects change
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+
+
+class DocumentChangeObserver:
+    """Keeps change counters for every object and for the scene as a whole.
+
+    Caches remember the revision they were built at and compare it with the
+    current one, instead of re-reading shapes to find out whether anything moved.
+    """
+
+    def __init__(self):
+        self.scene_revision = 0
+        self._revisions = {}  # (document name, object name) -> revision
+
+    def revision(self, obj):
+        """Return the change counter of one document object."""
+        return self._revisions.get((obj.Document.Name, obj.Name), 0)
+
+    def _bump(self, obj):
+        key = (obj.Document.Name, obj.Name)
+        self._revisions[key] = self._revisions.get(key, 0) + 1
+        self.scene_revision += 1
+
+    # FreeCAD document observer slots
+    def slotCreatedObject(self, obj):
+        self._bump(obj)
+
+    def slotDeletedObject(self, obj):
+        self._bump(obj)
+
+    def slotChangedObject(self, obj, prop):
+        self._bump(obj)
+
+    def slotRecomputedDocument(self, doc):
+        self.scene_revision += 1
+
+
+_observer = None
+
+
+def document_observer():
+    """Return the shared observer, registering it with FreeCAD on first use."""
+    global _observer
+    if _observer is None:
+        _observer = DocumentChangeObserver()
+        FreeCAD.addDocumentObserver(_observer)
+    return _observer
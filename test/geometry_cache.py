@@ -0,0 +1,153 @@
+# Contains the per-object topology and geometry cache used by edge commands
+from setup import setup_freecad_env
+setup_freecad_env()
+
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import FreeCAD
+import Part
+from doc_observer import document_observer
+
+EdgeInfo = namedtuple("EdgeInfo", "kind curve_name length start end direction center axis radius")
+EdgeInfo.__doc__ = """Classification of one edge: kind is "line", "circle" or "other"."""
+
+
+def classify_edge(edge):
+    """Describe an edge's curve type and the geometry the edge commands need."""
+    curve = edge.Curve
+    vertexes = edge.Vertexes
+    start = vertexes[0].Point if len(vertexes) > 0 else None
+    end = vertexes[1].Point if len(vertexes) > 1 else None
+    direction = center = axis = None
+    if isinstance(curve, Part.Line):
+        kind = "line"
+        if start is not None and end is not None:
+            direction = FreeCAD.Vector(end.x - start.x, end.y - start.y, end.z - start.z).normalize()
+    elif isinstance(curve, Part.Circle):
+        kind = "circle"
+        center = curve.Center
+        axis = FreeCAD.Vector(curve.Axis).normalize()
+    else:
+        kind = "other"
+    return EdgeInfo(kind, curve.__class__.__name__, edge.Length, start, end,
+                    direction, center, axis, getattr(curve, "Radius", None))
+
+
+class ObjectGeometry:
+    """Topology and geometry of one object's shape, read once per revision.
+
+    Every obj.Shape.Edges read builds a fresh list of Python wrappers, so the edge
+    list is kept here and edges are classified only the first time they are asked for.
+    """
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.edges = shape.Edges
+        self.bound_box = shape.BoundBox
+        self._edge_info = [None] * len(self.edges)
+        self._vertices = None
+
+    def edge_info(self, index):
+        """Return the EdgeInfo of edge `index` (0-based)."""
+        info = self._edge_info[index]
+        if info is None:
+            info = self._edge_info[index] = classify_edge(self.edges[index])
+        return info
+
+    def edges_of_kind(self, kind):
+        """Return the 1-based numbers of every edge of one kind ("line", "circle" or "other")."""
+        return [i + 1 for i in range(len(self.edges)) if self.edge_info(i).kind == kind]
+
+    @property
+    def vertices(self):
+        """(N, 3) array of the shape's vertex positions."""
+        if self._vertices is None:
+            self._vertices = np.array([tuple(v.Point) for v in self.shape.Vertexes],
+                                      dtype=np.float64).reshape(-1, 3)
+        return self._vertices
+
+
+class GeometryCache:
+    """ObjectGeometry per document object, invalidated through the document observer.
+
+    An entry is valid while the object's change counter is unchanged, so a recompute,
+    a placement change or a property edit all cause a rebuild on next access.
+    """
+
+    def __init__(self):
+        self.observer = document_observer()
+        self._entries = {}  # (document name, object name) -> (revision, ObjectGeometry)
+
+    def get(self, obj):
+        key = (obj.Document.Name, obj.Name)
+        revision = self.observer.revision(obj)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != revision:
+            entry = self._entries[key] = (revision, ObjectGeometry(obj.Shape))
+        return entry[1]
+
+    def discard(self, obj):
+        self._entries.pop((obj.Document.Name, obj.Name), None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+BOOLEAN_OPERATIONS = ("fuse", "cut", "common")
+
+
+def _shape_from_brep(brep):
+    shape = Part.Shape()
+    shape.importBrepFromString(brep)
+    return shape
+
+
+def fillet_brep(brep, radius, edge_numbers):
+    """Worker job: fillet 1-based edges of a BREP shape and return the result as BREP."""
+    shape = _shape_from_brep(brep)
+    edges = shape.Edges
+    return shape.makeFillet(radius, [edges[i - 1] for i in edge_numbers]).exportBrepToString()
+
+
+def boolean_brep(operation, brep_a, brep_b):
+    """Worker job: fuse, cut or common two BREP shapes and return the result as BREP."""
+    shape_a = _shape_from_brep(brep_a)
+    shape_b = _shape_from_brep(brep_b)
+    return getattr(shape_a, operation)(shape_b).exportBrepToString()
+
+
+class FilletMemo:
+    """LRU memo of fillet results keyed on shape hash, edge set and radius.
+
+    Repeating a fillet preview, or redoing one after undo, reuses the solved shape
+    instead of running makeFillet again. Each entry keeps its source shape alive and
+    is checked with isSame, so a reused hash can never return the wrong result.
+    """
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._results = OrderedDict()  # (hash, edge numbers, radius) -> (source shape, result)
+
+    def lookup(self, shape, edge_numbers, radius):
+        """Return a memoized fillet result, or None."""
+        key = (shape.hashCode(), frozenset(edge_numbers), radius)
+        entry = self._results.get(key)
+        if entry is None or not entry[0].isSame(shape):
+            return None
+        self._results.move_to_end(key)
+        return entry[1]
+
+    def store(self, shape, edge_numbers, radius, result):
+        self._results[(shape.hashCode(), frozenset(edge_numbers), radius)] = (shape, result)
+        if len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    def fillet(self, geometry, edge_numbers, radius):
+        """Fillet the given 1-based edges of geometry.shape in a single makeFillet call."""
+        result = self.lookup(geometry.shape, edge_numbers, radius)
+        if result is None:
+            edges = [geometry.edges[i - 1] for i in sorted(set(edge_numbers))]
+            result = geometry.shape.makeFillet(radius, edges)
+            self.store(geometry.shape, edge_numbers, radius, result)
+        return result
@@ -0,0 +1,85 @@
+# Contains the background job queue for heavy geometry operations (fillets, booleans)
+import itertools
+import time
+from collections import deque
+
+from PySide2 import QtCore
+from PySide2.QtCore import Signal
+
+
+class GeometryJob:
+    def __init__(self, job_id, key, on_done):
+        self.id = job_id
+        self.key = key
+        self.on_done = on_done
+        self.future = None
+        self.submitted = time.perf_counter()
+
+
+class GeometryJobQueue(QtCore.QObject):
+    """Runs geometry jobs in FreeCAD console worker processes.
+
+    Input shapes travel as BREP strings. When a job finishes, its on_done callback
+    runs on the GUI thread with the result BREP (or the error) and returns a message
+    for the history pane. Submitting a job for a key that already has one in flight
+    supersedes it: the old job is cancelled, or its result discarded if it already
+    started.
+    """
+    job_done = Signal(str)       # message from a job's on_done callback
+    depth_changed = Signal(int)  # jobs in flight
+    _finished = Signal(object)   # carries a GeometryJob from the pool thread to the GUI thread
+
+    def __init__(self, pool_factory):
+        super().__init__()
+        self._pool_factory = pool_factory
+        self._ids = itertools.count(1)
+        self._in_flight = {}  # key -> newest GeometryJob
+        self.completed = 0
+        self.latencies = deque(maxlen=100)  # seconds, most recent jobs
+        self._finished.connect(self._on_finished)
+
+    @property
+    def depth(self):
+        return len(self._in_flight)
+
+    def submit(self, key, func, args, on_done):
+        """Queue func(*args) in a worker; on_done(result, error) runs on the GUI thread."""
+        self.cancel(key)
+        job = GeometryJob(next(self._ids), key, on_done)
+        job.future = self._pool_factory().submit(func, *args)
+        self._in_flight[key] = job
+        job.future.add_done_callback(lambda _, job=job: self._finished.emit(job))
+        self.depth_changed.emit(self.depth)
+        return job.id
+
+    def cancel(self, key):
+        """Cancel the job in flight for key, if any; a running job's result is discarded."""
+        job = self._in_flight.pop(key, None)
+        if job is not None:
+            job.future.cancel()
+            self.depth_changed.emit(self.depth)
+
+    def cancel_involving(self, names):
+        """Cancel every job in flight whose key names one of the given objects."""
+        names = set(names)
+        for key in [key for key in self._in_flight if names.intersection(key[1:])]:
+            self.cancel(key)
+
+    def stats(self):
+        mean = sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+        return {"depth": self.depth, "completed": self.completed, "mean_latency": mean}
+
+    def _on_finished(self, job):
+        if self._in_flight.get(job.key) is not job:
+            return  # Superseded or cancelled
+        del self._in_flight[job.key]
+        self.depth_changed.emit(self.depth)
+
+        latency = time.perf_counter() - job.submitted
+        self.latencies.append(latency)
+        self.completed += 1
+        try:
+            message = job.on_done(job.future.result(), None)
+        except Exception as e:
+            message = job.on_done(None, e)
+        self.job_done.emit(f"{message} (job {job.id}, {latency * 1000:.0f} ms)")
@@ -1,14 +1,23 @@
 # test/gesture_control.py
+import logging
 import math
 import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
 import FreeCAD
 import FreeCADGui
 from commands import CommandProcessor
+from camera_orbit import CameraOrbitController
+from selection_cache import selection_cache
 import mediapipe as mp
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QPainter, QColor, QPen
 from PySide2.QtWidgets import QWidget, QLabel
 
+logger = logging.getLogger(__name__)
+
 class GestureCameraController:
     def __init__(self):
         self.fist_start_position = None
@@ -43,12 +52,12 @@ class GestureCameraController:
                 'position': palm_center
             }
         elif is_fist and self.is_controlling:
-            # Continue control - calculate relative position
-            dx, dy = self._calculate_movement_from_palm(palm_center)
-            roll = dx / self.circle_radius * 2.0
-            pitch = -dy / self.circle_radius * 2.0
-            yaw = 0  # Placeholder
+            # Continue control - calculate relative position (control may have started by pointing)
             if self.fist_start_position:
+                dx, dy = self._calculate_movement_from_palm(palm_center)
+                roll = dx / self.circle_radius * 2.0
+                pitch = -dy / self.circle_radius * 2.0
+                yaw = 0  # Placeholder
                 return {
                     'type': 'camera_rotate',
                     'yaw': yaw,
@@ -161,22 +170,23 @@ class GestureHandler:
         self.object_manager = object_manager
         self.camera_controller = camera_controller
         self.is_rotate_mode = False
+        self.camera_orbit = CameraOrbitController()
 
     def process_gesture(self, gesture_data):
         """Process the detected gesture and perform actions."""
         if gesture_data['type'] == 'point_start':
             self.is_rotate_mode = True
-            print("Rotate mode activated.")
+            logger.debug("Rotate mode activated")
 
         elif gesture_data['type'] == 'object_rotate' and self.is_rotate_mode:
             yaw = gesture_data.get('yaw', 0)
             pitch = gesture_data.get('pitch', 0)
             roll = gesture_data.get('roll', 0)
-            print(f"Object rotation data - Yaw: {yaw}, Pitch: {pitch}, Roll: {roll}")
+            logger.debug("Object rotation data - yaw: %s, pitch: %s, roll: %s", yaw, pitch, roll)
             self.object_manager.rotate_selected_object(yaw, pitch, roll)
 
         elif gesture_data['type'] == 'control_start':
-            print("Move mode activated.")
+            logger.debug("Move mode activated")
 
         elif gesture_data['type'] == 'object_move':
             dx = gesture_data.get('dx', 0)
@@ -185,12 +195,14 @@ class GestureHandler:
 
         elif gesture_data['type'] == 'control_end':
             self.is_rotate_mode = False
-            print("Control ended.")
+            logger.debug("Control ended")
 
     def handle_object_translation(self, gesture_data):
         """Translate the selected object."""
         dx, dy = gesture_data.get('dx', 0), gesture_data.get('dy', 0)
-        selected_object = FreeCADGui.Selection.getSelection()[0]
+        selected_object = selection_cache().first()
+        if selected_object is None:
+            return
         selected_object.Placement.Base.x += dx
         selected_object.Placement.Base.y += dy
         FreeCADGui.updateGui()
@@ -198,14 +210,17 @@ class GestureHandler:
     def rotate_selected_object(self, yaw, pitch, roll):
         """Rotate the selected object."""
         try:
-            selected_object = FreeCADGui.Selection.getSelection()[0]
+            selected_object = selection_cache().first()
+            if selected_object is None:
+                logger.debug("No object selected")
+                return
             # Create a FreeCAD rotation
             rotation = FreeCAD.Rotation(roll, pitch, yaw)
             selected_object.Placement.Rotation = selected_object.Placement.Rotation.multiply(rotation)
             FreeCADGui.updateGui()
-            print(f"Rotated {selected_object.Name} by (Yaw: {yaw}, Pitch: {pitch}, Roll: {roll})")
+            logger.debug("Rotated %s by (yaw: %s, pitch: %s, roll: %s)", selected_object.Name, yaw, pitch, roll)
         except Exception as e:
-            print(f"Error rotating object: {e}")
+            logger.error("Error rotating object: %s", e)
 
     def handle_camera_control(self, gesture_data):
         """Control the camera with gestures."""
@@ -215,31 +230,8 @@ class GestureHandler:
         rotate_camera(yaw, pitch)
 
     def _rotate_camera(self, yaw, pitch, roll):
-        """Enhanced camera rotation with smooth transitions."""
-        try:
-            view = FreeCADGui.ActiveDocument.ActiveView
-
-            # Scale factors for smoother rotation
-            yaw_scale = 5.0
-            pitch_scale = 5.0
-
-            if abs(yaw) > 0.01:
-                rotation_angle = yaw * yaw_scale
-                view.viewRotateLeft(rotation_angle if yaw > 0 else -rotation_angle)
-
-            if abs(pitch) > 0.01:
-                current_dir = view.getViewDirection()
-                new_dir = FreeCAD.Vector(
-                    current_dir.x,
-                    current_dir.y + pitch * pitch_scale,
-                    current_dir.z
-                )
-                view.setViewDirection(new_dir)
-
-            view.redraw()
-
-        except Exception as e:
-            print(f"Camera rotation error: {e}")
+        """Orbit the camera smoothly, with inertia, at a speed set by the gesture."""
+        self.camera_orbit.orbit(yaw, pitch, roll, dead_zone=0.01)
 
 class GestureVisualizer(QWidget):
     def __init__(self, parent=None):
@@ -300,7 +292,7 @@ class EnhancedServerConnect:
             self.server.bind(('localhost', 12340))
             self.server.listen(1)
         except Exception as e:
-            print(f"Server setup error: {e}")
+            logger.error("Server setup error: %s", e)
 
     def process_server_data(self, data):
         """Enhanced data processing with gesture recognition."""
@@ -319,18 +311,18 @@ class EnhancedServerConnect:
                 # Handle object creation
                 cmd = data[7:].strip()
                 result = self.command_processor.process(cmd)
-                print(f"Command result: {result}")
+                logger.info("Command result: %s", result)
             elif data.startswith("CONTROL_END"):
                 self.gesture_visualizer.update_control_state(False)
             elif data.startswith("POINT_DIR:"):
-                print(f"Received POINT_DIR data: {data}")
+                logger.debug("Received POINT_DIR data: %s", data)
                 try:
                     # Extract the part after "POINT_DIR:" (remove the prefix)
                     values = data[len("POINT_DIR:"):].strip()  # Remove the "POINT_DIR:" part
 
                     # Split the remaining string by commas
                     direction_values = values.split(",")
-                    print(f"Direction values after split: {direction_values}")
+                    logger.debug("Direction values after split: %s", direction_values)
 
                     # Ensure there are exactly 3 values (x, y, z)
                     if len(direction_values) != 3:
@@ -342,13 +334,13 @@ class EnhancedServerConnect:
                     direction_z = float(direction_values[2])
 
                     # Print the parsed coordinates for debugging
-                    print(f"Received pointing direction: x={direction_x}, y={direction_y}, z={direction_z}")
+                    logger.debug("Received pointing direction: x=%s, y=%s, z=%s", direction_x, direction_y, direction_z)
 
                     # Add your logic to handle the pointing direction here, e.g., rotate an object.
                     self.rotate_selected_object(direction_x, direction_y, direction_z)
 
                 except ValueError as e:
-                    print(f"Error processing direction data: {e}")
+                    logger.warning("Error processing direction data: %s", e)
                     return
 
             else:
@@ -363,7 +355,7 @@ class EnhancedServerConnect:
                         # Update any finger position visualization here
 
         except Exception as e:
-            print(f"Error processing data: {e}")
+            logger.warning("Error processing data: %s", e)
 
     def start_server_in_thread(self):
         """Start server in background thread."""
@@ -373,14 +365,14 @@ class EnhancedServerConnect:
 
     def start_server(self):
         """Run the server loop."""
-        print("Server starting...")
+        logger.info("Server starting...")
         while True:
             try:
                 client, addr = self.server.accept()
-                print(f"Connected: {addr}")
+                logger.info("Connected: %s", addr)
                 self.handle_client(client)
             except Exception as e:
-                print(f"Server error: {e}")
+                logger.error("Server error: %s", e)
             finally:
                 if 'client' in locals():
                     client.close()
@@ -398,5 +390,5 @@ class EnhancedServerConnect:
                     message, buffer = buffer.split('\n', 1)
                     self.process_server_data(message)
             except Exception as e:
-                print(f"Client handling error: {e}")
+                logger.error("Client handling error: %s", e)
                 break
\ No newline at end of file
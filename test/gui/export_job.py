@@ -0,0 +1,130 @@
+# gui/export_job.py
+import os
+import threading
+import time
+
+from PySide2 import QtCore
+from PySide2.QtCore import Signal
+
+from mesh_io import stl_file_size, write_binary_stl, write_indexed_mesh
+from tessellation import estimate_facets_brep, shape_revision, tessellate_brep
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class ExportJob(QtCore.QObject):
+    """Tessellates and writes a mesh export without blocking the GUI.
+
+    The GUI thread snapshots each object when the job is created: its revision, and
+    either its cached tessellation or its shape as a BREP string. The live shapes are
+    never touched again. A background thread sends the BREP strings to worker
+    processes, which do all OCC work, and writes the file. It reports back through
+    signals, so connect them only to methods of QObjects living in the GUI thread:
+    Qt then queues the calls to that thread, while a plain function or lambda would
+    run in the background thread.
+    """
+    estimated = Signal(int, int)  # expected facets, expected STL bytes
+    progress = Signal(int, int)  # objects done, objects total
+    finished = Signal(str)       # summary line
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, items, file_name, cache, pool=None):
+        super().__init__()
+        # (object name, revision, deviation, cached (points, triangles) or None, BREP or None)
+        self.items = items
+        self.file_name = file_name
+        self.cache = cache
+        self.pool = pool  # Needed when any item has to be tessellated
+        self._cancel = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def snapshot(objects, deviation_of, cache):
+        """Build job items on the GUI thread; only cache misses are serialized."""
+        items = []
+        for obj in objects:
+            shape = obj.Shape
+            revision = shape_revision(shape)
+            deviation = deviation_of(shape)
+            cached = cache.lookup_revision(obj.Name, revision, deviation)
+            brep = shape.exportBrepToString() if cached is None else None
+            items.append((obj.Name, revision, deviation, cached, brep))
+        return items
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Ask the job to stop; it stops at the next object boundary."""
+        self._cancel.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        futures = []
+        try:
+            start = time.perf_counter()
+            missing = [i for i, item in enumerate(self.items) if item[3] is None]
+            if missing and self.pool is None:
+                raise RuntimeError("Export needs the worker pool to tessellate")
+            # Estimates are queued first so they come back before the full tessellations
+            estimates = {i: self.pool.submit(estimate_facets_brep, self.items[i][4], self.items[i][2])
+                         for i in missing}
+            tessellations = {i: self.pool.submit(tessellate_brep, self.items[i][4], self.items[i][2])
+                             for i in missing}
+            futures = list(estimates.values()) + list(tessellations.values())
+
+            facets = self._estimate(estimates)
+            self.estimated.emit(facets, stl_file_size(facets))
+            parts = self._tessellate(tessellations)
+            if self._cancel.is_set():
+                raise ExportCancelled()
+            if self.file_name.lower().endswith(".stl"):
+                write_binary_stl(self.file_name, parts)
+            else:
+                write_indexed_mesh(self.file_name, parts)
+            elapsed = time.perf_counter() - start
+
+            size_kb = os.path.getsize(self.file_name) / 1024
+            summary = (f"Exported {len(self.items)} object(s) to {self.file_name} "
+                       f"({size_kb:.0f} KB, {elapsed:.2f} s)")
+            if not self.file_name.lower().endswith(".stl"):
+                stl_kb = stl_file_size(sum(len(triangles) for _, triangles in parts)) / 1024
+                summary += f", STL would be {stl_kb:.0f} KB"
+            self.finished.emit(summary)
+        except ExportCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _estimate(self, estimates):
+        """Expected facet count: exact for cached objects, probed in the workers for the rest."""
+        total = sum(len(item[3][1]) for item in self.items if item[3] is not None)
+        for future in estimates.values():
+            if self._cancel.is_set():
+                raise ExportCancelled()
+            total += future.result()
+        return total
+
+    def _tessellate(self, tessellations):
+        """Collect the workers' tessellations in order, reporting progress in between."""
+        total = len(self.items)
+        results = [item[3] for item in self.items]
+        self.progress.emit(total - len(tessellations), total)
+        for done, (i, future) in enumerate(tessellations.items(), start=total - len(tessellations) + 1):
+            if self._cancel.is_set():
+                raise ExportCancelled()
+            name, revision, deviation, _, _ = self.items[i]
+            points, triangles = future.result()
+            self.cache.store_revision(name, revision, deviation, points, triangles)
+            results[i] = (points, triangles)
+            self.progress.emit(done, total)
+        return results
@@ -2,15 +2,22 @@ from PySide2 import QtCore, QtGui, QtWidgets
 import FreeCAD
 import FreeCADGui
 import Part
-import Mesh
 from PySide2.QtCore import Signal
 from commands import CommandProcessor
+from tessellation import TessellationCache, object_deviation, relative_tolerance
+from worker_pool import create_pool
+from geometry_jobs import GeometryJobQueue
+from gui.export_job import ExportJob
+from gui.widgets import HISTORY_MAX_BLOCKS
 import threading
 
 from test_commands import ServerConnect
 
 
 class CommandWindow(QtWidgets.QWidget):
+    cancel_export_requested = Signal()
+    HISTORY_MAX_BLOCKS = HISTORY_MAX_BLOCKS  # Oldest lines are dropped beyond this
+
     def __init__(self, submit_callback, export_callback, parent=None):
         super().__init__(parent, QtCore.Qt.Window)
         self.setWindowTitle("Command Input")
@@ -20,12 +27,13 @@ class CommandWindow(QtWidgets.QWidget):
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         
-        # Command history
-        self.history_display = QtWidgets.QTextEdit()
+        # Command history: plain text, bounded so long sessions don't grow it forever
+        self.history_display = QtWidgets.QPlainTextEdit()
         self.history_display.setReadOnly(True)
+        self.history_display.setMaximumBlockCount(self.HISTORY_MAX_BLOCKS)
         self.history_display.setMinimumHeight(100)
         self.history_display.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: rgba(40, 40, 40, 255);
                 color: white;
                 border: 1px solid #555;
@@ -71,7 +79,7 @@ class CommandWindow(QtWidgets.QWidget):
         # Add export controls
         export_layout = QtWidgets.QHBoxLayout()
         
-        # Quality slider
+        # Quality slider: sets the deviation relative to each object's size (300 = 0.1%)
         quality_label = QtWidgets.QLabel("Quality:")
         quality_label.setStyleSheet("color: white;")
         self.quality_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
@@ -90,8 +98,12 @@ class CommandWindow(QtWidgets.QWidget):
             }
         """)
         
+        # Export format: STL repeats shared vertices, PLY and OBJ are indexed
+        self.format_combo = QtWidgets.QComboBox()
+        self.format_combo.addItems(["STL", "PLY", "OBJ"])
+        
         # Export button
-        export_button = QtWidgets.QPushButton("Export STL")
+        export_button = QtWidgets.QPushButton("Export")
         export_button.setStyleSheet("""
             QPushButton {
                 background-color: #444;
@@ -108,9 +120,22 @@ class CommandWindow(QtWidgets.QWidget):
         
         export_layout.addWidget(quality_label)
         export_layout.addWidget(self.quality_slider)
+        export_layout.addWidget(self.format_combo)
         export_layout.addWidget(export_button)
         layout.addLayout(export_layout)
         
+        # Export progress, shown while a background export runs
+        progress_layout = QtWidgets.QHBoxLayout()
+        self.export_progress = QtWidgets.QProgressBar()
+        self.export_progress.setTextVisible(True)
+        self.cancel_export_button = QtWidgets.QPushButton("Cancel")
+        self.cancel_export_button.clicked.connect(self.cancel_export_requested.emit)
+        progress_layout.addWidget(self.export_progress)
+        progress_layout.addWidget(self.cancel_export_button)
+        layout.addLayout(progress_layout)
+        self.export_progress.hide()
+        self.cancel_export_button.hide()
+        
         # Connect signals
         def submit_command():
             command = self.command_input.text()
@@ -125,6 +150,34 @@ class CommandWindow(QtWidgets.QWidget):
         self.resize(400, 300)
         self.position_window()
     
+    def on_export_started(self):
+        self.export_progress.setValue(0)
+        self.export_progress.show()
+        self.cancel_export_button.show()
+
+    def on_export_estimated(self, facets, stl_bytes):
+        self.history_display.appendPlainText(f"Estimated {facets} facets (~{stl_bytes / 1024:.0f} KB as STL)")
+
+    def on_export_progress(self, done, total):
+        self.export_progress.setMaximum(max(total, 1))
+        self.export_progress.setValue(done)
+
+    def on_export_finished(self, summary):
+        self._hide_export_progress()
+        self.history_display.appendPlainText(summary)
+
+    def on_export_failed(self, message):
+        self._hide_export_progress()
+        self.history_display.appendPlainText(f"Error: {message}")
+
+    def on_export_cancelled(self):
+        self._hide_export_progress()
+        self.history_display.appendPlainText("Export cancelled")
+
+    def _hide_export_progress(self):
+        self.export_progress.hide()
+        self.cancel_export_button.hide()
+
     def position_window(self):
         """Position the window in the center of the FreeCAD window"""
         main_window = FreeCADGui.getMainWindow()
@@ -149,8 +202,19 @@ class BoxGeneratorApp(QtWidgets.QMainWindow):
         # White bg for handtracking window
         self.setup_viewer()
 
+        # Worker processes shared by exports and geometry jobs, created on first use
+        self.worker_pool = None
+
+        # Fillets and booleans run in the workers so the GUI keeps rendering
+        self.geometry_jobs = GeometryJobQueue(self._worker_pool)
+
         # Initialize command processor
-        self.command_processor = CommandProcessor(self.doc)
+        self.command_processor = CommandProcessor(self.doc, self.geometry_jobs)
+
+        # Tessellations reused across exports until an object changes
+        self.tessellation_cache = TessellationCache()
+        self.export_job = None
+        self.export_status = ""
         
         # Set up the main window
         self.setWindowTitle("Modeling Interface")
@@ -172,6 +236,10 @@ class BoxGeneratorApp(QtWidgets.QMainWindow):
             self.export_stl
         )
 
+        self.command_window.cancel_export_requested.connect(self.cancel_export)
+        self.geometry_jobs.job_done.connect(self.command_window.history_display.appendPlainText)
+        self.geometry_jobs.depth_changed.connect(self.on_job_depth_changed)
+
         # Initialize ServerConnect and pass the signal's emit method as a callback
         self.server_connect = ServerConnect(self.data_received.emit, self.doc)
 
@@ -187,46 +255,74 @@ class BoxGeneratorApp(QtWidgets.QMainWindow):
         self.command_window.show()
 
     def export_stl(self):
-        """Export all objects in the model to STL."""
+        """Export all objects in the model to STL, or to indexed PLY/OBJ, in the background."""
         try:
+            if self.export_job is not None and self.export_job.is_running():
+                self.status_label.setText("Export already running")
+                return
+            
             if not self.command_processor.objects:
                 raise Exception("No objects to export")
-                
-            self.status_label.setText("Exporting...")
-            QtWidgets.QApplication.processEvents()
             
-            # Create a compound shape from all visible objects
-            shapes = []
-            for obj in self.command_processor.objects.values():
-                if hasattr(obj, 'Shape') and obj.Visibility:
-                    shapes.append(obj.Shape)
+            # Each object's deviation is the slider's relative tolerance scaled by its size
+            tolerance = relative_tolerance(self.command_window.quality_slider.value())
+            
+            # Snapshot the visible objects here. obj.Shape shares its geometry with the
+            # document, so the job gets cached meshes or BREP strings, never the shapes
+            objects = [obj for obj in self.command_processor.objects.values()
+                       if hasattr(obj, 'Shape') and obj.Visibility]
+            items = ExportJob.snapshot(objects, lambda shape: object_deviation(shape, tolerance),
+                                       self.tessellation_cache)
                     
-            if not shapes:
+            if not items:
                 raise Exception("No visible objects to export")
                 
-            # Create compound if multiple shapes, otherwise use single shape
-            if len(shapes) > 1:
-                shape = Part.Compound(shapes)
-            else:
-                shape = shapes[0]
-                
-            # Create mesh with simple linear scale
-            mesh = Mesh.Mesh()
-            mesh_deviation = 0.05  # Fixed small value for high resolution
-            
-            mesh.addFacets(shape.tessellate(mesh_deviation))
+            export_format = self.command_window.format_combo.currentText()
+            file_name = f"exported_model.{export_format.lower()}"
             
-            stl_name = "exported_model.stl"
-            mesh.write(stl_name)
+            # Cached objects are reused; misses are tessellated in worker processes
+            pool = self._worker_pool() if any(item[3] is None for item in items) else None
+            self.export_job = ExportJob(items, file_name, self.tessellation_cache, pool)
+            self.export_job.estimated.connect(self.command_window.on_export_estimated)
+            self.export_job.progress.connect(self.command_window.on_export_progress)
+            self.export_job.finished.connect(self.command_window.on_export_finished)
+            self.export_job.failed.connect(self.command_window.on_export_failed)
+            self.export_job.cancelled.connect(self.command_window.on_export_cancelled)
+            # The job emits from its worker thread: connect only to methods of GUI-thread
+            # QObjects, which Qt calls through the event loop
+            self.export_status = f"Exported: {file_name} (tolerance: {tolerance:.3%} of size)"
+            self.export_job.finished.connect(self.on_export_finished)
+            self.export_job.failed.connect(self.on_export_failed)
+            self.export_job.cancelled.connect(self.on_export_cancelled)
             
-            self.status_label.setText(f"Exported: {stl_name} (deviation: {mesh_deviation})")
-            self.command_window.history_display.append(
-                f"Exported {len(shapes)} object(s) to {stl_name}"
-            )
+            self.status_label.setText("Exporting...")
+            self.command_window.on_export_started()
+            self.export_job.start()
                 
         except Exception as e:
             self.status_label.setText(f"Error: {str(e)}")
-            self.command_window.history_display.append(f"Error: {str(e)}")
+            self.command_window.history_display.appendPlainText(f"Error: {str(e)}")
+
+    def cancel_export(self):
+        if self.export_job is not None:
+            self.export_job.cancel()
+
+    def on_export_finished(self, summary):
+        self.status_label.setText(self.export_status)
+
+    def on_export_failed(self, message):
+        self.status_label.setText(f"Error: {message}")
+
+    def on_export_cancelled(self):
+        self.status_label.setText("Ready")
+
+    def _worker_pool(self):
+        if self.worker_pool is None:
+            self.worker_pool = create_pool()
+        return self.worker_pool
+
+    def on_job_depth_changed(self, depth):
+        self.status_label.setText(f"Geometry jobs running: {depth}" if depth else "Ready")
 
     def setup_viewer(self):
         """Set up the viewer with white background"""
@@ -250,9 +346,10 @@ class BoxGeneratorApp(QtWidgets.QMainWindow):
         try:
             self.status_label.setText(f"Processing: {command}")
             result = self.command_processor.process(command)
-            self.command_window.history_display.append(f"\n> {command}")
-            self.command_window.history_display.append(result)
-            self.status_label.setText("Ready")
+            self.command_window.history_display.appendPlainText(f"\n> {command}")
+            self.command_window.history_display.appendPlainText(result)
+            if not self.geometry_jobs.depth:
+                self.status_label.setText("Ready")
             
             if result.startswith("Created box"):
                 box_name = result.split()[2]
@@ -260,7 +357,7 @@ class BoxGeneratorApp(QtWidgets.QMainWindow):
             
         except Exception as e:
             self.status_label.setText(f"Error: {str(e)}")
-            self.command_window.history_display.append(f"Error: {str(e)}")
+            self.command_window.history_display.appendPlainText(f"Error: {str(e)}")
     
     def _show_help(self):
         """Show available commands in the history display."""
@@ -270,17 +367,24 @@ class BoxGeneratorApp(QtWidgets.QMainWindow):
 - cylinder radius height
 - list
 - clear
+- run script_file
+
+Separate several commands with ';' to run them as one step.
 
 Examples:
 > box 10 20 30
 > sphere 15
 > cylinder 10 40
+> box 10 10 10; sphere 5; cylinder 2 20
 """
-        self.command_window.history_display.append(help_text)
+        self.command_window.history_display.appendPlainText(help_text)
     
     
     def closeEvent(self, event):
         """Handle application closing."""
+        self.cancel_export()
         self.command_window.close()
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown(wait=False)
         super().closeEvent(event)
 
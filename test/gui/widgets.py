@@ -1,14 +1,17 @@
 # gui/widgets.py
 from PySide2 import QtCore, QtWidgets
 
+HISTORY_MAX_BLOCKS = 2000  # History panes drop their oldest lines beyond this
+
 def create_command_area(submit_callback):
     """Create the command input and history area."""
     command_group = QtWidgets.QGroupBox("Command Input")
     layout = QtWidgets.QVBoxLayout()
     
     # Command history display
-    history_display = QtWidgets.QTextEdit()
+    history_display = QtWidgets.QPlainTextEdit()
     history_display.setReadOnly(True)
+    history_display.setMaximumBlockCount(HISTORY_MAX_BLOCKS)
     history_display.setMinimumHeight(200)
     layout.addWidget(history_display)
     
@@ -27,7 +30,7 @@ def create_command_area(submit_callback):
         command = command_input.text()
         if command.strip():
             submit_callback(command)
-            history_display.append(f"> {command}")
+            history_display.appendPlainText(f"> {command}")
             command_input.clear()
     
     submit_button.clicked.connect(submit_command)
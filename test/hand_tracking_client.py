@@ -1,3 +1,4 @@
+import logging
 import socket
 import cv2
 import mediapipe as mp
@@ -6,6 +7,11 @@ import sys
 import numpy as np
 import math
 
+from app_logging import setup_logging
+from readiness import launch_time
+
+logger = logging.getLogger(__name__)
+
 # Initialize MediaPipe hands with optimization flagss
 mp_hands = mp.solutions.hands
 hands = mp_hands.Hands(
@@ -116,7 +122,7 @@ class HandGestureDetector:
         is_peace = index_extended and middle_extended and (ring_curled or pinky_curled)
 
         if is_peace:
-            print("PEACE SIGN DETECTED!")
+            logger.debug("Peace sign detected")
 
         return is_peace
 
@@ -214,7 +220,7 @@ class HandGestureDetector:
 
         if self.initial_fist_position is None:
             self.initial_fist_position = palm_center
-            print("Initial fist position recorded:", palm_center)
+            logger.debug("Initial fist position recorded: %s", palm_center)
             return 0, 0, 0
 
         # Calculate movement vector components
@@ -226,7 +232,7 @@ class HandGestureDetector:
         scaled_dx = dx * movement_scale
         scaled_dy = dy * movement_scale
 
-        print(f"Movement vector: dx={scaled_dx:.2f}, dy={scaled_dy:.2f}")
+        logger.debug("Movement vector: dx=%.2f, dy=%.2f", scaled_dx, scaled_dy)
 
         # Return the scaled movement vector
         return scaled_dx, scaled_dy, "VECTOR"
@@ -242,11 +248,17 @@ class HandGestureDetector:
         return None
 
 class HandTrackingClient:
+    SERVER_ADDRESS = ('localhost', 12340)
+
     def __init__(self):
         self.client = None
         self.cap = None
         self.gesture_detector = HandGestureDetector()
         self.running = True
+        self.server_address = self.SERVER_ADDRESS
+        self.backoff = Backoff()  # Paces reconnect attempts after the server goes away
+        self.launched = launch_time()
+        self.first_gesture_sent = False
 
     def setup_camera(self):
         self.cap = cv2.VideoCapture(0)
@@ -254,9 +266,46 @@ class HandTrackingClient:
             raise RuntimeError("Failed to open camera")
 
     def setup_connection(self, server_address):
-        self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        if not connect_with_retry(self.client, server_address):
+        self.server_address = server_address
+        self.client = connect_with_backoff(server_address)
+        if self.client is None:
             raise RuntimeError("Failed to connect to server")
+        logger.info("Connected %.2f s after launch", time.time() - self.launched)
+
+    def send(self, message):
+        """Send one message; while the server is away, drop it and reconnect in the background.
+
+        Reconnect attempts are paced by self.backoff, so a missing server costs the
+        tracking loop an occasional connect attempt instead of a blocking retry loop.
+        """
+        if self.client is None:
+            if not self.backoff.due():
+                return False
+            try:
+                self.client = socket.create_connection(self.server_address, timeout=0.2)
+            except OSError:
+                self.backoff.failed()
+                return False
+            self.client.settimeout(None)
+            self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.backoff.reset()
+            logger.info("Reconnected to server")
+        try:
+            self.client.sendall(message.encode('utf-8'))
+            return True
+        except OSError as e:
+            logger.warning("Lost connection to server: %s", e)
+            self.client.close()
+            self.client = None
+            self.backoff.failed()
+            return False
+
+    def send_gesture(self, message):
+        """Send a gesture command, logging how long after launch the first one went out."""
+        if self.send(message) and not self.first_gesture_sent:
+            self.first_gesture_sent = True
+            logger.info("First gesture (%s) sent %.2f s after launch",
+                        message.split(":", 1)[0], time.time() - self.launched)
 
     def process_frame(self, frame):
         frame = cv2.flip(frame, 1)
@@ -271,8 +320,8 @@ class HandTrackingClient:
 
                 # Send finger coordinates
                 coord_str = format_coordinates(hand_landmarks, frame.shape)
-                print(f"Sending finger coords: {coord_str}")
-                self.client.send(coord_str.encode('utf-8'))
+                logger.debug("Sending finger coords: %s", coord_str.strip())
+                self.send(coord_str)
 
                 is_peace = self.gesture_detector.detect_peace_sign(hand_landmarks)
                 if is_peace:
@@ -286,12 +335,17 @@ class HandTrackingClient:
                     # Determine direction based on position relative to center
                     direction = "LEFT" if screen_x < frame_center_x else "RIGHT"
 
-                    print(f"Peace sign detected moving {direction}!")
+                    logger.debug("Peace sign detected moving %s", direction)
                     peace_cmd = f"PEACE:{direction}\n"
-                    self.client.send(peace_cmd.encode('utf-8'))
+                    self.send_gesture(peace_cmd)
 
                 # Check for fist gesture and handle movement
+                was_fist = self.gesture_detector.is_fist
                 self.gesture_detector.is_fist = self.gesture_detector.detect_fist(hand_landmarks)
+                if was_fist and not self.gesture_detector.is_fist:
+                    # Fist released: the server commits the drag, the next fist starts a new one
+                    self.gesture_detector.initial_fist_position = None
+                    self.send("CONTROL_END\n")
 
                 # Check for pointing gesture
                 self.gesture_detector.is_pointing = self.gesture_detector.detect_pointing(hand_landmarks)
@@ -303,7 +357,7 @@ class HandTrackingClient:
                     screen_x = int(pinch_point['x'] * frame.shape[1])
                     screen_y = int(pinch_point['y'] * frame.shape[0])
                     pinch_cmd = f"PINCH:{screen_x},{screen_y}\n"
-                    self.client.send(pinch_cmd.encode('utf-8'))
+                    self.send_gesture(pinch_cmd)
 
                     # Draw pinch point
                     cv2.circle(frame, (screen_x, screen_y), 5, (0, 255, 0), -1)
@@ -317,8 +371,8 @@ class HandTrackingClient:
                     direction_z = int(pointing_vector['z'] * 100)
 
                     point_cmd = f"POINT_DIR:{direction_x},{direction_y},{direction_z}\n"
-                    print(f"Sending POINT_DIR command: {point_cmd}")
-                    self.client.send(point_cmd.encode('utf-8'))
+                    logger.debug("Sending POINT_DIR command: %s", point_cmd.strip())
+                    self.send_gesture(point_cmd)
 
                     # Visualize the pointing vector on the frame (projected direction)
                     index_tip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
@@ -334,7 +388,12 @@ class HandTrackingClient:
                         hand_landmarks, time.time())
                     if dx is not None:
                         movement_cmd = f"VECTOR:{dx:.2f},{dy:.2f}\n"
-                        self.client.send(movement_cmd.encode('utf-8'))
+                        self.send_gesture(movement_cmd)
+        elif self.gesture_detector.is_fist:
+            # Hand lost mid-drag: end it like a release
+            self.gesture_detector.is_fist = False
+            self.gesture_detector.initial_fist_position = None
+            self.send("CONTROL_END\n")
 
         # Add gesture status to frame
         status = "FIST" if self.gesture_detector.is_fist else "TRACKING"
@@ -345,7 +404,7 @@ class HandTrackingClient:
     def run(self):
         try:
             self.setup_camera()
-            self.setup_connection(('localhost', 12340))
+            self.setup_connection(self.SERVER_ADDRESS)
 
             while self.running and self.cap.isOpened():
                 ret, frame = self.cap.read()
@@ -359,14 +418,12 @@ class HandTrackingClient:
                     break
 
         except Exception as e:
-            print(f"Error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Hand tracking error: %s", e)
         finally:
             self.cleanup()
 
     def cleanup(self):
-        print("\nCleaning up resources...")
+        logger.info("Cleaning up resources...")
         if self.cap is not None:
             self.cap.release()
         if self.client is not None:
@@ -376,27 +433,54 @@ class HandTrackingClient:
                 pass
             self.client.close()
         cv2.destroyAllWindows()
-        print("Cleanup complete")
+        logger.info("Cleanup complete")
+
+class Backoff:
+    """Exponential backoff: delays start at `initial` seconds and double up to `maximum`."""
+
+    def __init__(self, initial=0.05, maximum=2.0):
+        self.initial = initial
+        self.maximum = maximum
+        self.delay = initial
+        self.next_attempt = 0.0
+
+    def due(self):
+        return time.monotonic() >= self.next_attempt
+
+    def failed(self):
+        self.next_attempt = time.monotonic() + self.delay
+        self.delay = min(self.delay * 2, self.maximum)
+
+    def reset(self):
+        self.delay = self.initial
+        self.next_attempt = 0.0
 
-def connect_with_retry(client, server_address, max_attempts=5):
-    """Attempt to connect to server with retries."""
-    for attempt in range(max_attempts):
+
+def connect_with_backoff(server_address, timeout=30.0, backoff=None):
+    """Connect to the server, retrying with exponential backoff; return the socket or None."""
+    backoff = backoff or Backoff()
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        attempt += 1
         try:
-            print(f"Attempting to connect to server (attempt {attempt + 1}/{max_attempts})...")
-            client.connect(server_address)
-            print("Connected successfully!")
-            return True
-        except ConnectionRefusedError:
-            if attempt < max_attempts - 1:
-                print("Connection refused. Retrying in 2 seconds...")
-                time.sleep(2)
-            else:
-                print("Could not connect to server after maximum attempts")
-                return False
+            client = socket.create_connection(server_address, timeout=1.0)
+            client.settimeout(None)
+            # Gesture messages are small and latency-bound: send each one right away
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            logger.info("Connected to server (attempt %d)", attempt)
+            return client
+        except OSError as e:
+            # Refused, reset, unreachable or timed out: the server may still be starting
+            if time.monotonic() + backoff.delay > deadline:
+                logger.error("Could not connect to server within %.0f s: %s", timeout, e)
+                return None
+            logger.debug("Connection failed (%s), retrying in %.2f s", e, backoff.delay)
+            time.sleep(backoff.delay)
+            backoff.failed()
         except Exception as e:
-            print(f"Unexpected error while connecting: {e}")
-            return False
-    return False
+            logger.error("Unexpected error while connecting: %s", e)
+            return None
 
 def format_coordinates(hand_landmarks, frame_shape):
     """Matrix format: finger_id,x,y;finger_id,x,y;..."""
@@ -419,10 +503,11 @@ def format_coordinates(hand_landmarks, frame_shape):
     return ";".join(finger_coords) + "\n"
 
 if __name__ == "__main__":
+    setup_logging()
     client = HandTrackingClient()
     try:
         client.run()
     except KeyboardInterrupt:
-        print("\nStopping hand tracking...")
+        logger.info("Stopping hand tracking...")
     finally:
         client.cleanup()
\ No newline at end of file
@@ -0,0 +1,86 @@
+# Contains the interaction level of detail used while gestures move the view or objects
+import logging
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+from PySide2 import QtCore
+
+logger = logging.getLogger(__name__)
+
+# View provider properties set on objects drawn coarse during an interaction
+LOD_MODES = {
+    # Only the bounding box and vertices are drawn; switching needs no new tessellation
+    "boundingbox": {"BoundingBox": True, "DisplayMode": "Points"},
+    # Coarser tessellation: fewer triangles for the same shapes, but every object is
+    # re-tessellated when LOD engages and again at full quality on restore
+    "deviation": {"Deviation": 5.0, "AngularDeflection": 45.0},
+}
+
+
+class InteractionLOD(QtCore.QObject):
+    """Draws the objects not being worked on coarsely while a gesture is in progress.
+
+    Continuous gestures call engage(); the first call switches every visible object
+    except the kept ones to the display settings of `mode`, later calls only
+    restart the idle timer. After `idle_ms` without a call, each object gets back
+    the exact settings it had.
+    """
+
+    def __init__(self, doc, mode="boundingbox", idle_ms=400):
+        super().__init__()
+        if mode not in LOD_MODES:
+            raise ValueError(f"Unknown LOD mode '{mode}', expected one of {tuple(LOD_MODES)}")
+        self.doc = doc
+        self.mode = mode
+        self.enabled = True
+        self.saved = {}  # Object name -> {property: value before engage}
+
+        self.idle_timer = QtCore.QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(idle_ms)
+        self.idle_timer.timeout.connect(self.restore)
+
+    @property
+    def active(self):
+        return bool(self.saved)
+
+    def engage(self, keep=()):
+        """Start or extend an interaction; objects in keep stay at full quality."""
+        if not self.enabled:
+            return
+        keep_names = {obj.Name for obj in keep if obj is not None}
+        if not self.active:
+            settings = LOD_MODES[self.mode]
+            for obj in self.doc.Objects:
+                view = getattr(obj, "ViewObject", None)
+                if obj.Name in keep_names or view is None or not view.Visibility:
+                    continue
+                props = {prop: value for prop, value in settings.items() if hasattr(view, prop)}
+                if not props:
+                    continue
+                self.saved[obj.Name] = {prop: getattr(view, prop) for prop in props}
+                for prop, value in props.items():
+                    setattr(view, prop, value)
+        else:
+            # The kept object may have changed since the interaction started
+            for name in keep_names & set(self.saved):
+                self._restore_object(name, self.saved.pop(name))
+        self.idle_timer.start()
+
+    def restore(self):
+        """Give every coarse object its full-quality display settings back."""
+        self.idle_timer.stop()
+        saved, self.saved = self.saved, {}
+        for name, props in saved.items():
+            self._restore_object(name, props)
+
+    def _restore_object(self, name, props):
+        obj = self.doc.getObject(name)
+        if obj is None:
+            return  # Deleted during the interaction
+        try:
+            for prop, value in props.items():
+                setattr(obj.ViewObject, prop, value)
+        except Exception as e:
+            logger.error("Error restoring display of %s: %s", name, e)
@@ -9,8 +9,10 @@ setup_freecad_env()
 from PySide2 import QtWidgets
 import FreeCADGui
 from gui.main_window import BoxGeneratorApp
+from app_logging import setup_logging
 
 if __name__ == "__main__":
+    setup_logging()
     try:
         # Create Qt Application
         app = QtWidgets.QApplication(sys.argv)
@@ -0,0 +1,150 @@
+# Contains mesh file writers that stream NumPy tessellation arrays to disk
+import numpy as np
+
+STL_HEADER_SIZE = 80
+STL_COUNT_SIZE = 4
+
+# One binary STL facet: normal, three vertices and the attribute byte count (50 bytes, unpadded)
+STL_RECORD = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2"),
+])
+
+
+def facet_normals(corners):
+    """Return unit normals for an (N, 3, 3) array of triangle corners; degenerate facets get zero."""
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+    return normals
+
+
+def _fill_stl_records(records, points, triangles):
+    corners = points[triangles]
+    records["vertices"] = corners
+    records["normal"] = facet_normals(corners)
+    records["attribute"] = 0
+
+
+def _stl_header(text):
+    return text.encode("ascii", "replace")[:STL_HEADER_SIZE].ljust(STL_HEADER_SIZE, b" ")
+
+
+def write_binary_stl(path, parts, header="Exported by hand tracking modeling interface"):
+    """Write (points, triangles) parts to a binary STL file and return the facet count.
+
+    Parts are converted one at a time, so memory use is bounded by the largest part
+    rather than the whole model. When parts is a list the file size is known up front
+    and records are written straight into a memory-mapped file; otherwise they are
+    streamed and the facet count is patched into the header at the end.
+    """
+    if isinstance(parts, (list, tuple)):
+        return _write_binary_stl_mapped(path, parts, header)
+
+    count = 0
+    with open(path, "wb") as f:
+        f.write(_stl_header(header))
+        f.write(np.uint32(0).tobytes())
+        for points, triangles in parts:
+            records = np.empty(len(triangles), dtype=STL_RECORD)
+            _fill_stl_records(records, points, triangles)
+            records.tofile(f)
+            count += len(triangles)
+        f.seek(STL_HEADER_SIZE)
+        f.write(np.uint32(count).tobytes())
+    return count
+
+
+def _write_binary_stl_mapped(path, parts, header):
+    count = sum(len(triangles) for _, triangles in parts)
+    with open(path, "wb") as f:
+        f.write(_stl_header(header))
+        f.write(np.uint32(count).tobytes())
+        f.truncate(STL_HEADER_SIZE + STL_COUNT_SIZE + count * STL_RECORD.itemsize)
+    if not count:
+        return 0
+
+    records = np.memmap(path, dtype=STL_RECORD, mode="r+",
+                        offset=STL_HEADER_SIZE + STL_COUNT_SIZE, shape=(count,))
+    start = 0
+    for points, triangles in parts:
+        end = start + len(triangles)
+        _fill_stl_records(records[start:end], points, triangles)
+        start = end
+    records.flush()
+    del records
+    return count
+
+
+def stl_file_size(facet_count):
+    """Size in bytes of a binary STL file holding facet_count facets."""
+    return STL_HEADER_SIZE + STL_COUNT_SIZE + facet_count * STL_RECORD.itemsize
+
+
+def merge_parts(parts):
+    """Concatenate (points, triangles) parts into one indexed mesh, offsetting the indices."""
+    offsets = np.cumsum([0] + [len(points) for points, _ in parts[:-1]])
+    points = np.concatenate([p for p, _ in parts]) if parts else np.empty((0, 3))
+    triangles = (np.concatenate([t + offset for (_, t), offset in zip(parts, offsets)])
+                 if parts else np.empty((0, 3), dtype=np.int32))
+    return points, triangles
+
+
+def weld_vertices(points, triangles, tolerance=1e-6):
+    """Merge vertices that fall in the same tolerance-sized grid cell.
+
+    Tessellation repeats every vertex shared by neighbouring faces; welding them
+    makes the mesh indexed. Triangles that collapse after welding are dropped.
+    """
+    keys = np.round(points / tolerance).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    welded = inverse.reshape(-1)[triangles].astype(np.int32)
+    keep = ((welded[:, 0] != welded[:, 1]) &
+            (welded[:, 1] != welded[:, 2]) &
+            (welded[:, 0] != welded[:, 2]))
+    return points[first], welded[keep]
+
+
+def write_binary_ply(path, points, triangles):
+    """Write an indexed mesh as little-endian binary PLY."""
+    header = (
+        "ply\n"
+        "format binary_little_endian 1.0\n"
+        f"element vertex {len(points)}\n"
+        "property float x\n"
+        "property float y\n"
+        "property float z\n"
+        f"element face {len(triangles)}\n"
+        "property list uchar int vertex_indices\n"
+        "end_header\n"
+    )
+    faces = np.empty(len(triangles), dtype=[("count", "u1"), ("indices", "<i4", (3,))])
+    faces["count"] = 3
+    faces["indices"] = triangles
+    with open(path, "wb") as f:
+        f.write(header.encode("ascii"))
+        points.astype("<f4").tofile(f)
+        faces.tofile(f)
+
+
+def write_obj(path, points, triangles):
+    """Write an indexed mesh as Wavefront OBJ text (face indices are 1-based)."""
+    with open(path, "w") as f:
+        np.savetxt(f, points, fmt="v %.6f %.6f %.6f")
+        np.savetxt(f, triangles + 1, fmt="f %d %d %d")
+
+
+def write_indexed_mesh(path, parts, tolerance=1e-6):
+    """Weld (points, triangles) parts into one indexed mesh and write it as .ply or .obj.
+
+    Returns the (vertex, face) counts written.
+    """
+    points, triangles = weld_vertices(*merge_parts(parts), tolerance=tolerance)
+    if path.lower().endswith(".ply"):
+        write_binary_ply(path, points, triangles)
+    elif path.lower().endswith(".obj"):
+        write_obj(path, points, triangles)
+    else:
+        raise ValueError(f"Unsupported indexed mesh format: {path}")
+    return len(points), len(triangles)
@@ -0,0 +1,184 @@
+# Contains the motion engine that turns gesture velocities into smooth object motion
+import logging
+import time
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+from PySide2 import QtCore
+import FreeCAD
+from commands import set_placement
+
+logger = logging.getLogger(__name__)
+
+
+def find_transform_node(obj):
+    """Return the SoTransform that places obj's view provider in the scene, or None."""
+    root = getattr(getattr(obj, "ViewObject", None), "RootNode", None)
+    if root is None:
+        return None
+    for i in range(root.getNumChildren()):
+        child = root.getChild(i)
+        if child.getTypeId().getName() == "Transform":
+            return child
+    return None
+
+
+class DragPreview:
+    """Shows an object at a new placement by moving only its scene-graph transform.
+
+    The document is not touched while previewing: no recompute, no undo entry and
+    no re-tessellation, so a preview frame costs the same in any document. commit()
+    writes Placement and recomputes once.
+    """
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.placement = FreeCAD.Placement(obj.Placement)
+        self.transform = find_transform_node(obj)
+
+    @property
+    def available(self):
+        return self.transform is not None
+
+    def show(self, placement):
+        self.placement = placement
+        base = placement.Base
+        self.transform.translation.setValue(base.x, base.y, base.z)
+        self.transform.rotation.setValue(*placement.Rotation.Q)
+
+    def commit(self):
+        if not set_placement(self.obj, self.placement):
+            self.obj.Document.recompute()
+
+
+class MotionEngine(QtCore.QObject):
+    """Moves and rotates one object at the velocities set by gestures.
+
+    Gesture messages only set target velocities. A GUI-thread timer integrates them
+    over the real time between ticks and makes one Placement update per tick, so the
+    speed does not depend on how often messages arrive and each frame costs the same.
+    A velocity that is not refreshed within `hold` seconds drops to zero, and the
+    timer stops while nothing moves.
+
+    Between begin_preview() and end_preview() the target is only moved on screen
+    (see DragPreview) and its Placement is written once, at the end.
+    """
+
+    def __init__(self, tick_ms=16, hold=0.25, max_dt=0.1):
+        super().__init__()
+        self.hold = hold
+        self.max_dt = max_dt  # Longest step integrated at once, so a stalled GUI does not jump
+        self.target = None
+        self.angular_velocity = (0.0, 0.0, 0.0)  # Yaw, pitch, roll in degrees per second
+        self.linear_velocity = FreeCAD.Vector()  # mm per second
+        self._angular_until = 0.0
+        self._linear_until = 0.0
+        self._last_tick = None
+        self.ticks = 0
+        self.preview = None  # DragPreview of the target during a drag
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.setInterval(tick_ms)
+        self.timer.timeout.connect(self.tick)
+
+    @property
+    def is_moving(self):
+        return self.timer.isActive()
+
+    def _retarget(self, obj):
+        if obj is not self.target:
+            self.end_preview()
+            self.target = obj
+            self.angular_velocity = (0.0, 0.0, 0.0)
+            self.linear_velocity = FreeCAD.Vector()
+
+    def set_angular_velocity(self, obj, yaw, pitch, roll):
+        """Rotate obj about its own axes at the given degrees per second."""
+        self._retarget(obj)
+        self.angular_velocity = (yaw, pitch, roll)
+        self._angular_until = time.perf_counter() + self.hold
+        self._start()
+
+    def set_linear_velocity(self, obj, velocity):
+        """Move obj at velocity (a FreeCAD.Vector in mm per second)."""
+        self._retarget(obj)
+        self.linear_velocity = FreeCAD.Vector(velocity)
+        self._linear_until = time.perf_counter() + self.hold
+        self._start()
+
+    def begin_preview(self, obj):
+        """Start a drag of obj that only moves it on screen until end_preview().
+
+        Returns False, and leaves motion writing Placement directly, when obj has
+        no transform node to move.
+        """
+        self._retarget(obj)
+        if self.preview is None:
+            preview = DragPreview(obj)
+            if not preview.available:
+                return False
+            self.preview = preview
+        return True
+
+    def end_preview(self):
+        """Write the previewed placement to the document, once. Returns True if there was one."""
+        preview, self.preview = self.preview, None
+        if preview is None:
+            return False
+        self.linear_velocity = FreeCAD.Vector()
+        try:
+            preview.commit()
+        except Exception as e:
+            logger.error("Error committing drag: %s", e)
+        return True
+
+    def stop_rotation(self):
+        self.angular_velocity = (0.0, 0.0, 0.0)
+
+    def stop(self):
+        """Stop all motion now."""
+        self.angular_velocity = (0.0, 0.0, 0.0)
+        self.linear_velocity = FreeCAD.Vector()
+        self.timer.stop()
+        self._last_tick = None
+
+    def _start(self):
+        if not self.timer.isActive():
+            self._last_tick = time.perf_counter()
+            self.timer.start()
+
+    def tick(self):
+        now = time.perf_counter()
+        dt = min(now - self._last_tick, self.max_dt)
+        self._last_tick = now
+
+        if now > self._angular_until:
+            self.angular_velocity = (0.0, 0.0, 0.0)
+        if now > self._linear_until:
+            self.linear_velocity = FreeCAD.Vector()
+        yaw, pitch, roll = self.angular_velocity
+        rotating = any(self.angular_velocity)
+        moving = self.linear_velocity.Length > 0
+        if not (rotating or moving) or self.target is None:
+            self.stop()
+            return
+
+        preview = self.preview
+        try:
+            placement = preview.placement if preview else self.target.Placement
+            if rotating:
+                placement = placement.multiply(FreeCAD.Placement(
+                    FreeCAD.Vector(0, 0, 0), FreeCAD.Rotation(yaw * dt, pitch * dt, roll * dt)))
+            if moving:
+                placement.Base = placement.Base + self.linear_velocity * dt
+            if preview:
+                preview.show(placement)
+            elif not set_placement(self.target, placement):
+                self.target.Document.recompute()
+            self.ticks += 1
+        except Exception as e:
+            logger.warning("Motion stopped: %s", e)
+            self.preview = self.target = None
+            self.stop()
@@ -0,0 +1,88 @@
+# Contains the registry CommandProcessor keeps its created objects in
+from collections.abc import MutableMapping
+
+
+class ObjectRegistry(MutableMapping):
+    """Created objects by name, with case-insensitive and by-type indexes.
+
+    Behaves like the name -> object dict it replaces, but case-insensitive lookup
+    and type queries are O(1) and generated names are never handed out twice,
+    even after objects are deleted.
+    """
+
+    def __init__(self):
+        self._objects = {}   # name -> object, in creation order
+        self._lower = {}     # lowercase name -> names sharing it, oldest first
+        self._by_type = {}   # TypeId -> {name: object}
+        self._counters = {}  # name prefix -> next number to try
+
+    def allocate_name(self, prefix):
+        """Return a new name of the form Prefix_N that has never been used in this registry."""
+        number = self._counters.get(prefix, 0)
+        while f"{prefix}_{number}".lower() in self._lower:
+            number += 1
+        self._counters[prefix] = number + 1
+        return f"{prefix}_{number}"
+
+    def find(self, name):
+        """Look up by exact name, then case-insensitively. Returns (name, object) or None."""
+        if name in self._objects:
+            return name, self._objects[name]
+        names = self._lower.get(name.lower())
+        if not names:
+            return None
+        return names[0], self._objects[names[0]]
+
+    def of_type(self, type_id):
+        """Return the objects of one FreeCAD type, e.g. "Part::Box", in creation order."""
+        return list(self._by_type.get(type_id, {}).values())
+
+    def listing(self, selected=None):
+        """Return the "Created objects" text for the list command."""
+        if not self._objects:
+            return "No objects created yet"
+        result = "Created objects:\n- " + "\n- ".join(self._objects) + "\n"
+        name = getattr(selected, "Name", None)
+        if name is not None and self._objects.get(name) is selected:
+            result = result.replace(f"\n- {name}\n", f"\n- {name} (selected)\n", 1)
+        return result
+
+    @staticmethod
+    def _type_of(obj):
+        return getattr(obj, "TypeId", type(obj).__name__)
+
+    def __getitem__(self, name):
+        return self._objects[name]
+
+    def __setitem__(self, name, obj):
+        if name in self._objects:
+            del self[name]
+        self._objects[name] = obj
+        self._lower.setdefault(name.lower(), []).append(name)
+        self._by_type.setdefault(self._type_of(obj), {})[name] = obj
+
+    def __delitem__(self, name):
+        obj = self._objects.pop(name)
+        names = self._lower[name.lower()]
+        names.remove(name)
+        if not names:
+            del self._lower[name.lower()]
+        of_type = self._by_type[self._type_of(obj)]
+        del of_type[name]
+        if not of_type:
+            del self._by_type[self._type_of(obj)]
+
+    def __iter__(self):
+        return iter(self._objects)
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __contains__(self, name):
+        return name in self._objects
+
+    def clear(self):
+        """Remove every object; name counters are kept so names stay unique."""
+        self._objects.clear()
+        self._lower.clear()
+        self._by_type.clear()
@@ -0,0 +1,196 @@
+# Contains ray picking against a bounding volume hierarchy of the scene's objects
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import math
+
+import numpy as np
+from PySide2 import QtCore
+import FreeCAD
+import FreeCADGui
+import Part
+from doc_observer import document_observer
+
+
+def ray_box_entry(lo, hi, origin, inv_direction):
+    """Slab test: distance along the ray where it enters the box, or None if it misses.
+
+    inv_direction holds 1/d per axis, or None where the ray is parallel to that axis.
+    """
+    t_near, t_far = -math.inf, math.inf
+    for axis in range(3):
+        inv = inv_direction[axis]
+        if inv is None:
+            if origin[axis] < lo[axis] or origin[axis] > hi[axis]:
+                return None
+            continue
+        t1 = (lo[axis] - origin[axis]) * inv
+        t2 = (hi[axis] - origin[axis]) * inv
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_near = max(t_near, t1)
+        t_far = min(t_far, t2)
+        if t_near > t_far:
+            return None
+    if t_far < 0:
+        return None
+    return max(t_near, 0.0)
+
+
+class BoundingVolumeHierarchy:
+    """Median-split BVH over axis-aligned boxes.
+
+    Built once with NumPy; traversal uses plain floats, which is faster than NumPy
+    scalars for the handful of node tests a single ray needs.
+    """
+
+    def __init__(self, mins, maxs, leaf_size=4):
+        self.mins = np.asarray(mins, dtype=np.float64).reshape(-1, 3)
+        self.maxs = np.asarray(maxs, dtype=np.float64).reshape(-1, 3)
+        self.order = np.arange(len(self.mins))
+        self.nodes = []  # (lo, hi, left, right, start, end); left == -1 marks a leaf
+        if len(self.mins):
+            self._build(leaf_size)
+        self._boxes = [(tuple(lo), tuple(hi)) for lo, hi in zip(self.mins.tolist(), self.maxs.tolist())]
+        self._order = self.order.tolist()
+
+    def _build(self, leaf_size):
+        self.nodes.append(None)
+        stack = [(0, 0, len(self.mins))]
+        while stack:
+            node, start, end = stack.pop()
+            indices = self.order[start:end]
+            lo = tuple(self.mins[indices].min(axis=0).tolist())
+            hi = tuple(self.maxs[indices].max(axis=0).tolist())
+            if end - start <= leaf_size:
+                self.nodes[node] = (lo, hi, -1, -1, start, end)
+                continue
+            axis = int(np.argmax(np.subtract(hi, lo)))
+            centers = self.mins[indices, axis] + self.maxs[indices, axis]
+            self.order[start:end] = indices[np.argsort(centers, kind="stable")]
+            middle = (start + end) // 2
+            left, right = len(self.nodes), len(self.nodes) + 1
+            self.nodes.extend((None, None))
+            self.nodes[node] = (lo, hi, left, right, start, end)
+            stack.append((left, start, middle))
+            stack.append((right, middle, end))
+
+    @property
+    def bounds(self):
+        """(lo, hi) of the whole hierarchy, or None when it is empty."""
+        return (self.nodes[0][0], self.nodes[0][1]) if self.nodes else None
+
+    def candidates(self, origin, direction):
+        """Return (entry distance, box index) for every box the ray hits, nearest first."""
+        if not self.nodes:
+            return []
+        inv_direction = [1.0 / d if d else None for d in direction]
+        hits = []
+        stack = [0]
+        while stack:
+            lo, hi, left, right, start, end = self.nodes[stack.pop()]
+            if ray_box_entry(lo, hi, origin, inv_direction) is None:
+                continue
+            if left >= 0:
+                stack.append(left)
+                stack.append(right)
+                continue
+            for index in self._order[start:end]:
+                box_lo, box_hi = self._boxes[index]
+                t = ray_box_entry(box_lo, box_hi, origin, inv_direction)
+                if t is not None:
+                    hits.append((t, index))
+        hits.sort()
+        return hits
+
+
+def window_to_viewport(view, x, y):
+    """Map a main window pixel (origin top left, as the overlay draws) to the view's viewport.
+
+    Viewport pixels, which view.getPoint() takes, are device pixels of the 3D view
+    widget with the origin at the bottom left.
+    """
+    point = QtCore.QPoint(int(x), int(y))
+    widget = view.graphicsView() if hasattr(view, "graphicsView") else None
+    ratio = 1.0
+    if widget is not None:
+        point = widget.mapFromGlobal(FreeCADGui.getMainWindow().mapToGlobal(point))
+        ratio = widget.devicePixelRatioF()
+    height = view.getSize()[1]
+    return int(point.x() * ratio), height - 1 - int(point.y() * ratio)
+
+
+class ScenePicker:
+    """Picks the object under a screen point by casting a camera ray into the scene.
+
+    The BVH of object bounding boxes is rebuilt only when the document observer
+    reports a change; exact shape intersection runs only on the boxes the ray hits.
+    """
+
+    def __init__(self, doc, tolerance=1e-3):
+        self.doc = doc
+        self.tolerance = tolerance
+        self.observer = document_observer()
+        self._built_at = None
+        self._objects = []
+        self._bvh = BoundingVolumeHierarchy([], [])
+
+    def index(self):
+        """Return the BVH of visible objects, rebuilding it if the scene has changed."""
+        if self._built_at != self.observer.scene_revision:
+            self._objects, mins, maxs = [], [], []
+            for obj in self.doc.Objects:
+                shape = getattr(obj, "Shape", None)
+                if shape is None or shape.isNull() or not obj.Visibility:
+                    continue
+                box = shape.BoundBox
+                self._objects.append(obj)
+                mins.append((box.XMin, box.YMin, box.ZMin))
+                maxs.append((box.XMax, box.YMax, box.ZMax))
+            self._bvh = BoundingVolumeHierarchy(mins, maxs)
+            self._built_at = self.observer.scene_revision
+        return self._bvh
+
+    def camera_ray(self, view, x, y):
+        """Return (origin, unit direction) of the ray through viewport pixel (x, y)."""
+        focal_point = view.getPoint(x, y)
+        if view.getCameraType() == "Perspective":
+            origin = FreeCAD.Vector(*view.getCameraNode().position.getValue().getValue())
+            direction = focal_point - origin
+        else:
+            direction = FreeCAD.Vector(view.getViewDirection())
+            origin = focal_point
+            bounds = self.index().bounds
+            if bounds:
+                # Back the origin off so objects in front of the focal plane are not missed
+                center = FreeCAD.Vector(*[(a + b) / 2 for a, b in zip(*bounds)])
+                diagonal = FreeCAD.Vector(*[b - a for a, b in zip(*bounds)]).Length
+                origin = focal_point - direction.normalize() * ((focal_point - center).Length + diagonal)
+        return origin, direction.normalize()
+
+    def pick_ray(self, origin, direction):
+        """Return the nearest object the ray hits, or None."""
+        bvh = self.index()
+        bounds = bvh.bounds
+        if bounds is None:
+            return None
+        length = FreeCAD.Vector(*[b - a for a, b in zip(*bounds)]).Length + \
+            (origin - FreeCAD.Vector(*bounds[0])).Length
+        segment = Part.LineSegment(origin, origin + direction * length).toShape()
+
+        best_distance, best_obj = math.inf, None
+        for entry, index in bvh.candidates(tuple(origin), tuple(direction)):
+            if entry > best_distance:
+                break
+            obj = self._objects[index]
+            distance, pairs, _ = obj.Shape.distToShape(segment)
+            if distance > self.tolerance:
+                continue
+            hit = min((on_segment - origin).Length for _, on_segment in pairs)
+            if hit < best_distance:
+                best_distance, best_obj = hit, obj
+        return best_obj
+
+    def pick(self, view, x, y):
+        """Return the nearest object under viewport pixel (x, y), or None."""
+        return self.pick_ray(*self.camera_ray(view, x, y))
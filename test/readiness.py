@@ -0,0 +1,46 @@
+# Contains the startup handshake between start.py, the FreeCAD app and the hand tracking client
+# Needs nothing but the standard library, so start.py can use it outside FreeCAD.
+import json
+import os
+import time
+
+# Path of the file ServerConnect writes once it is listening
+READY_FILE_ENV = "HANDTRACKING_READY_FILE"
+# time.time() when start.py launched everything, for startup timings
+START_TIME_ENV = "HANDTRACKING_START_TIME"
+
+
+def launch_time():
+    """Return when the session was launched: start.py's time if set, else now."""
+    try:
+        return float(os.environ[START_TIME_ENV])
+    except (KeyError, ValueError):
+        return time.time()
+
+
+def write_ready_file(port, path=None):
+    """Tell the launcher the server is listening on port. Does nothing unless a path is given or set."""
+    path = path or os.environ.get(READY_FILE_ENV)
+    if not path:
+        return False
+    partial = path + ".tmp"
+    with open(partial, "w") as f:
+        json.dump({"pid": os.getpid(), "port": port, "time": time.time()}, f)
+    os.replace(partial, path)  # Readers never see a half-written file
+    return True
+
+
+def wait_for_ready(path, timeout=60.0, process=None, poll=0.02):
+    """Wait for the ready file and return its contents.
+
+    Returns None on timeout, or as soon as process (a subprocess.Popen) exits.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(path):
+            with open(path) as f:
+                return json.load(f)
+        if process is not None and process.poll() is not None:
+            return None
+        time.sleep(poll)
+    return None
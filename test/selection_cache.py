@@ -0,0 +1,122 @@
+# Contains the selection observer that keeps a Python-side copy of the FreeCAD selection
+import logging
+import weakref
+
+from setup import setup_freecad_env
+setup_freecad_env()
+
+import FreeCAD
+import FreeCADGui
+
+logger = logging.getLogger(__name__)
+
+
+class SelectionCache:
+    """The current FreeCAD selection, kept up to date by selection observer slots.
+
+    Gesture handlers read the selection on every message; reading it here is a dict
+    lookup instead of a getSelection()/getSelectionEx() call into the C++ layer.
+    Listeners are called with the cache after every change.
+    """
+
+    def __init__(self):
+        self._entries = {}  # (document name, object name) -> (object, [sub-element names]), in selection order
+        self._listeners = []
+        self.revision = 0
+
+    def _items(self, doc_name):
+        return [entry for (doc, _), entry in self._entries.items() if not doc_name or doc == doc_name]
+
+    def objects(self, doc_name=""):
+        """Return the selected objects, like FreeCADGui.Selection.getSelection()."""
+        return [obj for obj, _ in self._items(doc_name)]
+
+    def first(self, doc_name=""):
+        """Return the first selected object, or None."""
+        for (doc, _), (obj, _) in self._entries.items():
+            if not doc_name or doc == doc_name:
+                return obj
+        return None
+
+    def first_ex(self, doc_name=""):
+        """Return (object, sub-element names) of the first selected object, or (None, [])."""
+        for (doc, _), (obj, subs) in self._entries.items():
+            if not doc_name or doc == doc_name:
+                return obj, list(subs)
+        return None, []
+
+    def edges(self, doc_name=""):
+        """Return the selected edges as (object, edge number) pairs, in selection order."""
+        return [(obj, int(sub[4:])) for obj, subs in self._items(doc_name)
+                for sub in subs if sub.startswith("Edge")]
+
+    def add_listener(self, callback):
+        """Call callback(cache) after every change; a bound method does not keep its object alive."""
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda: callback)
+        self._listeners.append(ref)
+
+    def _changed(self):
+        self.revision += 1
+        alive = []
+        for ref in self._listeners:
+            callback = ref()
+            if callback is None:
+                continue
+            alive.append(ref)
+            try:
+                callback(self)
+            except Exception as e:
+                logger.exception("Selection listener error: %s", e)
+        self._listeners = alive
+
+    def _reload(self, doc_name=""):
+        """Re-read the selection of one document (all when empty) from FreeCAD."""
+        self._entries = {key: entry for key, entry in self._entries.items()
+                         if doc_name and key[0] != doc_name}
+        for selection in FreeCADGui.Selection.getSelectionEx(doc_name):
+            subs = [sub for sub in selection.SubElementNames if sub]
+            self._entries[(selection.DocumentName, selection.ObjectName)] = (selection.Object, subs)
+
+    # FreeCAD selection observer slots
+    def addSelection(self, doc, obj, sub, pnt):
+        entry = self._entries.get((doc, obj))
+        if entry is None:
+            document = FreeCAD.getDocument(doc)
+            entry = self._entries[(doc, obj)] = (document.getObject(obj), [])
+        if sub and sub not in entry[1]:
+            entry[1].append(sub)
+        self._changed()
+
+    def removeSelection(self, doc, obj, sub):
+        entry = self._entries.get((doc, obj))
+        if entry is None:
+            return
+        if sub and sub in entry[1]:
+            entry[1].remove(sub)
+        if not sub or not entry[1]:
+            del self._entries[(doc, obj)]
+        self._changed()
+
+    def setSelection(self, doc):
+        self._reload(doc)
+        self._changed()
+
+    def clearSelection(self, doc):
+        if doc:
+            self._entries = {key: entry for key, entry in self._entries.items() if key[0] != doc}
+        else:
+            self._entries.clear()
+        self._changed()
+
+
+_cache = None
+
+
+def selection_cache():
+    """Return the shared cache, registering it as a selection observer on first use."""
+    global _cache
+    if _cache is None:
+        _cache = SelectionCache()
+        _cache._reload()
+        FreeCADGui.Selection.addObserver(_cache)
+    return _cache
@@ -4,9 +4,19 @@ import sys
 
 #SAVED
 
+# FREECAD_BACKEND=standin replaces FreeCAD with the lightweight modules in standin/,
+# so the command layer can run and be benchmarked on machines without FreeCAD
+STANDIN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'standin')
+
+
 def setup_freecad_env():
     """Set up the FreeCAD environment and Python path."""
 
+    if os.environ.get('FREECAD_BACKEND') == 'standin':
+        if STANDIN_DIR not in sys.path:
+            sys.path.insert(0, STANDIN_DIR)
+        return
+
     """ This portion is for macOS! Please comment this out if you're on windows and use the other sectio"""
 
     # Use absolute path for macOS
@@ -0,0 +1,696 @@
+# Contains the stand-in for the subset of the FreeCAD module used by the command layer
+# Selected with FREECAD_BACKEND=standin (see setup.py). Documents, objects, properties,
+# recompute and observers behave like FreeCAD's; geometry comes from the Part stand-in.
+import itertools
+import math
+
+__standin__ = True
+
+
+class Vector:
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        if not isinstance(x, (int, float)):
+            x, y, z = x
+        self.x, self.y, self.z = float(x), float(y), float(z)
+
+    def __repr__(self):
+        return f"Vector ({self.x}, {self.y}, {self.z})"
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.z)[index]
+
+    def __eq__(self, other):
+        return isinstance(other, Vector) and tuple(self) == tuple(other)
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other):
+        return Vector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __neg__(self):
+        return Vector(-self.x, -self.y, -self.z)
+
+    def __mul__(self, other):
+        # Like FreeCAD, Vector * Vector is the dot product
+        if isinstance(other, Vector):
+            return self.dot(other)
+        return Vector(self.x * other, self.y * other, self.z * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, value):
+        return Vector(self.x / value, self.y / value, self.z / value)
+
+    @property
+    def Length(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def add(self, other):
+        return self + other
+
+    def sub(self, other):
+        return self - other
+
+    def dot(self, other):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other):
+        return Vector(self.y * other.z - self.z * other.y,
+                      self.z * other.x - self.x * other.z,
+                      self.x * other.y - self.y * other.x)
+
+    def multiply(self, value):
+        """Scale in place and return self, as FreeCAD does."""
+        self.x, self.y, self.z = self.x * value, self.y * value, self.z * value
+        return self
+
+    def normalize(self):
+        """Normalize in place and return self, as FreeCAD does."""
+        length = self.Length
+        if length == 0:
+            raise ValueError("Cannot normalize null vector")
+        return self.multiply(1.0 / length)
+
+    def distanceToPoint(self, other):
+        return (self - other).Length
+
+    def getAngle(self, other):
+        lengths = self.Length * other.Length
+        if lengths == 0:
+            return 0.0
+        return math.acos(max(-1.0, min(1.0, self.dot(other) / lengths)))
+
+    def isEqual(self, other, tolerance):
+        return (self - other).Length <= tolerance
+
+
+class Rotation:
+    """Unit quaternion rotation with FreeCAD's constructors and yaw-pitch-roll convention."""
+
+    def __init__(self, *args):
+        if not args:
+            q = (0.0, 0.0, 0.0, 1.0)
+        elif len(args) == 1 and isinstance(args[0], Rotation):
+            q = args[0].Q
+        elif len(args) == 2:
+            # Axis and angle in degrees
+            axis = Vector(args[0])
+            length = axis.Length
+            half = math.radians(args[1]) / 2
+            s = math.sin(half) / length if length else 0.0
+            q = (axis.x * s, axis.y * s, axis.z * s, math.cos(half))
+        elif len(args) == 3:
+            # Yaw, pitch and roll in degrees: Rz(yaw) * Ry(pitch) * Rx(roll)
+            yaw, pitch, roll = (math.radians(a) / 2 for a in args)
+            cy, sy = math.cos(yaw), math.sin(yaw)
+            cp, sp = math.cos(pitch), math.sin(pitch)
+            cr, sr = math.cos(roll), math.sin(roll)
+            q = (sr * cp * cy - cr * sp * sy,
+                 cr * sp * cy + sr * cp * sy,
+                 cr * cp * sy - sr * sp * cy,
+                 cr * cp * cy + sr * sp * sy)
+        elif len(args) == 4:
+            q = args
+        else:
+            raise TypeError("Rotation() takes no arguments, a Rotation, axis and angle, "
+                            "yaw pitch roll, or a quaternion")
+        norm = math.sqrt(sum(c * c for c in q)) or 1.0
+        self.Q = tuple(float(c) / norm for c in q)
+
+    def __repr__(self):
+        return f"Rotation {self.Q}"
+
+    def __eq__(self, other):
+        return isinstance(other, Rotation) and (
+            self.Q == other.Q or self.Q == tuple(-c for c in other.Q))
+
+    __hash__ = None
+
+    @property
+    def Axis(self):
+        x, y, z, w = self.Q
+        s = math.sqrt(max(0.0, 1 - w * w))
+        return Vector(0, 0, 1) if s < 1e-12 else Vector(x / s, y / s, z / s)
+
+    @property
+    def Angle(self):
+        """Rotation angle in radians."""
+        return 2 * math.acos(max(-1.0, min(1.0, self.Q[3])))
+
+    def multiply(self, other):
+        x1, y1, z1, w1 = self.Q
+        x2, y2, z2, w2 = other.Q
+        return Rotation(w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+                        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2)
+
+    __mul__ = multiply
+
+    def multVec(self, vector):
+        x, y, z, w = self.Q
+        vx, vy, vz = vector
+        # v + 2w(q x v) + 2 q x (q x v)
+        cx, cy, cz = y * vz - z * vy, z * vx - x * vz, x * vy - y * vx
+        return Vector(vx + 2 * (w * cx + y * cz - z * cy),
+                      vy + 2 * (w * cy + z * cx - x * cz),
+                      vz + 2 * (w * cz + x * cy - y * cx))
+
+    def inverted(self):
+        x, y, z, w = self.Q
+        return Rotation(-x, -y, -z, w)
+
+    def invert(self):
+        self.Q = self.inverted().Q
+
+    def isIdentity(self):
+        return abs(abs(self.Q[3]) - 1.0) < 1e-12
+
+    def toEuler(self):
+        """Return (yaw, pitch, roll) in degrees."""
+        x, y, z, w = self.Q
+        roll = math.atan2(2 * (w * x + y * z), 1 - 2 * (x * x + y * y))
+        pitch = math.asin(max(-1.0, min(1.0, 2 * (w * y - z * x))))
+        yaw = math.atan2(2 * (w * z + x * y), 1 - 2 * (y * y + z * z))
+        return math.degrees(yaw), math.degrees(pitch), math.degrees(roll)
+
+    getYawPitchRoll = toEuler
+
+
+class Placement:
+    def __init__(self, base=None, rotation=None, center=None):
+        if isinstance(base, Placement):
+            base, rotation = base.Base, base.Rotation
+        self.Base = Vector(base) if base is not None else Vector()
+        self.Rotation = Rotation(rotation) if rotation is not None else Rotation()
+        if center is not None:
+            center = Vector(center)
+            self.Base = self.Base + center - self.Rotation.multVec(center)
+
+    def __repr__(self):
+        return f"Placement [Pos=({self.Base.x}, {self.Base.y}, {self.Base.z}), Rot={self.Rotation.Q}]"
+
+    def __eq__(self, other):
+        return isinstance(other, Placement) and self.Base == other.Base and self.Rotation == other.Rotation
+
+    __hash__ = None
+
+    def copy(self):
+        return Placement(self)
+
+    def multiply(self, other):
+        return Placement(self.multVec(other.Base), self.Rotation.multiply(other.Rotation))
+
+    __mul__ = multiply
+
+    def multVec(self, vector):
+        return self.Rotation.multVec(vector) + self.Base
+
+    def rotate(self, center, axis, angle):
+        """Rotate in place by angle degrees about an axis through center."""
+        rotated = Placement(Vector(), Rotation(axis, angle), center).multiply(self)
+        self.Base, self.Rotation = rotated.Base, rotated.Rotation
+
+    def inverse(self):
+        rotation = self.Rotation.inverted()
+        return Placement(-rotation.multVec(self.Base), rotation)
+
+    def isIdentity(self):
+        return self.Base.Length == 0 and self.Rotation.isIdentity()
+
+    def _key(self):
+        return tuple(self.Base) + self.Rotation.Q
+
+
+class _PropertyPlacement(Placement):
+    """The copy handed out by obj.Placement. Assigning its Base or Rotation writes the
+    placement back to the object, as FreeCAD does; obj.Placement.Base.x = 1 does not."""
+
+    def __init__(self, placement, owner):
+        super().__init__(placement)
+        self.__dict__["_owner"] = owner
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        owner = self.__dict__.get("_owner")
+        if owner is not None:
+            owner.Placement = self
+
+
+class BoundBox:
+    def __init__(self, xmin=math.inf, ymin=math.inf, zmin=math.inf,
+                 xmax=-math.inf, ymax=-math.inf, zmax=-math.inf):
+        self.XMin, self.YMin, self.ZMin = xmin, ymin, zmin
+        self.XMax, self.YMax, self.ZMax = xmax, ymax, zmax
+
+    def __repr__(self):
+        return (f"BoundBox ({self.XMin}, {self.YMin}, {self.ZMin}, "
+                f"{self.XMax}, {self.YMax}, {self.ZMax})")
+
+    def isValid(self):
+        return self.XMin <= self.XMax and self.YMin <= self.YMax and self.ZMin <= self.ZMax
+
+    def add(self, point):
+        x, y, z = point
+        self.XMin, self.YMin, self.ZMin = min(self.XMin, x), min(self.YMin, y), min(self.ZMin, z)
+        self.XMax, self.YMax, self.ZMax = max(self.XMax, x), max(self.YMax, y), max(self.ZMax, z)
+
+    @property
+    def XLength(self):
+        return self.XMax - self.XMin
+
+    @property
+    def YLength(self):
+        return self.YMax - self.YMin
+
+    @property
+    def ZLength(self):
+        return self.ZMax - self.ZMin
+
+    @property
+    def DiagonalLength(self):
+        if not self.isValid():
+            return 0.0
+        return math.sqrt(self.XLength ** 2 + self.YLength ** 2 + self.ZLength ** 2)
+
+    @property
+    def Center(self):
+        return Vector((self.XMin + self.XMax) / 2, (self.YMin + self.YMax) / 2, (self.ZMin + self.ZMax) / 2)
+
+
+class _Quantity:
+    def __init__(self, value=0.0):
+        if isinstance(value, _Quantity):
+            value = value.Value
+        elif isinstance(value, str):
+            value = value.split()[0] if value.split() else 0.0
+        self.Value = float(value)
+
+    def __repr__(self):
+        return f"{self.Value} mm"
+
+    def __add__(self, other):
+        return _Quantity(self.Value + _Quantity(other).Value)
+
+    def __sub__(self, other):
+        return _Quantity(self.Value - _Quantity(other).Value)
+
+    def __float__(self):
+        return self.Value
+
+
+class Units:
+    Quantity = _Quantity
+
+
+class _ParameterGroup:
+    def __init__(self):
+        self._values = {}
+
+    def __getattr__(self, name):
+        # SetBool/GetBool, SetUnsigned/GetUnsigned, SetString/GetString ...
+        if name.startswith("Set"):
+            return lambda key, value: self._values.__setitem__(key, value)
+        if name.startswith("Get"):
+            return lambda key, default=None: self._values.get(key, default)
+        raise AttributeError(name)
+
+
+_parameters = {}
+
+
+def ParamGet(path):
+    return _parameters.setdefault(path, _ParameterGroup())
+
+
+# Document observers, notified through the same slot names FreeCAD uses
+_observers = []
+
+
+def addDocumentObserver(observer):
+    _observers.append(observer)
+
+
+def removeDocumentObserver(observer):
+    _observers.remove(observer)
+
+
+def _notify(slot, *args):
+    for observer in _observers:
+        method = getattr(observer, slot, None)
+        if method is not None:
+            method(*args)
+
+
+class DocumentObject:
+    """A document object with FreeCAD's touch, recompute and change-notification behaviour."""
+
+    _properties = ("Label", "Placement", "Visibility")
+
+    def __init__(self, doc, type_id, name):
+        state = self.__dict__
+        state["Document"] = doc
+        state["TypeId"] = type_id
+        state["Name"] = name
+        state["_values"] = {"Label": name, "Placement": Placement(), "Visibility": True}
+        state["_touched"] = True
+        state["ViewObject"] = ViewProvider(self)
+
+    def __repr__(self):
+        return f"<{self.TypeId} object>"
+
+    def __getattr__(self, name):
+        values = self.__dict__["_values"]
+        if name not in values:
+            raise AttributeError(f"'{self.TypeId}' object has no attribute '{name}'")
+        value = values[name]
+        # Like FreeCAD, compound property values come back as copies
+        return _PropertyPlacement(value, self) if isinstance(value, Placement) else value
+
+    def __setattr__(self, name, value):
+        if name not in self._properties:
+            raise AttributeError(f"'{self.TypeId}' object has no property '{name}'")
+        if name == "Placement":
+            value = Placement(value)
+        self._values[name] = value
+        if name not in ("Label", "Visibility"):
+            self.__dict__["_touched"] = True
+        self._changed(name)
+
+    def _changed(self, prop):
+        _notify("slotChangedObject", self, prop)
+
+    @property
+    def PropertiesList(self):
+        return list(self._properties)
+
+    @property
+    def State(self):
+        return ["Touched"] if self._touched else []
+
+    @property
+    def InList(self):
+        return []
+
+    @property
+    def InListRecursive(self):
+        return []
+
+    @property
+    def OutList(self):
+        return []
+
+    def isDerivedFrom(self, type_id):
+        return type_id in (self.TypeId, "App::DocumentObject")
+
+    def touch(self):
+        self.__dict__["_touched"] = True
+
+    def purgeTouched(self):
+        self.__dict__["_touched"] = False
+
+    def execute(self):
+        pass
+
+    def recompute(self):
+        self.execute()
+        self.purgeTouched()
+        return True
+
+
+class PartFeature(DocumentObject):
+    """Part::Feature: holds a shape whose placement follows the object's Placement."""
+
+    _properties = DocumentObject._properties + ("Shape",)
+
+    def __init__(self, doc, type_id, name):
+        super().__init__(doc, type_id, name)
+        import Part
+        self._values["Shape"] = Part.Shape()
+
+    def __getattr__(self, name):
+        if name == "Shape":
+            shape = self._values["Shape"]
+            placement = self._values["Placement"]
+            if shape.isNull() or shape.Placement == placement:
+                return shape
+            # Cache the placed shape so repeated reads share one hash, as in FreeCAD
+            shape = self._values["Shape"] = shape.located(placement)
+            return shape
+        return super().__getattr__(name)
+
+    def __setattr__(self, name, value):
+        if name == "Shape":
+            # Assigning a shape also takes over its placement
+            self._values["Shape"] = value
+            self._values["Placement"] = value.Placement.copy()
+            self.__dict__["_touched"] = True
+            self._changed("Shape")
+            self._changed("Placement")
+            return
+        super().__setattr__(name, value)
+
+    def _set_shape(self, shape):
+        self._values["Shape"] = shape.located(self._values["Placement"])
+        self._changed("Shape")
+
+
+class PartPrimitive(PartFeature):
+    """Part::Box, Part::Sphere, Part::Cylinder and Part::Torus: the shape is rebuilt on recompute."""
+
+    _parameters = {
+        "Part::Box": {"Length": 10.0, "Width": 10.0, "Height": 10.0},
+        "Part::Sphere": {"Radius": 5.0},
+        "Part::Cylinder": {"Radius": 2.0, "Height": 10.0},
+        "Part::Torus": {"Radius1": 10.0, "Radius2": 2.0},
+    }
+
+    def __init__(self, doc, type_id, name):
+        super().__init__(doc, type_id, name)
+        self.__dict__["_properties"] = PartFeature._properties + tuple(self._parameters[type_id])
+        self._values.update(self._parameters[type_id])
+
+    def __setattr__(self, name, value):
+        if name in self._parameters[self.TypeId]:
+            value = float(_Quantity(value))
+        super().__setattr__(name, value)
+
+    def execute(self):
+        import Part
+        values = self._values
+        if self.TypeId == "Part::Box":
+            shape = Part.makeBox(values["Length"], values["Width"], values["Height"])
+        elif self.TypeId == "Part::Sphere":
+            shape = Part.makeSphere(values["Radius"])
+        elif self.TypeId == "Part::Torus":
+            shape = Part.makeTorus(values["Radius1"], values["Radius2"])
+        else:
+            shape = Part.makeCylinder(values["Radius"], values["Height"])
+        self._set_shape(shape)
+
+
+class _SoField:
+    """A Coin single-value field: getValue() returns an Sb value whose getValue() is a tuple."""
+
+    class _Value(tuple):
+        def getValue(self):
+            return tuple(self)
+
+    def __init__(self, *value):
+        self._value = value
+
+    def getValue(self):
+        return self._Value(self._value)
+
+    def setValue(self, *value):
+        self._value = value
+
+
+class _SoType:
+    def __init__(self, name):
+        self._name = name
+
+    def getName(self):
+        return self._name
+
+
+class _SoTransform:
+    def __init__(self):
+        self.translation = _SoField(0.0, 0.0, 0.0)
+        self.rotation = _SoField(0.0, 0.0, 0.0, 1.0)
+
+    def getTypeId(self):
+        return _SoType("Transform")
+
+
+class _SoSeparator:
+    def __init__(self, children=()):
+        self._children = list(children)
+
+    def getTypeId(self):
+        return _SoType("Separator")
+
+    def getNumChildren(self):
+        return len(self._children)
+
+    def getChild(self, index):
+        return self._children[index]
+
+
+class ViewProvider:
+    """Display properties, and a RootNode holding only the object's transform.
+
+    There is no geometry in the scene graph; the transform is there so that
+    code moving objects on screen without touching the document can run.
+    """
+
+    def __init__(self, obj):
+        self.__dict__["Object"] = obj
+        self.__dict__["RootNode"] = _SoSeparator([_SoTransform()])
+        self.__dict__["ShapeColor"] = (0.8, 0.8, 0.8)
+        self.__dict__["Deviation"] = 0.5
+        self.__dict__["AngularDeflection"] = 28.5
+        self.__dict__["BoundingBox"] = False
+        self.__dict__["DisplayMode"] = "Flat Lines"
+        self.__dict__["Transparency"] = 0
+        self.__dict__["LineWidth"] = 2.0
+
+    @property
+    def Visibility(self):
+        return self.Object.Visibility
+
+    @Visibility.setter
+    def Visibility(self, value):
+        self.Object.Visibility = value
+
+    def show(self):
+        self.Visibility = True
+
+    def hide(self):
+        self.Visibility = False
+
+
+_TYPES = {
+    "App::FeaturePython": DocumentObject,
+    "Part::Feature": PartFeature,
+    "Part::Box": PartPrimitive,
+    "Part::Sphere": PartPrimitive,
+    "Part::Cylinder": PartPrimitive,
+    "Part::Torus": PartPrimitive,
+}
+
+
+class Document:
+    def __init__(self, name):
+        self.Name = name
+        self.Label = name
+        self._objects = {}
+        self._transactions = []
+        self.UndoNames = []
+        self.RecomputesCount = 0
+
+    def __repr__(self):
+        return f"<Document object at {self.Name}>"
+
+    @property
+    def Objects(self):
+        return list(self._objects.values())
+
+    def _unique_name(self, name):
+        name = "".join(c if c.isalnum() or c == "_" else "_" for c in name) or "Unnamed"
+        if name[0].isdigit():
+            name = "_" + name
+        if name not in self._objects:
+            return name
+        for number in itertools.count(1):
+            candidate = f"{name}{number:03d}"
+            if candidate not in self._objects:
+                return candidate
+
+    def addObject(self, type_id, name=None):
+        cls = _TYPES.get(type_id)
+        if cls is None:
+            raise ValueError(f"'{type_id}' is not a document object type")
+        obj = cls(self, type_id, self._unique_name(name or type_id.split("::")[-1]))
+        self._objects[obj.Name] = obj
+        _notify("slotCreatedObject", obj)
+        return obj
+
+    def getObject(self, name):
+        return self._objects.get(name)
+
+    def removeObject(self, name):
+        obj = self._objects.pop(name, None)
+        if obj is None:
+            raise ValueError(f"No document object found with name '{name}'")
+        _notify("slotDeletedObject", obj)
+
+    def recompute(self, objects=None):
+        """Execute the touched objects (or the given ones) and return how many ran."""
+        if objects is None:
+            objects = [obj for obj in self._objects.values() if obj._touched]
+        for obj in objects:
+            obj.recompute()
+        self.RecomputesCount += 1
+        _notify("slotRecomputedDocument", self)
+        return len(objects)
+
+    def openTransaction(self, name="<empty>"):
+        self._transactions.append(name)
+
+    def commitTransaction(self):
+        if self._transactions:
+            self.UndoNames.insert(0, self._transactions.pop())
+
+    def abortTransaction(self):
+        if self._transactions:
+            self._transactions.pop()
+
+
+_documents = {}
+ActiveDocument = None
+
+
+def newDocument(name="Unnamed"):
+    global ActiveDocument
+    base = name
+    for number in itertools.count(1):
+        if name not in _documents:
+            break
+        name = f"{base}{number:03d}"
+    doc = _documents[name] = Document(name)
+    ActiveDocument = doc
+    _notify("slotCreatedDocument", doc)
+    return doc
+
+
+def getDocument(name):
+    if name not in _documents:
+        raise NameError(f"Unknown document '{name}'")
+    return _documents[name]
+
+
+def listDocuments():
+    return dict(_documents)
+
+
+def setActiveDocument(name):
+    global ActiveDocument
+    ActiveDocument = getDocument(name)
+
+
+def closeDocument(name):
+    global ActiveDocument
+    doc = _documents.pop(name)
+    _notify("slotDeletedDocument", doc)
+    if ActiveDocument is doc:
+        ActiveDocument = next(iter(_documents.values()), None)
@@ -0,0 +1,251 @@
+# Contains the stand-in for the subset of the FreeCADGui module used by the command layer
+# Every FreeCAD document gets a GUI document with a view that records what was asked
+# of it. There is no scene graph; getMainWindow() needs a running QApplication.
+import math
+
+import FreeCAD
+
+__standin__ = True
+
+
+class View3D:
+    """An orthographic view of a width x height viewport, one model unit per pixel.
+
+    Viewport pixels have their origin at the bottom left, as in Coin.
+    """
+
+    def __init__(self, width=800, height=600):
+        self.width = width
+        self.height = height
+        self.direction = FreeCAD.Vector(0, 0, -1)
+        self.center = FreeCAD.Vector()
+        self.calls = {}  # method name -> call count
+        self._widget = None
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def fitAll(self):
+        self._count("fitAll")
+
+    def redraw(self):
+        self._count("redraw")
+
+    def _set_view(self, name, direction):
+        self._count(name)
+        self.direction = FreeCAD.Vector(direction).normalize()
+
+    def viewAxonometric(self):
+        self._set_view("viewAxonometric", (-1, 1, -1))
+
+    viewIsometric = viewAxonometric
+
+    def viewFront(self):
+        self._set_view("viewFront", (0, 1, 0))
+
+    def viewRear(self):
+        self._set_view("viewRear", (0, -1, 0))
+
+    def viewTop(self):
+        self._set_view("viewTop", (0, 0, -1))
+
+    def viewBottom(self):
+        self._set_view("viewBottom", (0, 0, 1))
+
+    def viewLeft(self):
+        self._set_view("viewLeft", (1, 0, 0))
+
+    def viewRight(self):
+        self._set_view("viewRight", (-1, 0, 0))
+
+    def viewPosition(self, *args):
+        self._count("viewPosition")
+
+    def viewRotateLeft(self):
+        self._count("viewRotateLeft")
+        self.direction = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 1), 90).multVec(self.direction)
+
+    def viewRotateRight(self):
+        self._count("viewRotateRight")
+        self.direction = FreeCAD.Rotation(FreeCAD.Vector(0, 0, 1), -90).multVec(self.direction)
+
+    def getViewDirection(self):
+        return FreeCAD.Vector(self.direction)
+
+    def setViewDirection(self, direction):
+        self._count("setViewDirection")
+        self.direction = FreeCAD.Vector(direction).normalize()
+
+    def getCameraOrientation(self):
+        """Rotation taking camera axes (looking down -Z, +Y up) to the view's axes."""
+        right, up = self._axes()
+        back = -self.direction
+        m = ((right.x, up.x, back.x), (right.y, up.y, back.y), (right.z, up.z, back.z))
+        trace = m[0][0] + m[1][1] + m[2][2]
+        if trace > 0:
+            s = 2 * math.sqrt(trace + 1)
+            q = ((m[2][1] - m[1][2]) / s, (m[0][2] - m[2][0]) / s, (m[1][0] - m[0][1]) / s, s / 4)
+        else:
+            i = max(range(3), key=lambda k: m[k][k])
+            j, k = (i + 1) % 3, (i + 2) % 3
+            s = 2 * math.sqrt(1 + m[i][i] - m[j][j] - m[k][k])
+            q = [0.0, 0.0, 0.0, (m[k][j] - m[j][k]) / s]
+            q[i] = s / 4
+            q[j] = (m[j][i] + m[i][j]) / s
+            q[k] = (m[k][i] + m[i][k]) / s
+        return FreeCAD.Rotation(*q)
+
+    def setCameraOrientation(self, rotation, *args):
+        self._count("setCameraOrientation")
+        self.direction = FreeCAD.Rotation(rotation).multVec(FreeCAD.Vector(0, 0, -1)).normalize()
+
+    def getCameraType(self):
+        return "Orthographic"
+
+    def getSize(self):
+        return self.width, self.height
+
+    def _axes(self):
+        """Right and up vectors of the screen plane."""
+        helper = FreeCAD.Vector(0, 1, 0) if abs(self.direction.z) > 0.9 else FreeCAD.Vector(0, 0, 1)
+        right = self.direction.cross(helper).normalize()
+        return right, right.cross(self.direction).normalize()
+
+    def getPoint(self, x, y):
+        """Return the point on the focal plane under viewport pixel (x, y)."""
+        right, up = self._axes()
+        return self.center + right * (x - self.width / 2) + up * (y - self.height / 2)
+
+    def getPointOnScreen(self, point):
+        right, up = self._axes()
+        offset = FreeCAD.Vector(point) - self.center
+        return int(round(offset.dot(right) + self.width / 2)), int(round(offset.dot(up) + self.height / 2))
+
+    def graphicsView(self):
+        """The view's widget: below a 30 px toolbar strip of the main window."""
+        if self._widget is None:
+            from PySide2 import QtWidgets
+            self._widget = QtWidgets.QWidget(getMainWindow())
+            self._widget.setGeometry(0, 30, self.width, self.height)
+        return self._widget
+
+
+class GuiDocument:
+    def __init__(self, doc):
+        self.Document = doc
+        self.ActiveView = View3D()
+
+    def getObject(self, name):
+        obj = self.Document.getObject(name)
+        return obj.ViewObject if obj is not None else None
+
+
+_gui_documents = {}
+
+
+def getDocument(name):
+    doc = FreeCAD.getDocument(name)
+    gui_doc = _gui_documents.get(doc.Name)
+    if gui_doc is None or gui_doc.Document is not doc:
+        gui_doc = _gui_documents[doc.Name] = GuiDocument(doc)
+    return gui_doc
+
+
+def setActiveDocument(name):
+    FreeCAD.setActiveDocument(name)
+
+
+def __getattr__(name):
+    # Like FreeCAD's GUI, the active GUI document follows the active document
+    if name == "ActiveDocument":
+        doc = FreeCAD.ActiveDocument
+        return getDocument(doc.Name) if doc is not None else None
+    raise AttributeError(f"module 'FreeCADGui' has no attribute '{name}'")
+
+
+class SelectionObject:
+    def __init__(self, obj, sub_names):
+        self.Object = obj
+        self.ObjectName = obj.Name
+        self.DocumentName = obj.Document.Name
+        self.SubElementNames = list(sub_names)
+
+
+class _Selection:
+    """FreeCADGui.Selection: the selected objects with their sub-elements, plus observers."""
+
+    def __init__(self):
+        self._selected = {}  # (document name, object name) -> (object, [sub-element names])
+        self._observers = []
+
+    def _notify(self, slot, *args):
+        for observer in list(self._observers):
+            method = getattr(observer, slot, None)
+            if method is not None:
+                method(*args)
+
+    def addSelection(self, obj, sub_name="", x=0.0, y=0.0, z=0.0):
+        key = (obj.Document.Name, obj.Name)
+        entry = self._selected.setdefault(key, (obj, []))
+        if sub_name and sub_name not in entry[1]:
+            entry[1].append(sub_name)
+        self._notify("addSelection", obj.Document.Name, obj.Name, sub_name, (x, y, z))
+
+    def removeSelection(self, obj, sub_name=""):
+        key = (obj.Document.Name, obj.Name)
+        entry = self._selected.get(key)
+        if entry is None:
+            return
+        if sub_name:
+            if sub_name in entry[1]:
+                entry[1].remove(sub_name)
+        else:
+            del self._selected[key]
+        self._notify("removeSelection", obj.Document.Name, obj.Name, sub_name)
+
+    def clearSelection(self, doc_name=""):
+        if doc_name:
+            self._selected = {k: v for k, v in self._selected.items() if k[0] != doc_name}
+        else:
+            self._selected.clear()
+        self._notify("clearSelection", doc_name)
+
+    def getSelection(self, doc_name=""):
+        return [obj for (doc, _), (obj, _) in self._selected.items() if not doc_name or doc == doc_name]
+
+    def getSelectionEx(self, doc_name=""):
+        return [SelectionObject(obj, subs) for (doc, _), (obj, subs) in self._selected.items()
+                if not doc_name or doc == doc_name]
+
+    def isSelected(self, obj, sub_name=""):
+        entry = self._selected.get((obj.Document.Name, obj.Name))
+        return entry is not None and (not sub_name or sub_name in entry[1])
+
+    def addObserver(self, observer):
+        self._observers.append(observer)
+
+    def removeObserver(self, observer):
+        self._observers.remove(observer)
+
+
+Selection = _Selection()
+
+_main_window = None
+
+
+def getMainWindow():
+    """Return a hidden QMainWindow standing in for FreeCAD's, created on first use."""
+    global _main_window
+    if _main_window is None:
+        from PySide2 import QtWidgets
+        _main_window = QtWidgets.QMainWindow()
+        _main_window.resize(800, 630)
+    return _main_window
+
+
+def showMainWindow():
+    getMainWindow()
+
+
+def updateGui():
+    pass
@@ -0,0 +1,37 @@
+# Contains the stand-in for the subset of the Mesh module used by the benchmarks
+# A mesh is built, as in FreeCAD, from a list of [x, y, z] points taken three per facet
+# or from a list of three-point triangles, and written as binary STL. Like FreeCAD's mesh
+# kernel it keeps its own copy of every facet, but in Python, so its write times and
+# memory are not FreeCAD's.
+import math
+import struct
+
+
+class Mesh:
+    def __init__(self, triangles=None):
+        triangles = list(triangles or ())
+        if triangles and not isinstance(triangles[0][0], (list, tuple)):
+            triangles = [triangles[i:i + 3] for i in range(0, len(triangles) - 2, 3)]
+        self.Facets = [tuple(tuple(float(c) for c in point) for point in triangle)
+                       for triangle in triangles]
+
+    @property
+    def CountFacets(self):
+        return len(self.Facets)
+
+    @property
+    def CountPoints(self):
+        return len({point for facet in self.Facets for point in facet})
+
+    def write(self, path):
+        if not str(path).lower().endswith(".stl"):
+            raise ValueError(f"Unsupported mesh file format: {path}")
+        with open(path, "wb") as stream:
+            stream.write(b"MESH-" * 16)
+            stream.write(struct.pack("<I", len(self.Facets)))
+            for a, b, c in self.Facets:
+                u = (b[0] - a[0], b[1] - a[1], b[2] - a[2])
+                v = (c[0] - a[0], c[1] - a[1], c[2] - a[2])
+                normal = (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+                length = math.sqrt(sum(n * n for n in normal)) or 1.0
+                stream.write(struct.pack("<12fH", *(n / length for n in normal), *a, *b, *c, 0))
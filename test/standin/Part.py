@@ -0,0 +1,491 @@
+# Contains the stand-in for the subset of the Part module used by the command layer
+# Solids are unions of box, cylinder, sphere and torus primitives. Topology follows OCC's
+# numbering for the primitives, so edge commands address the same edges as in FreeCAD;
+# fillets and booleans produce shapes of the right kind and size, not exact geometry.
+import itertools
+import json
+import math
+
+from FreeCAD import BoundBox, Placement, Rotation, Vector
+
+
+class OCCError(Exception):
+    pass
+
+
+_tags = itertools.count(1)
+
+
+class Line:
+    def __init__(self, start=None, end=None):
+        self.Location = Vector(start) if start is not None else Vector()
+        end = Vector(end) if end is not None else self.Location + Vector(0, 0, 1)
+        self.Direction = Vector(end - self.Location).normalize()
+
+
+class LineSegment:
+    def __init__(self, start, end):
+        self.StartPoint = Vector(start)
+        self.EndPoint = Vector(end)
+
+    def toShape(self):
+        return Edge(Line(self.StartPoint, self.EndPoint), [self.StartPoint, self.EndPoint],
+                    (self.EndPoint - self.StartPoint).Length)
+
+
+class Circle:
+    def __init__(self, center=None, axis=None, radius=1.0):
+        self.Center = Vector(center) if center is not None else Vector()
+        self.Axis = Vector(axis) if axis is not None else Vector(0, 0, 1)
+        self.Radius = float(radius)
+
+
+class BSplineCurve:
+    pass
+
+
+class Vertex:
+    def __init__(self, point):
+        self.Point = Vector(point)
+
+    @property
+    def X(self):
+        return self.Point.x
+
+    @property
+    def Y(self):
+        return self.Point.y
+
+    @property
+    def Z(self):
+        return self.Point.z
+
+
+class Edge:
+    """An edge of a shape, or a free-standing edge made by LineSegment.toShape()."""
+
+    def __init__(self, curve, points, length, source=None, index=None):
+        self.Curve = curve
+        self.Vertexes = [Vertex(p) for p in points]
+        self.Length = length
+        self._source = source  # Geometry the edge belongs to
+        self._index = index
+
+    @property
+    def BoundBox(self):
+        box = BoundBox()
+        for vertex in self.Vertexes:
+            box.add(vertex.Point)
+        if isinstance(self.Curve, Circle):
+            r = self.Curve.Radius
+            for offset in (Vector(r, r, r), Vector(-r, -r, -r)):
+                box.add(self.Curve.Center + offset)
+        return box
+
+    def isNull(self):
+        return False
+
+
+def _segments(radius, deviation):
+    """Number of chords that keep a circle of this radius within deviation."""
+    return max(3, math.ceil(math.pi / math.acos(max(-1.0, 1 - min(deviation, radius) / radius))))
+
+
+def _box_corners(lo, hi):
+    return [(x, y, z) for x in (lo[0], hi[0]) for y in (lo[1], hi[1]) for z in (lo[2], hi[2])]
+
+
+class _Primitive:
+    """A box, cylinder, sphere or torus with its own placement inside the shape."""
+
+    def __init__(self, kind, size, placement):
+        self.kind = kind
+        self.size = tuple(float(s) for s in size)
+        self.placement = placement
+
+    def local_bounds(self):
+        if self.kind == "box":
+            return (0.0, 0.0, 0.0), self.size
+        r = self.size[0]
+        if self.kind == "cylinder":
+            return (-r, -r, 0.0), (r, r, self.size[1])
+        if self.kind == "torus":
+            outer = r + self.size[1]
+            return (-outer, -outer, -self.size[1]), (outer, outer, self.size[1])
+        return (-r, -r, -r), (r, r, r)
+
+    def corners(self):
+        return [self.placement.multVec(Vector(c)) for c in _box_corners(*self.local_bounds())]
+
+    def mesh(self, deviation):
+        """Return (local points, triangles) approximating the primitive within deviation."""
+        if self.kind == "box":
+            points = _box_corners((0.0, 0.0, 0.0), self.size)
+            triangles = [(0, 2, 3), (0, 3, 1), (4, 5, 7), (4, 7, 6), (0, 1, 5), (0, 5, 4),
+                         (2, 6, 7), (2, 7, 3), (0, 4, 6), (0, 6, 2), (1, 3, 7), (1, 7, 5)]
+            return points, triangles
+        if self.kind == "torus":
+            return self._torus_mesh(deviation)
+        r = self.size[0]
+        segments = _segments(r, deviation)
+        angles = [2 * math.pi * i / segments for i in range(segments)]
+        if self.kind == "cylinder":
+            h = self.size[1]
+            points = [(0.0, 0.0, 0.0), (0.0, 0.0, h)]
+            points += [(r * math.cos(a), r * math.sin(a), z) for z in (0.0, h) for a in angles]
+            triangles = []
+            for i in range(segments):
+                j = (i + 1) % segments
+                b0, b1, t0, t1 = 2 + i, 2 + j, 2 + segments + i, 2 + segments + j
+                triangles += [(0, b1, b0), (1, t0, t1), (b0, b1, t1), (b0, t1, t0)]
+            return points, triangles
+        rings = max(2, segments // 2)
+        points = [(0.0, 0.0, -r), (0.0, 0.0, r)]
+        for k in range(1, rings):
+            phi = math.pi * k / rings - math.pi / 2
+            points += [(r * math.cos(phi) * math.cos(a), r * math.cos(phi) * math.sin(a),
+                        r * math.sin(phi)) for a in angles]
+        triangles = []
+        for i in range(segments):
+            j = (i + 1) % segments
+            triangles.append((0, 2 + j, 2 + i))
+            top = 2 + (rings - 2) * segments
+            triangles.append((1, top + i, top + j))
+            for k in range(rings - 2):
+                a, b = 2 + k * segments, 2 + (k + 1) * segments
+                triangles += [(a + i, a + j, b + j), (a + i, b + j, b + i)]
+        return points, triangles
+
+    def _torus_mesh(self, deviation):
+        major, minor = self.size
+        segments, rings = _segments(major + minor, deviation), _segments(minor, deviation)
+        points = []
+        for i in range(segments):
+            a = 2 * math.pi * i / segments
+            for k in range(rings):
+                b = 2 * math.pi * k / rings
+                radius = major + minor * math.cos(b)
+                points.append((radius * math.cos(a), radius * math.sin(a), minor * math.sin(b)))
+        triangles = []
+        for i in range(segments):
+            for k in range(rings):
+                p0, p1 = i * rings + k, i * rings + (k + 1) % rings
+                q0, q1 = (i + 1) % segments * rings + k, (i + 1) % segments * rings + (k + 1) % rings
+                triangles += [(p0, q0, q1), (p0, q1, p1)]
+        return points, triangles
+
+    def topology(self):
+        """Return (local vertex points, edges) in OCC's order for this primitive."""
+        if self.kind == "box":
+            points = [(x, y, z) for x in (0.0, self.size[0]) for y in (0.0, self.size[1])
+                      for z in (0.0, self.size[2])]
+            pairs = [(0, 1), (1, 3), (2, 3), (0, 2), (4, 5), (5, 7), (6, 7), (4, 6),
+                     (0, 4), (1, 5), (2, 6), (3, 7)]
+            return points, [("line", pair, None, None, None) for pair in pairs]
+        r = self.size[0]
+        if self.kind == "cylinder":
+            h = self.size[1]
+            points = [(r, 0.0, h), (r, 0.0, 0.0)]
+            return points, [("circle", (0,), (0.0, 0.0, h), (0.0, 0.0, 1.0), r),
+                            ("line", (1, 0), None, None, None),
+                            ("circle", (1,), (0.0, 0.0, 0.0), (0.0, 0.0, 1.0), r)]
+        if self.kind == "torus":
+            # One vertex where the two seam circles meet
+            minor = self.size[1]
+            return [(r + minor, 0.0, 0.0)], [
+                ("circle", (0,), (r, 0.0, 0.0), (0.0, -1.0, 0.0), minor),
+                ("circle", (0,), (0.0, 0.0, 0.0), (0.0, 0.0, 1.0), r + minor)]
+        points = [(0.0, 0.0, r), (0.0, 0.0, -r)]
+        return points, [("circle", (1, 0), (0.0, 0.0, 0.0), (0.0, -1.0, 0.0), r)]
+
+    def to_data(self):
+        return {"kind": self.kind, "size": self.size, "placement": _placement_data(self.placement)}
+
+
+def _placement_data(placement):
+    return list(placement.Base) + list(placement.Rotation.Q)
+
+
+def _placement_from_data(data):
+    return Placement(Vector(*data[:3]), Rotation(*data[3:]))
+
+
+class _Geometry:
+    """The shared, immutable part of a shape (OCC's TShape): primitives plus topology."""
+
+    def __init__(self, primitives, points=None, edges=None):
+        self.tag = next(_tags)
+        self.primitives = primitives
+        if points is None:
+            self.points, self.edges = [], []
+            for primitive in primitives:
+                self._append(primitive.placement, *primitive.topology())
+        else:
+            self.points, self.edges = points, edges
+
+    def _append(self, placement, points, edges):
+        offset = len(self.points)
+        self.points.extend(tuple(placement.multVec(Vector(p))) for p in points)
+        for kind, vertex_ids, center, axis, radius in edges:
+            if center is not None:
+                center = tuple(placement.multVec(Vector(center)))
+                axis = tuple(placement.Rotation.multVec(Vector(axis)))
+            self.edges.append((kind, tuple(offset + i for i in vertex_ids), center, axis, radius))
+
+    def placed(self, placement):
+        """Return (primitives, points, edges) with placement applied, for combining shapes."""
+        primitives = [_Primitive(p.kind, p.size, placement.multiply(p.placement)) for p in self.primitives]
+        points = [tuple(placement.multVec(Vector(p))) for p in self.points]
+        edges = []
+        for kind, vertex_ids, center, axis, radius in self.edges:
+            if center is not None:
+                center = tuple(placement.multVec(Vector(center)))
+                axis = tuple(placement.Rotation.multVec(Vector(axis)))
+            edges.append((kind, vertex_ids, center, axis, radius))
+        return primitives, points, edges
+
+
+class Shape:
+    def __init__(self, geometry=None, placement=None):
+        self._geometry = geometry
+        self._placement = Placement(placement) if placement is not None else Placement()
+        self._cache = {}
+
+    def __repr__(self):
+        return "<Shape object>" if self._geometry else "<Shape object (null)>"
+
+    @property
+    def Placement(self):
+        return self._placement.copy()
+
+    @Placement.setter
+    def Placement(self, placement):
+        self._placement = Placement(placement)
+        self._cache.clear()
+
+    def isNull(self):
+        return self._geometry is None
+
+    def _require(self):
+        if self._geometry is None:
+            raise OCCError("Cannot use a null shape")
+        return self._geometry
+
+    def hashCode(self):
+        if self._geometry is None:
+            return 0
+        return hash((self._geometry.tag, self._placement._key())) & 0x7FFFFFFF
+
+    def isSame(self, other):
+        return (isinstance(other, Shape) and self._geometry is other._geometry
+                and self._placement == other._placement)
+
+    def copy(self):
+        """Return an independent copy; like OCC it gets a new identity and hash."""
+        geometry = self._require()
+        return Shape(_Geometry(list(geometry.primitives), list(geometry.points), list(geometry.edges)),
+                     self._placement)
+
+    def located(self, placement):
+        """Return this shape at another placement, sharing its geometry."""
+        return Shape(self._geometry, placement)
+
+    @property
+    def Vertexes(self):
+        if "vertexes" not in self._cache:
+            geometry = self._require()
+            self._cache["vertexes"] = [Vertex(self._placement.multVec(Vector(p))) for p in geometry.points]
+        return list(self._cache["vertexes"])
+
+    @property
+    def Edges(self):
+        if "edges" not in self._cache:
+            geometry = self._require()
+            points = [self._placement.multVec(Vector(p)) for p in geometry.points]
+            rotation = self._placement.Rotation
+            edges = []
+            for index, (kind, vertex_ids, center, axis, radius) in enumerate(geometry.edges):
+                ends = [points[i] for i in vertex_ids]
+                if kind == "line":
+                    curve, length = Line(ends[0], ends[1]), (ends[1] - ends[0]).Length
+                elif kind == "circle":
+                    curve = Circle(self._placement.multVec(Vector(center)),
+                                   rotation.multVec(Vector(axis)), radius)
+                    length = 2 * math.pi * radius if len(ends) == 1 else math.pi * radius
+                else:
+                    curve, length = BSplineCurve(), (ends[-1] - ends[0]).Length
+                edges.append(Edge(curve, ends, length, geometry, index))
+            self._cache["edges"] = edges
+        return list(self._cache["edges"])
+
+    @property
+    def BoundBox(self):
+        box = BoundBox()
+        if self._geometry is not None:
+            for primitive in self._geometry.primitives:
+                for corner in primitive.corners():
+                    box.add(self._placement.multVec(corner))
+        return box
+
+    def tessellate(self, deviation):
+        """Return (points, triangles) like Shape.tessellate."""
+        points, triangles = [], []
+        for primitive in self._require().primitives:
+            placement = self._placement.multiply(primitive.placement)
+            local_points, local_triangles = primitive.mesh(deviation)
+            offset = len(points)
+            points.extend(placement.multVec(Vector(p)) for p in local_points)
+            triangles.extend((a + offset, b + offset, c + offset) for a, b, c in local_triangles)
+        return points, triangles
+
+    def makeFillet(self, radius, edges):
+        """Round the given edges; each becomes a blend curve in the result."""
+        geometry = self._require()
+        box = self.BoundBox
+        limit = min(length for length in (box.XLength, box.YLength, box.ZLength) if length > 0) / 2
+        if not edges or radius <= 0 or radius >= limit:
+            raise OCCError("BRep_API: command not done")
+        filleted = set()
+        for edge in edges:
+            if edge._source is not geometry:
+                raise OCCError("Edge does not belong to the shape")
+            filleted.add(edge._index)
+        result_edges = [("other",) + edge[1:] if i in filleted else edge
+                        for i, edge in enumerate(geometry.edges)]
+        return Shape(_Geometry(list(geometry.primitives), list(geometry.points), result_edges),
+                     self._placement)
+
+    def _combine(self, other, keep_other_solid):
+        primitives, points, edges = self._require().placed(self._placement)
+        other_primitives, other_points, other_edges = other._require().placed(other._placement)
+        offset = len(points)
+        edges += [(kind, tuple(offset + i for i in ids), center, axis, radius)
+                  for kind, ids, center, axis, radius in other_edges]
+        if keep_other_solid:
+            primitives += other_primitives
+        return Shape(_Geometry(primitives, points + other_points, edges))
+
+    def fuse(self, other):
+        return self._combine(other, True)
+
+    def cut(self, other):
+        return self._combine(other, False)
+
+    def common(self, other):
+        a, b = self.BoundBox, other.BoundBox
+        lo = (max(a.XMin, b.XMin), max(a.YMin, b.YMin), max(a.ZMin, b.ZMin))
+        hi = (min(a.XMax, b.XMax), min(a.YMax, b.YMax), min(a.ZMax, b.ZMax))
+        if any(h <= l for l, h in zip(lo, hi)):
+            return Shape()
+        return makeBox(hi[0] - lo[0], hi[1] - lo[1], hi[2] - lo[2], Vector(*lo))
+
+    def distToShape(self, other):
+        """Return (distance, [(point on self, point on other)], info), measured to the bounding box."""
+        box = self.BoundBox
+        lo = (box.XMin, box.YMin, box.ZMin)
+        hi = (box.XMax, box.YMax, box.ZMax)
+        if isinstance(other, Edge):
+            start, end = other.Vertexes[0].Point, other.Vertexes[-1].Point
+        else:
+            start = end = other.BoundBox.Center
+
+        def closest(t):
+            point = start + (end - start) * t
+            on_box = Vector(*(min(max(c, l), h) for c, l, h in zip(point, lo, hi)))
+            return (point - on_box).Length, on_box, point
+
+        # The distance from a segment point to a box is convex along the segment
+        low, high = 0.0, 1.0
+        for _ in range(60):
+            m1, m2 = low + (high - low) / 3, high - (high - low) / 3
+            if closest(m1)[0] <= closest(m2)[0]:
+                high = m2
+            else:
+                low = m1
+        distance, on_self, on_other = closest((low + high) / 2)
+        if distance < 1e-9:
+            # Report the entry point, as an exact intersection would
+            t = _segment_entry(start, end, lo, hi)
+            if t is not None:
+                on_self = on_other = start + (end - start) * t
+        return distance, [(on_self, on_other)], [("Face", 0, None, "Edge", 0, None)]
+
+    def exportBrepToString(self):
+        geometry = self._require()
+        return json.dumps({
+            "primitives": [p.to_data() for p in geometry.primitives],
+            "points": geometry.points,
+            "edges": geometry.edges,
+            "placement": _placement_data(self._placement),
+        })
+
+    def importBrepFromString(self, text):
+        data = json.loads(text)
+        primitives = [_Primitive(p["kind"], p["size"], _placement_from_data(p["placement"]))
+                      for p in data["primitives"]]
+        edges = [(kind, tuple(ids), center and tuple(center), axis and tuple(axis), radius)
+                 for kind, ids, center, axis, radius in data["edges"]]
+        self._geometry = _Geometry(primitives, [tuple(p) for p in data["points"]], edges)
+        self.Placement = _placement_from_data(data["placement"])
+
+
+def _segment_entry(start, end, lo, hi):
+    """Return the segment parameter where it enters the box, or None."""
+    t_min, t_max = 0.0, 1.0
+    for s, e, l, h in zip(start, end, lo, hi):
+        d = e - s
+        if abs(d) < 1e-15:
+            if s < l or s > h:
+                return None
+            continue
+        t1, t2 = (l - s) / d, (h - s) / d
+        t_min, t_max = max(t_min, min(t1, t2)), min(t_max, max(t1, t2))
+        if t_min > t_max:
+            return None
+    return t_min
+
+
+def _primitive_shape(kind, size, point):
+    placement = Placement(Vector(point) if point is not None else Vector(), Rotation())
+    return Shape(_Geometry([_Primitive(kind, size, placement)]))
+
+
+def makeBox(length, width, height, point=None):
+    if min(length, width, height) <= 0:
+        raise OCCError("Box dimensions must be positive")
+    return _primitive_shape("box", (length, width, height), point)
+
+
+def makeCylinder(radius, height, point=None):
+    if radius <= 0 or height <= 0:
+        raise OCCError("Cylinder radius and height must be positive")
+    return _primitive_shape("cylinder", (radius, height), point)
+
+
+def makeSphere(radius, point=None):
+    if radius <= 0:
+        raise OCCError("Sphere radius must be positive")
+    return _primitive_shape("sphere", (radius,), point)
+
+
+def makeTorus(radius1, radius2, point=None):
+    if radius1 <= 0 or radius2 <= 0 or radius2 > radius1:
+        raise OCCError("Torus radii must be positive and Radius2 not above Radius1")
+    return _primitive_shape("torus", (radius1, radius2), point)
+
+
+def makeCompound(shapes):
+    shapes = [s for s in shapes if not s.isNull()]
+    if not shapes:
+        return Shape()
+    result = shapes[0]
+    for shape in shapes[1:]:
+        result = result.fuse(shape)
+    return result
+
+
+def show(shape, name="Shape"):
+    import FreeCAD
+    obj = FreeCAD.ActiveDocument.addObject("Part::Feature", name)
+    obj.Shape = shape
+    return obj
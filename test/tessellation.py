@@ -0,0 +1,196 @@
+# Contains the tessellation cache used by mesh export
+from collections import OrderedDict
+import threading
+
+import numpy as np
+
+
+def shape_revision(shape):
+    """Identify a shape's current content.
+
+    The OCC hash changes whenever the object is recomputed or moved; the bounding
+    box guards against a freed shape's hash being reused by a different one.
+    """
+    box = shape.BoundBox
+    return (shape.hashCode(), box.XMin, box.YMin, box.ZMin, box.XMax, box.YMax, box.ZMax)
+
+
+def tessellate_to_arrays(shape, deviation):
+    """Tessellate a shape and return (points, triangles) as NumPy arrays."""
+    points, facets = shape.tessellate(deviation)
+    points = np.array([tuple(p) for p in points], dtype=np.float64).reshape(-1, 3)
+    triangles = np.array(facets, dtype=np.int32).reshape(-1, 3)
+    return points, triangles
+
+
+# Quality slider value at which deviation is 0.1% of an object's bounding-box diagonal
+REFERENCE_QUALITY = 300
+REFERENCE_TOLERANCE = 0.001
+MIN_DEVIATION = 1e-4
+
+
+def relative_tolerance(quality):
+    """Map the export quality slider (1..1000) to a deviation relative to object size."""
+    return REFERENCE_TOLERANCE * REFERENCE_QUALITY / max(quality, 1)
+
+
+def object_deviation(shape, tolerance):
+    """Scale a relative tolerance by the shape's bounding-box diagonal.
+
+    The result is rounded to three significant digits so small size changes keep
+    hitting the same tessellation cache entries.
+    """
+    deviation = max(shape.BoundBox.DiagonalLength * tolerance, MIN_DEVIATION)
+    return float(f"{deviation:.3g}")
+
+
+def estimate_facets(shape, deviation):
+    """Estimate the facet count of shape.tessellate(deviation) without running it.
+
+    Facets on curved faces grow roughly as 1/deviation while planar faces stay
+    fixed, so n(d) = a + b/d is fitted from two cheap probes at 8d and 4d. The
+    probes run on a copy so they neither reuse nor clobber the shape's own mesh.
+    """
+    probe = shape.copy()
+    coarse = len(probe.tessellate(8 * deviation)[1])
+    medium = len(probe.tessellate(4 * deviation)[1])
+    return max(medium, coarse + 7 * (medium - coarse))
+
+
+def _shape_from_brep(brep):
+    import Part  # Loaded by the worker initializer
+    shape = Part.Shape()
+    shape.importBrepFromString(brep)
+    return shape
+
+
+def tessellate_brep(brep, deviation):
+    """Worker side of tessellate_many: rebuild the shape from BREP and tessellate it."""
+    return tessellate_to_arrays(_shape_from_brep(brep), deviation)
+
+
+def estimate_facets_brep(brep, deviation):
+    """Worker side of estimate_facets: rebuild the shape from BREP and probe it."""
+    return estimate_facets(_shape_from_brep(brep), deviation)
+
+
+def tessellate_many(shapes, deviation, pool=None):
+    """Tessellate several shapes, in a worker pool when one is given.
+
+    Shapes are sent to the workers as BREP strings. Results come back in the order
+    of `shapes` whatever order the workers finish in, so the output is deterministic.
+    """
+    if pool is None or len(shapes) < 2:
+        return [tessellate_to_arrays(shape, deviation) for shape in shapes]
+    breps = [shape.exportBrepToString() for shape in shapes]
+    return list(pool.map(tessellate_brep, breps, [deviation] * len(breps)))
+
+
+def merged_triangles(parts):
+    """Stack the triangle corners of several (points, triangles) parts into one (N*3, 3) array."""
+    corners = [points[triangles].reshape(-1, 3) for points, triangles in parts if len(triangles)]
+    if not corners:
+        return np.empty((0, 3), dtype=np.float64)
+    return np.concatenate(corners)
+
+
+class TessellationCache:
+    """LRU cache of per-object tessellations, bounded by the memory of the facet arrays.
+
+    Entries are keyed by object name and deviation, and are reused only while the
+    shape's revision is unchanged, so exporting again only re-tessellates objects
+    that changed since the last export.
+
+    Export jobs use the cache from a background thread while the GUI thread checks
+    it, so every access holds the cache's lock. Tessellating happens outside it.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # (name, deviation) -> (revision, points, triangles)
+        self._lock = threading.Lock()
+
+    def contains(self, name, shape, deviation):
+        """Check for a valid entry without touching the LRU order or hit counters."""
+        return self.contains_revision(name, shape_revision(shape), deviation)
+
+    def contains_revision(self, name, revision, deviation):
+        """contains() for a revision taken earlier with shape_revision()."""
+        with self._lock:
+            entry = self._entries.get((name, deviation))
+            return entry is not None and entry[0] == revision
+
+    def lookup(self, name, shape, deviation):
+        """Return cached (points, triangles) for the shape, or None on a miss."""
+        return self.lookup_revision(name, shape_revision(shape), deviation)
+
+    def lookup_revision(self, name, revision, deviation):
+        """lookup() for a revision taken earlier, e.g. on another thread, with shape_revision()."""
+        key = (name, deviation)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != revision:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def store(self, name, shape, deviation, points, triangles):
+        """Cache a tessellation, evicting least recently used entries to stay in budget."""
+        self.store_revision(name, shape_revision(shape), deviation, points, triangles)
+
+    def store_revision(self, name, revision, deviation, points, triangles):
+        """store() for a revision taken earlier with shape_revision()."""
+        key = (name, deviation)
+        size = points.nbytes + triangles.nbytes
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (revision, points, triangles)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+
+    def get(self, name, shape, deviation):
+        """Return (points, triangles) for the shape, tessellating only on a miss."""
+        cached = self.lookup(name, shape, deviation)
+        if cached is not None:
+            return cached
+        points, triangles = tessellate_to_arrays(shape, deviation)
+        self.store(name, shape, deviation, points, triangles)
+        return points, triangles
+
+    def get_many(self, items, deviation, pool=None):
+        """Return (points, triangles) for each (name, shape) in items, in the same order.
+
+        Cache misses are tessellated together, in parallel when a pool is given.
+        """
+        results = [self.lookup(name, shape, deviation) for name, shape in items]
+        missing = [i for i, result in enumerate(results) if result is None]
+        tessellated = tessellate_many([items[i][1] for i in missing], deviation, pool)
+        for i, (points, triangles) in zip(missing, tessellated):
+            name, shape = items[i]
+            self.store(name, shape, deviation, points, triangles)
+            results[i] = (points, triangles)
+        return results
+
+    def invalidate(self, name=None):
+        """Drop the entries of one object, or of every object when name is None."""
+        with self._lock:
+            for key in [k for k in self._entries if name is None or k[0] == name]:
+                self._discard(key)
+
+    def _discard(self, key):
+        """Drop one entry; the caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1].nbytes + entry[2].nbytes
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,4 +1,5 @@
 # test_commands.py
+import logging
 import time
 from PySide2.QtCore import QTimer
 from PySide2.QtWidgets import QLabel, QWidget
@@ -14,9 +15,25 @@ import socket
 import threading
 import FreeCAD
 import FreeCADGui
-from commands import CommandProcessor
+from commands import CommandProcessor, set_placement
+from picking import ScenePicker, window_to_viewport
+from motion_engine import MotionEngine
+from camera_orbit import CameraOrbitController
+from interaction_lod import InteractionLOD
+from readiness import write_ready_file
+
+logger = logging.getLogger(__name__)
 
 class HandTrackingOverlay(QWidget):
+    FINGER_COLORS = {
+        0: (255, 0, 0),    # Red for thumb
+        1: (0, 255, 0),    # Green for index
+        2: (0, 0, 255),    # Blue for middle
+        3: (255, 255, 0),  # Yellow for ring
+        4: (255, 0, 255),  # Magenta for pinky
+    }
+    LABEL_INTERVAL_MS = 16  # Finger label text is refreshed at most once per display frame
+
     def __init__(self, parent=None):
         # Get FreeCAD main window
         self.main_window = FreeCADGui.getMainWindow()
@@ -34,10 +51,16 @@ class HandTrackingOverlay(QWidget):
         # Semi-transparent background
         self.setStyleSheet("background-color: rgba(0, 0, 0, 10);")
         
-        # Timer for updates
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update)
-        self.update_timer.start(16)  # 60fps
+        # Repaints are driven by data changes; pens are built once
+        self.finger_pens = {}
+        for finger_id, rgb in self.FINGER_COLORS.items():
+            pen = QPen(QColor(*rgb))
+            pen.setWidth(3)
+            self.finger_pens[finger_id] = pen
+        self.default_finger_pen = QPen(QColor(255, 255, 255))
+        self.default_finger_pen.setWidth(3)
+        self.highlight_pen = QPen(QColor(255, 255, 0))  # Yellow
+        self.highlight_brush = QtGui.QBrush(QColor(255, 255, 0, 100))  # Semi-transparent yellow
         self.highlight_pos = None
 
         self.selected_object = None
@@ -56,6 +79,12 @@ class HandTrackingOverlay(QWidget):
             label.setGeometry(10, 10 + i*40, 300, 30)
             label.show()
             self.finger_labels[i] = label
+
+        # Label text waiting for the next display frame
+        self.pending_label_text = {}
+        self.label_timer = QTimer()
+        self.label_timer.setSingleShot(True)
+        self.label_timer.timeout.connect(self.flush_label_text)
         
         # Create label for selected object
         self.selection_label = QLabel(self)
@@ -67,52 +96,68 @@ class HandTrackingOverlay(QWidget):
         
         self.show()
 
+    @staticmethod
+    def finger_rect(x, y):
+        """Area painted for one fingertip: the 10px marker with its 3px pen and the "F<id>" text."""
+        return QtCore.QRect(int(x) - 8, int(y) - 8, 48, 24)
+
+    @staticmethod
+    def highlight_rect(x, y):
+        return QtCore.QRect(int(x) - 16, int(y) - 16, 32, 32)
+
     def highlight_selection(self, x, y):
         """Temporarily highlight the selection point"""
+        if self.highlight_pos:
+            self.update(self.highlight_rect(*self.highlight_pos))
         self.highlight_pos = (x, y)
-        self.update()
+        self.update(self.highlight_rect(x, y))
         # Clear highlight after 500ms
         self.highlight_timer.start(500)
         
     def clear_highlight(self):
         """Clear the highlight"""
+        if self.highlight_pos:
+            self.update(self.highlight_rect(*self.highlight_pos))
         self.highlight_pos = None
-        self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        region = event.region()
 
-        # Draw finger positions
-        for finger_id, pos in self.finger_positions.items():
-            colors = {
-                0: QColor(255, 0, 0),    # Red for thumb
-                1: QColor(0, 255, 0),    # Green for index
-                2: QColor(0, 0, 255),    # Blue for middle
-                3: QColor(255, 255, 0),  # Yellow for ring
-                4: QColor(255, 0, 255)   # Magenta for pinky
-            }
-            
-            pen = QPen(colors.get(finger_id, QColor(255, 255, 255)))
-            pen.setWidth(3)
-            painter.setPen(pen)
-            
-            x, y = pos
+        # Draw finger positions inside the dirty region
+        for finger_id, (x, y) in self.finger_positions.items():
+            if not region.intersects(self.finger_rect(x, y)):
+                continue
+            painter.setPen(self.finger_pens.get(finger_id, self.default_finger_pen))
             painter.drawEllipse(int(x)-5, int(y)-5, 10, 10)
             painter.drawText(int(x)+10, int(y)+10, f"F{finger_id}")
-          
-            if self.highlight_pos:
-                x, y = self.highlight_pos
-                painter.setPen(QPen(QColor(255, 255, 0)))  # Yellow
-                painter.setBrush(QColor(255, 255, 0, 100))  # Semi-transparent yellow
-                painter.drawEllipse(int(x)-15, int(y)-15, 30, 30)
+
+        if self.highlight_pos:
+            x, y = self.highlight_pos
+            painter.setPen(self.highlight_pen)
+            painter.setBrush(self.highlight_brush)
+            painter.drawEllipse(int(x)-15, int(y)-15, 30, 30)
                 
     def update_finger_position(self, finger_id, x, y):
+        old = self.finger_positions.get(finger_id)
         self.finger_positions[finger_id] = (x, y)
-        # Update label text
+        # Update label text on the next display frame
         if finger_id in self.finger_labels:
-            self.finger_labels[finger_id].setText(f"Finger {finger_id}: x={x:.1f}, y={y:.1f}")
-        self.update()
+            self.pending_label_text[finger_id] = f"Finger {finger_id}: x={x:.1f}, y={y:.1f}"
+            if not self.label_timer.isActive():
+                self.label_timer.start(self.LABEL_INTERVAL_MS)
+        # Repaint only where the marker was and where it is now; Qt merges the rectangles
+        if old is not None:
+            if (int(old[0]), int(old[1])) == (int(x), int(y)):
+                return
+            self.update(self.finger_rect(*old))
+        self.update(self.finger_rect(x, y))
+
+    def flush_label_text(self):
+        pending, self.pending_label_text = self.pending_label_text, {}
+        for finger_id, text in pending.items():
+            self.finger_labels[finger_id].setText(text)
 
     def moveEvent(self, event):
         """Keep overlay aligned with FreeCAD window"""
@@ -125,120 +170,39 @@ class HandTrackingOverlay(QWidget):
         self.selected_object = object_name
         self.selection_label.setText(f"Selected: {object_name}")
         self.selection_label.show()
-        self.update()
     
+    def show_selection(self, object_name):
+        """Show object_name as selected, or hide the label when it is None"""
+        if object_name:
+            self.set_selected_object(object_name)
+        else:
+            self.selected_object = None
+            self.selection_label.hide()
+
     def clear_selection(self):
         """Clear the selection display"""
         self.selected_object = None
         self.selection_label.hide()
-        self.highlight_pos = None
-        self.update()
-
-
-class ObjectRotator:
-    def __init__(self):
-        self.previous_yaw = 0.0
-        self.previous_pitch = 0.0
-        self.previous_roll = 0.0
-        self.smoothing_factor = 0.005    # Lower to slow down rotation
-        self.rotation_speed = 0.5
-        self.continue_rotation = False  # Flag to control rotation state
-        self.last_update_time = time.time()
-
-    def rotate_selected_object(self, target_x, target_y, target_z):
-        """Smoothly rotate the object towards the target direction."""
-        if self.continue_rotation:
-            # Calculate the difference between the current and target rotation values
-            diff_x = target_x - self.previous_yaw
-            diff_y = target_y - self.previous_pitch
-            diff_z = target_z - self.previous_roll
-
-            # Apply smoothing factor
-            smoothed_x = self.previous_yaw + diff_x * self.smoothing_factor
-            smoothed_y = self.previous_pitch + diff_y * self.smoothing_factor
-            smoothed_z = self.previous_roll + diff_z * self.smoothing_factor
-
-            # Apply rotation speed factor
-            smoothed_x *= self.rotation_speed
-            smoothed_y *= self.rotation_speed
-            smoothed_z *= self.rotation_speed
-
-            # Update previous rotation values
-            self.previous_yaw = smoothed_x
-            self.previous_pitch = smoothed_y
-            self.previous_roll = smoothed_z
-
-            # Apply the smoothed rotation to the object
-            print(f"Rotating object smoothly: yaw={smoothed_x}, pitch={smoothed_y}, roll={smoothed_z}")
-            self.apply_rotation_to_object(smoothed_x, smoothed_y, smoothed_z)
-
-    def apply_rotation_to_object(self, yaw, pitch, roll):
-        """Apply the calculated rotation to the selected object in FreeCAD."""
-        if FreeCADGui.Selection.getSelection():
-            obj = FreeCADGui.Selection.getSelection()[0]
-            try:
-                # Create a new placement or transformation matrix
-                obj.Placement = obj.Placement.multiply(
-                    FreeCAD.Placement(
-                        FreeCAD.Vector(0, 0, 0),  # No translation
-                        FreeCAD.Rotation(yaw, pitch, roll)  # Apply rotation
-                    )
-                )
-            except Exception as e:
-                print(f"Error applying rotation: {e}")
-        else:
-            print("No object selected!")
-
-    def stop_rotation(self):
-        """Stop rotating the object."""
-        self.continue_rotation = False
-        print("Rotation stopped.")
-
-    def start_rotation(self, target_x, target_y, target_z):
-        """Start continuous rotation in the pointing direction."""
-        self.continue_rotation = True
-        self.rotate_selected_object(target_x, target_y, target_z)
-        self.last_update_time = time.time()
-
-    def check_pointing_direction(self, direction_x, direction_y, direction_z):
-        """Called periodically to check if the pointing direction is the same for a certain duration."""
-        current_time = time.time()
-        # If no pointing direction is received for 0.5 seconds, stop rotation
-        if current_time - self.last_update_time > 0.5:  # Adjust duration as needed
-            self.stop_rotation()
-        else:
-            self.start_rotation(direction_x, direction_y, direction_z)
-
-    def process_pointing_direction(self, direction_x, direction_y, direction_z):
-        """Process the pointing direction and start rotation."""
-        if FreeCADGui.Selection.getSelection():
-            obj = FreeCADGui.Selection.getSelection()[0]
-        else:
-            print("No object selected!")
-            return
-
-        # Start rotation if pointing direction changes
-        self.start_rotation(direction_x, direction_y, direction_z)
-
-        # Call the update function periodically to rotate the object
-        self.update_rotation()
-
-    def update_rotation(self):
-        """Continuously rotate the object as long as pointing direction is being received."""
-        if self.continue_rotation:
-            # Perform rotation update every frame or periodically
-            self.rotate_selected_object(self.previous_yaw, self.previous_pitch, self.previous_roll)
-
-
-object_rotator = ObjectRotator()
+        self.clear_highlight()
 
 
 class ServerConnect(QtCore.QObject):
+    PORT = 12340
+    # Gesture velocities: mm/s of object motion per unit of fist displacement (the old
+    # per-message step at the client's 20 Hz send rate), and deg/s per unit of pointing
+    TRANSLATION_GAIN = 20.0
+    ROTATION_GAIN = 0.3
+    DRAG_RELEASE_TIMEOUT = 500  # ms without VECTOR messages after which a drag is committed
+
     def __init__(self, process_data_callback, doc):
         super().__init__()
         self.doc = doc
+        # Hands received data to the GUI thread, where process_server_data runs
+        self.process_data_callback = process_data_callback
         self.overlay = HandTrackingOverlay()
         self.command_processor = CommandProcessor(doc)
+        # The overlay label follows the FreeCAD selection, however it was made
+        self.command_processor.selection.add_listener(self._on_selection_changed)
         # Create a default object
         self.create_default_object()
         self.setup_server()
@@ -246,50 +210,29 @@ class ServerConnect(QtCore.QObject):
         self.last_pinch_time = 0
         self.PINCH_COOLDOWN = 0.5  # Minimum time between pinches in seconds
         
-        self.view_widget = self.find_3d_view()
+        # Ray picking against a cached BVH of the scene, used for pinch selection
+        self.picker = ScenePicker(doc)
+
+        # Integrates VECTOR and POINT_DIR velocities into one placement update per frame
+        self.motion = MotionEngine()
+        self.camera_orbit = CameraOrbitController()
+        # Other objects are drawn coarse while continuous gestures run
+        self.lod = InteractionLOD(doc)
+        # Fist drags only move the object on screen; Placement is written when the drag
+        # ends, on CONTROL_END or when VECTOR messages stop arriving
+        self.drag_timer = QTimer(self)
+        self.drag_timer.setSingleShot(True)
+        self.drag_timer.setInterval(self.DRAG_RELEASE_TIMEOUT)
+        self.drag_timer.timeout.connect(self.end_drag)
 
         self.is_rotating = False
         self.last_direction = None
 
-    def find_3d_view(self):
-        """Find the 3D view widget in FreeCAD's main window"""
-        try:
-            mw = FreeCADGui.getMainWindow()
-            # The 3D view is in the central widget of the main window
-            central = mw.centralWidget()
-            # Print information about the central widget
-            print(f"Central widget: {central.objectName()}")
-            
-            # Find all OpenGL widgets (the 3D view uses OpenGL)
-            for widget in central.findChildren(QtWidgets.QWidget):
-                if isinstance(widget, QtWidgets.QOpenGLWidget) or "view" in widget.objectName().lower():
-                    print(f"Found potential view widget: {widget.objectName()}")
-                    return widget
-                    
-            # Alternative: try to find the MDI area which contains the 3D view
-            mdi_area = mw.findChild(QtWidgets.QMdiArea)
-            if mdi_area:
-                print("Found MDI area")
-                # Get the active subwindow
-                active_window = mdi_area.activeSubWindow()
-                if active_window:
-                    print(f"Active window: {active_window.objectName()}")
-                    return active_window.widget()
-                    
-            print("Could not find 3D view widget")
-            return None
-            
-        except Exception as e:
-            print(f"Error finding 3D view: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
-        
     def move_object(self, direction):
         """Move the default cube based on direction"""
         try:
             if not hasattr(self, 'cube'):
-                print("No cube to move!")
+                logger.debug("No cube to move")
                 return
 
             # Get current position
@@ -307,30 +250,31 @@ class ServerConnect(QtCore.QObject):
             else:
                 return
 
-            # Update position
-            self.cube.Placement.Base = new_pos
-            self.doc.recompute()
+            # Update position; a rigid move only needs the cube's dependents recomputed
+            placement = self.cube.Placement
+            placement.Base = new_pos
+            if not set_placement(self.cube, placement):
+                self.doc.recompute()
             
             # Print for debugging
-            print(f"Moved {direction}: New position = ({new_pos.x}, {new_pos.y}, {new_pos.z})")
+            logger.debug("Moved %s: new position = (%s, %s, %s)", direction, new_pos.x, new_pos.y, new_pos.z)
             
         except Exception as e:
-            print(f"Error moving object: {e}")
+            logger.error("Error moving object: %s", e)
 
     def extrude_selected_object(self, direction, amount=0.5):
         """Extrude or intrude the selected object based on direction and selected face."""
         try:
             # Get selection
-            selection = FreeCADGui.Selection.getSelectionEx()
-            if not selection:
-                print("No object selected!")
+            obj, subnames = self.command_processor.selection.first_ex()
+            if obj is None:
+                logger.debug("No object selected")
                 return
 
-            obj = selection[0].Object
-            subname = selection[0].SubElementNames[0] if selection[0].SubElementNames else None
+            subname = subnames[0] if subnames else None
 
             if not subname or not subname.startswith('Face'):
-                print("Please select a face to extrude!")
+                logger.debug("Please select a face to extrude")
                 return
 
             # Get the face number (indexed from 1)
@@ -392,10 +336,10 @@ class ServerConnect(QtCore.QObject):
 
             # Update the view
             self.doc.recompute()
-            print(f"{'Extruded' if direction == 'LEFT' else 'Intruded'} {subname} by {amount} mm")
+            logger.debug("%s %s by %s mm", "Extruded" if direction == "LEFT" else "Intruded", subname, amount)
 
         except Exception as e:
-            print(f"Error during extrusion: {e}")
+            logger.error("Error during extrusion: %s", e)
     def create_default_object(self):
         """Create a default cube in the scene."""
         try:
@@ -421,19 +365,21 @@ class ServerConnect(QtCore.QObject):
             view.fitAll()
 
         except Exception as e:
-            print(f"Error creating default object: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error creating default object: %s", e)
 
     def setup_server(self):
         """Initialize server for receiving tracking data."""
         self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
-            self.server.bind(('localhost', 12340))
+            self.server.bind(('localhost', self.PORT))
             self.server.listen(1)
         except Exception as e:
-            print(f"Server setup error: {e}")
+            logger.error("Server setup error: %s", e)
+            return
+        # Connections queue in the backlog from here on, so the client can start now
+        if write_ready_file(self.PORT):
+            logger.info("Server listening on port %d, ready file written", self.PORT)
 
     def process_server_data(self, data):
 
@@ -441,16 +387,18 @@ class ServerConnect(QtCore.QObject):
         try:
             if data.startswith("PEACE:"):
                 direction = data[6:].strip()  # Get LEFT or RIGHT
-                print(f"Peace sign movement detected: {direction}")
+                logger.debug("Peace sign movement detected: %s", direction)
                 self.extrude_selected_object(direction)
             elif data.startswith("VECTOR:"):
                 # Handle vector movement
                 dx, dy = map(float, data[7:].strip().split(','))
                 self.move_object_by_vector(dx, dy)
+            elif data.startswith("CONTROL_END"):
+                self.end_drag()
             elif data.startswith("MOVE:"):
                 # Handle movement commands
                 direction = data[5:].strip()
-                print(f"Received movement command: {direction}")
+                logger.debug("Received movement command: %s", direction)
                 self.move_object(direction)
             elif data.startswith("CAMERA:"):
                 # Handle camera rotation
@@ -485,18 +433,15 @@ class ServerConnect(QtCore.QObject):
                     direction_z = float(direction_values[2])
 
                     # Print the parsed coordinates for debugging
-                    print(f"Received pointing direction: x={direction_x}, y={direction_y}, z={direction_z}")
-
                     # If the pointing direction is close to zero or neutral, stop rotation
                     if abs(direction_x) < 5.0 and abs(direction_y) < 5.0 and abs(direction_z) < 5.0:
-                        object_rotator.stop_rotation()  # Stop rotation when the pointing direction is near neutral
-                        print("Rotation stopped due to neutral pointing direction.")
+                        self.motion.stop_rotation()  # Stop rotation when the pointing direction is near neutral
                     else:
-                        # Rotate the selected object based on the pointing direction
-                        object_rotator.process_pointing_direction(direction_x, direction_y, direction_z)
+                        # Rotate the selected object at a speed set by the pointing direction
+                        self.rotate_object_by_direction(direction_x, direction_y, direction_z)
 
                 except ValueError as e:
-                    print(f"Error processing direction data: {e}")
+                    logger.warning("Error processing direction data: %s", e)
                     return
 
             else:
@@ -511,115 +456,67 @@ class ServerConnect(QtCore.QObject):
                     finger_id, x, y = map(float, parts)
                     self.overlay.update_finger_position(int(finger_id), x, y)
         except Exception as e:
-            print(f"Error processing data: {e}")
+            logger.warning("Error processing data: %s", e)
+
+    def _on_selection_changed(self, cache):
+        obj = cache.first(self.doc.Name)
+        self.overlay.show_selection(obj.Name if obj is not None else None)
 
     def clear_selection(self):
         """Clear current selection"""
         FreeCADGui.Selection.clearSelection()
         self.command_processor.selected = None
         self.overlay.clear_selection()
-        print("Selection cleared")
+        logger.info("Selection cleared")
 
     def select_object_at_point(self, screen_x, screen_y):
-        """Simulate mouse clicks for selection"""
+        """Select the object under a pinch point by ray picking"""
         try:
-            if not self.view_widget:
-                print("No 3D view widget found")
-                self.view_widget = self.find_3d_view()
-                if not self.view_widget:
-                    return
-
-            current_time = time.time()
-            if current_time - self.last_pinch_time < self.PINCH_COOLDOWN:
-                return
-
-            print(f"Simulating click at: {screen_x}, {screen_y}")
-            
-            # Create mouse press event
-            press = QtGui.QMouseEvent(
-                QtCore.QEvent.MouseButtonPress,
-                QtCore.QPoint(screen_x, screen_y),
-                QtCore.Qt.LeftButton,
-                QtCore.Qt.LeftButton,
-                QtCore.Qt.NoModifier
-            )
-            
-            # Create mouse release event
-            release = QtGui.QMouseEvent(
-                QtCore.QEvent.MouseButtonRelease,
-                QtCore.QPoint(screen_x, screen_y),
-                QtCore.Qt.LeftButton,
-                QtCore.Qt.NoButton,
-                QtCore.Qt.NoModifier
-            )
+            start = time.perf_counter()
+            view = FreeCADGui.ActiveDocument.ActiveView
+            # The pinch point is where the overlay draws it, in main window pixels
+            obj = self.picker.pick(view, *window_to_viewport(view, screen_x, screen_y))
+            elapsed_ms = (time.perf_counter() - start) * 1000
             
-            # Send events directly to the view widget
-            if self.view_widget:
-                print(f"Sending events to widget: {self.view_widget.objectName()}")
-                QtWidgets.QApplication.postEvent(self.view_widget, press)
-                QtWidgets.QApplication.postEvent(self.view_widget, release)
-                
-                # Delay for a moment
-                QtCore.QTimer.singleShot(100, lambda: self.check_selection())
+            self.overlay.highlight_selection(screen_x, screen_y)
+            if obj is None:
+                logger.info("No object at (%d, %d) (%.1f ms)", screen_x, screen_y, elapsed_ms)
+                return
             
-            self.last_pinch_time = current_time
+            FreeCADGui.Selection.clearSelection()
+            FreeCADGui.Selection.addSelection(obj)
+            self.command_processor.selected = obj
+            self.overlay.set_selected_object(obj.Name)
+            logger.info("Selected: %s (%.1f ms)", obj.Name, elapsed_ms)
             
         except Exception as e:
-            print(f"Selection error: {e}")
-            import traceback
-            traceback.print_exc()
-
-    def check_selection(self):
-        """Check what was selected after mouse events"""
-        selected = FreeCADGui.Selection.getSelection()
-        if selected:
-            self.command_processor.selected = selected[0]
-            print(f"Selected: {selected[0].Name}")
-        else:
-            print("No object selected")
+            logger.exception("Selection error: %s", e)
 
     def _rotate_camera(self, yaw, pitch, roll):
-        """Rotate camera using FreeCAD's direct view methods."""
-        try:
-            view = FreeCADGui.ActiveDocument.ActiveView
-            
-            # Scale the movements (smaller for smoother rotation)
-            scale = 0.1
-            
-            if abs(yaw) > 0.1:
-                # Use viewRotateLeft/Right for yaw
-                if yaw > 0:
-                    view.viewRotateLeft()
-                else:
-                    view.viewRotateRight()
-                    
-            if abs(pitch) > 0.1:
-                # Use viewTop/Bottom for pitch
-                current_dir = view.getViewDirection()
-                new_dir = FreeCAD.Vector(current_dir.x, current_dir.y + pitch * scale, current_dir.z)
-                view.setViewDirection(new_dir)
-                
-            view.redraw()
-            
-        except Exception as e:
-            print(f"Error rotating camera: {e}")
-            import traceback
-            traceback.print_exc()
+        """Orbit the camera at a speed set by the gesture; the orbit runs at the display rate."""
+        self.lod.engage(keep=[self.command_processor.selected])
+        self.camera_orbit.orbit(yaw, pitch, roll, dead_zone=0.1)
 
     def start_server(self):
         """Run the server loop."""
-        print("Server starting...")
+        logger.info("Server starting...")
         while True:
             try:
                 client, addr = self.server.accept()
-                print(f"Connected: {addr}")
+                logger.info("Connected: %s", addr)
+                # Messages are newline-terminated; TCP may merge or split them across recv() calls
+                buffer = ""
                 while True:
                     data = client.recv(1024).decode('utf-8')
                     if not data:
                         break
-                    self.process_server_data(data)
+                    buffer += data
+                    while '\n' in buffer:
+                        message, buffer = buffer.split('\n', 1)
+                        if message:
+                            self.process_data_callback(message)
             except Exception as e:
-                print(f"Server error: {e}")
+                logger.error("Server error: %s", e)
             finally:
                 if 'client' in locals():
                     client.close()
@@ -628,42 +525,46 @@ class ServerConnect(QtCore.QObject):
         """Start server in background thread."""
         server_thread = threading.Thread(target=self.start_server, daemon=True)
         server_thread.start()
-        print("Server thread started")
+        logger.info("Server thread started")
+
+    def _motion_target(self, use_default=True):
+        """Return the object gestures move: the command selection, the FreeCAD selection or the cube."""
+        if self.command_processor.selected:
+            return self.command_processor.selected
+        obj = self.command_processor.selection.first()
+        if obj is not None:
+            return obj
+        if use_default and hasattr(self, 'cube'):
+            return self.cube
+        return None
 
     def move_object_by_vector(self, dx, dy):
-        """Move the selected object based on movement vector"""
-        try:
-            # First check if there's an object selected through the command processor
-            if hasattr(self, 'command_processor') and self.command_processor.selected:
-                obj = self.command_processor.selected
-            # Otherwise check if there's an active selection in FreeCAD
-            elif FreeCADGui.Selection.getSelection():
-                obj = FreeCADGui.Selection.getSelection()[0]
-            else:
-                # Fall back to default cube if it exists
-                if hasattr(self, 'cube'):
-                    obj = self.cube
-                else:
-                    print("No object selected to move!")
-                    return
-
-            # Get current position
-            current_pos = obj.Placement.Base
-            
-            # Calculate new position (note: adjust mapping of x,y to FreeCAD coordinates)
-            new_pos = FreeCAD.Vector(
-                current_pos.x + dx,  # x movement
-                current_pos.y,       # y stays the same
-                current_pos.z - dy   # inverted y for up/down
-            )
-            
-            # Update position
-            obj.Placement.Base = new_pos
-            self.doc.recompute()
-            
-            print(f"Moved {obj.Name} to: ({new_pos.x:.2f}, {new_pos.y:.2f}, {new_pos.z:.2f})")
-            
-        except Exception as e:
-            print(f"Error moving object: {e}")
-            import traceback
-            traceback.print_exc()
\ No newline at end of file
+        """Move the selected object at a speed set by the fist's displacement"""
+        obj = self._motion_target()
+        if obj is None:
+            logger.debug("No object selected to move")
+            return
+        self.lod.engage(keep=[obj])
+        if not self.drag_timer.isActive():
+            self.motion.begin_preview(obj)
+        self.drag_timer.start()
+        # x follows the hand, image y (down) maps to -z
+        velocity = FreeCAD.Vector(dx, 0, -dy) * self.TRANSLATION_GAIN
+        self.motion.set_linear_velocity(obj, velocity)
+
+    def end_drag(self):
+        """Write the dragged object's Placement and recompute, once per drag."""
+        self.drag_timer.stop()
+        obj = self.motion.target
+        if self.motion.end_preview():
+            logger.info("Moved %s to %s", obj.Name, obj.Placement.Base)
+
+    def rotate_object_by_direction(self, direction_x, direction_y, direction_z):
+        """Rotate the selected object at a speed set by the pointing direction"""
+        obj = self._motion_target(use_default=False)
+        if obj is None:
+            logger.debug("No object selected")
+            return
+        self.lod.engage(keep=[obj])
+        gain = self.ROTATION_GAIN
+        self.motion.set_angular_velocity(obj, direction_x * gain, direction_y * gain, direction_z * gain)
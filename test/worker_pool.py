@@ -0,0 +1,46 @@
+# Contains the process pool used to run FreeCAD geometry work outside the GUI process
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def freecad_python():
+    """Return the Python interpreter that ships with FreeCAD.
+
+    Inside the GUI sys.executable is the FreeCAD binary itself, which cannot be used
+    to spawn console-mode workers, so fall back to the interpreter under PYTHONHOME
+    (set by setup_freecad_env).
+    """
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+    bin_dir = os.path.join(os.environ.get("PYTHONHOME", ""), "bin")
+    for name in ("python", "python3", "python.exe"):
+        candidate = os.path.join(bin_dir, name)
+        if os.path.exists(candidate):
+            return candidate
+    return sys.executable
+
+
+def _init_worker(test_dir):
+    """Load FreeCAD in console mode once per worker process."""
+    if test_dir not in sys.path:
+        sys.path.insert(0, test_dir)
+    from setup import setup_freecad_env
+    setup_freecad_env()
+    import FreeCAD  # noqa: F401
+    import Part  # noqa: F401
+
+
+def create_pool(max_workers=None):
+    """Create a pool of spawned worker processes running FreeCAD in console mode."""
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(freecad_python())
+    return ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(TEST_DIR,),
+    )